@@ -8,6 +8,7 @@ from wtfui.core.computed import Computed  # noqa: E402
 from wtfui.core.effect import Effect  # noqa: E402
 from wtfui.core.element import Element  # noqa: E402
 from wtfui.core.injection import get_provider, provide  # noqa: E402
+from wtfui.core.scheduler import batch  # noqa: E402
 from wtfui.core.signal import SessionSignal, Signal  # noqa: E402
 from wtfui.web.rpc import rpc  # noqa: E402
 
@@ -17,6 +18,7 @@ __all__ = [
     "Element",
     "SessionSignal",
     "Signal",
+    "batch",
     "component",
     "get_provider",
     "provide",
@@ -12,6 +12,7 @@ from wtfui.core.effect import Effect
 from wtfui.core.element import Element
 from wtfui.core.injection import clear_providers, get_provider, provide
 from wtfui.core.scheduler import (
+    batch,
     reset_scheduler,
     schedule_effect,
     wait_for_scheduler,
@@ -23,6 +24,7 @@ __all__ = [
     "Effect",
     "Element",
     "Signal",
+    "batch",
     "clear_providers",
     "component",
     "get_current_parent",
@@ -16,8 +16,8 @@ _evaluating_computed: ContextVar[Computed[Any] | None] = ContextVar(
 _evaluation_stack: ContextVar[set[int] | None] = ContextVar("evaluation_stack", default=None)
 
 
-def get_evaluating_computed() -> Computed[Any] | None:
-    return _evaluating_computed.get()
+# The bound ContextVar.get itself, so Signal reads skip a Python-level call.
+get_evaluating_computed: Callable[[], Computed[Any] | None] = _evaluating_computed.get
 
 
 class Computed[T]:
@@ -1,5 +1,8 @@
 from contextvars import ContextVar, Token
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wtfui.core.protocol import Runtime
 
 _current_parent: ContextVar[Any | None] = ContextVar("fuse_parent", default=None)
 
@@ -23,7 +26,7 @@ def get_current_runtime() -> Any:
     return _current_runtime.get()
 
 
-def set_current_runtime(runtime: Any) -> Token[Any]:
+def set_current_runtime(runtime: Runtime | None) -> Token[Any]:
     return _current_runtime.set(runtime)
 
 
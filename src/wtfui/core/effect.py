@@ -9,8 +9,8 @@ if TYPE_CHECKING:
 _running_effect: ContextVar[Effect | None] = ContextVar("running_effect", default=None)
 
 
-def get_running_effect() -> Effect | None:
-    return _running_effect.get()
+# The bound ContextVar.get itself, so Signal reads skip a Python-level call.
+get_running_effect: Callable[[], Effect | None] = _running_effect.get
 
 
 class Effect:
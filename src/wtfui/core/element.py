@@ -1,4 +1,5 @@
-from typing import Any
+import weakref
+from typing import Any, ClassVar
 
 from wtfui.core.context import (
     get_current_parent,
@@ -7,41 +8,250 @@ from wtfui.core.context import (
     set_current_parent,
 )
 
+# Optional attributes the render builders look for, recorded once per class in
+# Element._render_features so they only probe elements that can have them.
+HAS_CONTENT = 1
+HAS_FRAME = 2
+HAS_LABEL = 4
+HAS_VALUE = 8
+
+_RENDER_ATTRS = (
+    ("content", HAS_CONTENT),
+    ("current_frame", HAS_FRAME),
+    ("label", HAS_LABEL),
+    ("text_value", HAS_VALUE),
+)
+
+
+def _render_features(cls: type) -> int:
+    # Instances with a __dict__ can gain any attribute at runtime, so they
+    # keep every probe.
+    if cls.__dictoffset__:
+        return HAS_CONTENT | HAS_FRAME | HAS_LABEL | HAS_VALUE
+    features = 0
+    for name, flag in _RENDER_ATTRS:
+        if hasattr(cls, name):
+            features |= flag
+    return features
+
+
+class _Props(dict[str, Any]):
+    # Element props: in-place edits bump the owner's version, so VNode and
+    # render caches keyed on it never serve a stale snapshot.
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: Element, props: Any = ()) -> None:
+        super().__init__(props)
+        self._owner = owner
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._owner._bump_version()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._owner._bump_version()
+
+    def __ior__(self, other: Any) -> _Props:
+        super().update(other)
+        self._owner._bump_version()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._owner._bump_version()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        value = super().pop(key)
+        self._owner._bump_version()
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        item = super().popitem()
+        self._owner._bump_version()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._owner._bump_version()
+
+
+class _Children(list["Element"]):
+    # Element children: in-place edits bump the owner's version, like _Props.
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: Element, children: Any = ()) -> None:
+        super().__init__(children)
+        self._owner = owner
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._owner._bump_version()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._owner._bump_version()
+
+    def __iadd__(self, other: Any) -> _Children:
+        super().extend(other)
+        self._owner._bump_version()
+        return self
+
+    def __imul__(self, count: Any) -> _Children:
+        super().__imul__(count)
+        self._owner._bump_version()
+        return self
+
+    def append(self, child: Element) -> None:
+        super().append(child)
+        self._owner._bump_version()
+
+    def extend(self, children: Any) -> None:
+        super().extend(children)
+        self._owner._bump_version()
+
+    def insert(self, index: Any, child: Element) -> None:
+        super().insert(index, child)
+        self._owner._bump_version()
+
+    def remove(self, child: Element) -> None:
+        super().remove(child)
+        self._owner._bump_version()
+
+    def pop(self, index: Any = -1) -> Element:
+        child = super().pop(index)
+        self._owner._bump_version()
+        return child
+
+    def clear(self) -> None:
+        super().clear()
+        self._owner._bump_version()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._owner._bump_version()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._owner._bump_version()
+
 
 class Element:
     __slots__ = (
-        "_internal_key",
+        "_auto_key",
+        "_children",
+        "_dom_id",
+        "_key",
+        "_props",
+        "_runtime_ref",
         "_token",
-        "children",
+        "_version",
+        "_vnode",
         "focusable",
-        "key",
         "parent",
-        "props",
         "tag",
     )
 
+    _render_features: ClassVar[int] = 0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._render_features = _render_features(cls)
+
     def __init__(self, **props: Any) -> None:
         self.tag = self.__class__.__name__
-        self.children: list[Element] = []
+        self._children = _Children(self)
         self._token = None
+        # Bumped whenever this element or any descendant is invalidated, so
+        # renderers can memoize output per (element, version).
+        self._version = 0
+        # (version, VNode) of the last reconciliation snapshot.
+        self._vnode: tuple[int, Any] | None = None
+        self._dom_id: str | None = None
 
         self.focusable = props.pop("focusable", False)
-        self.key: str | None = props.pop("key", None)
+        self._key: str | None = props.pop("key", None)
 
-        self.props = props
+        self._props = _Props(self, props)
 
         self.parent: Element | None = get_current_parent()
+
+        # The runtime is looked up once per tree: children share the parent's
+        # reference, and effects re-running on the scheduler thread (outside
+        # the runtime's context) can still flag it.
+        if isinstance(self.parent, Element):
+            self._runtime_ref: weakref.ref[Any] | None = self.parent._runtime_ref
+        else:
+            runtime = get_current_runtime()
+            self._runtime_ref = weakref.ref(runtime) if runtime is not None else None
+
         if self.parent is not None:
-            self.parent.children.append(self)
-            self.parent.invalidate_layout()
+            if isinstance(self.parent, Element):
+                # Appended without a version bump: it is invalidated below, or
+                # when the parent's with-block exits.
+                list.append(self.parent._children, self)
+            else:
+                self.parent.children.append(self)
+            # A parent whose with-block is still open invalidates once when
+            # the block exits, instead of once per child appended inside it.
+            if not (isinstance(self.parent, Element) and self.parent._token is not None):
+                self.parent.invalidate_layout()
 
         # Generate stable internal key
-        self._internal_key = self._generate_internal_key()
+        self._auto_key = self._generate_internal_key()
+
+    # Every mutable piece of an element a VNode snapshot captures bumps its
+    # version when changed, so snapshots and render caches keyed on the
+    # version stay current.
+
+    @property
+    def props(self) -> dict[str, Any]:
+        return self._props
+
+    @props.setter
+    def props(self, props: dict[str, Any]) -> None:
+        self._props = _Props(self, props)
+        self._bump_version()
+
+    @property
+    def children(self) -> list[Element]:
+        return self._children
+
+    @children.setter
+    def children(self, children: list[Element]) -> None:
+        self._children = _Children(self, children)
+        self._bump_version()
+
+    @property
+    def key(self) -> str | None:
+        return self._key
+
+    @key.setter
+    def key(self, key: str | None) -> None:
+        self._key = key
+        self._bump_version()
+
+    @property
+    def _internal_key(self) -> str:
+        return self._auto_key
+
+    @_internal_key.setter
+    def _internal_key(self, key: str) -> None:
+        self._auto_key = key
+        self._bump_version()
 
     def _generate_internal_key(self) -> str:
         """Generate a stable key based on user key, parent, position, and type."""
-        if self.key is not None:
-            return self.key
+        if self._key is not None:
+            return self._key
 
         # Build key from parent key + position + element type
         if self.parent is not None:
@@ -65,22 +275,52 @@ class Element:
         if self._token is not None:
             reset_parent(self._token)
             self._token = None
+            self.invalidate_layout()
 
     def __repr__(self) -> str:
         return f"<{self.tag} children={len(self.children)} />"
 
     def set_style(self, **style_updates: Any) -> None:
-        self.props.update(style_updates)
+        # invalidate_layout bumps the version, so skip the props' own bump.
+        dict.update(self._props, style_updates)
         self.invalidate_layout()
 
     def invalidate_layout(self) -> None:
-        if self.parent is not None:
-            self.parent.invalidate_layout()
+        # Ancestor versions are bumped in one loop and the runtime is flagged
+        # once, rather than recursing and re-flagging at every level (this runs
+        # on every child append while a tree is built).
+        top = self._bump_version()
+        if top is not None:
+            top.invalidate_layout()
+
+        # Versions are bumped even when the runtime is already flagged, since
+        # render caches are keyed on them; only the redundant flag writes
+        # (shared with the render thread) are skipped. Runtimes follow the
+        # protocol.Runtime contract, so the flags are always present.
+        runtime_ref = self._runtime_ref
+        runtime = runtime_ref() if runtime_ref is not None else get_current_runtime()
+        if runtime is None or (runtime.needs_rebuild and runtime.is_dirty):
+            return
+        runtime.needs_rebuild = True
+        runtime.is_dirty = True
+
+    @property
+    def dom_id(self) -> str:
+        # Built on first use: only elements that get patched pay for the string.
+        dom_id = self._dom_id
+        if dom_id is None:
+            dom_id = self._dom_id = f"wtfui-{id(self)}"
+        return dom_id
 
-        runtime = get_current_runtime()
-        if runtime is not None and hasattr(runtime, "needs_rebuild"):
-            runtime.needs_rebuild = True
-            runtime.is_dirty = True
+    def _bump_version(self) -> Any:
+        # Returns the first non-Element ancestor, if any: roots can be parented
+        # to duck-typed containers (such as the TUI runtime's capture parent)
+        # that only implement invalidate_layout().
+        node: Any = self
+        while isinstance(node, Element):
+            node._version += 1
+            node = node.parent
+        return node
 
     def dispose(self) -> None:
         for child in self.children:
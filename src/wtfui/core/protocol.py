@@ -1,12 +1,12 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     from wtfui.core.element import Element
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderNode:
     tag: str
     element_id: int
@@ -29,3 +29,10 @@ class Renderer(ABC):
 
     @abstractmethod
     def render_text(self, content: str) -> Any: ...
+
+
+class Runtime(Protocol):
+    """Flags elements set on the runtime installed with set_current_runtime."""
+
+    needs_rebuild: bool
+    is_dirty: bool
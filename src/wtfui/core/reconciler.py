@@ -23,6 +23,8 @@ from wtfui.core.patch import (
 if TYPE_CHECKING:
     from wtfui.core.vnode import VNode
 
+_MISSING = object()
+
 
 def reconcile(old: VNode | None, new: VNode | None) -> list[Patch]:
     """Reconcile two VNode trees and produce patches.
@@ -34,6 +36,11 @@ def reconcile(old: VNode | None, new: VNode | None) -> list[Patch]:
     Returns:
         List of patches to transform old into new.
     """
+    # Identical snapshots (e.g. an unchanged subtree reused by
+    # VNode.from_element) cannot differ anywhere below
+    if old is new:
+        return []
+
     patches: list[Patch] = []
 
     # Case 1: Creating from nothing
@@ -48,59 +55,81 @@ def reconcile(old: VNode | None, new: VNode | None) -> list[Patch]:
 
     # Case 3: Both exist - compare them
     if old is not None and new is not None:
-        # Different key or tag means completely different element
-        if old.key != new.key or old.tag != new.tag:
-            patches.append(ReplacePatch(old_vnode=old, new_vnode=new))
-            return patches
+        _reconcile_node(old, new, patches)
+
+    return patches
 
-        # Same identity - diff props
-        patches.extend(_diff_props(old, new))
 
-        # Diff children
-        patches.extend(_reconcile_children(old, new))
+def _reconcile_node(old: VNode, new: VNode, patches: list[Patch]) -> None:
+    """Diff two existing nodes, appending to the caller's patch list.
 
-    return patches
+    The whole diff shares one output list rather than building and
+    extending a fresh list per node.
+    """
+    # Different key or tag means completely different element
+    if old.key != new.key or old.tag != new.tag:
+        patches.append(ReplacePatch(old_vnode=old, new_vnode=new))
+        return
 
+    # Same identity - diff props
+    if old.props is not new.props:
+        _diff_props(old, new, patches)
 
-def _diff_props(old: VNode, new: VNode) -> list[Patch]:
-    """Compare props and produce UpdatePropPatch for changes.
+    # Diff children
+    if old.children or new.children:
+        _reconcile_children(old, new, patches)
+
+
+def _diff_props(old: VNode, new: VNode, patches: list[Patch]) -> None:
+    """Compare props and append an UpdatePropPatch for each change.
 
     Args:
         old: Previous VNode.
         new: New VNode.
-
-    Returns:
-        List of UpdatePropPatch for changed properties.
+        patches: Patch list to append to.
     """
-    patches: list[Patch] = []
+    old_props = old.props
+    new_props = new.props
+    # Only a snapshot diffed against itself shares its props dict
+    if old_props is new_props:
+        return
+
+    target_key = old.key
+    shared = 0
 
     # Check for changed or new props
-    for prop_name, new_value in new.props.items():
-        old_value = old.props.get(prop_name)
+    for prop_name, new_value in new_props.items():
+        old_value = old_props.get(prop_name, _MISSING)
+        if old_value is _MISSING:
+            old_value = None
+        else:
+            shared += 1
         if old_value != new_value:
             patches.append(
                 UpdatePropPatch(
-                    target_key=old.key,
+                    target_key=target_key,
                     prop_name=prop_name,
                     value=new_value,
                 )
             )
 
+    # Every old prop was seen above (the usual case): nothing was removed
+    if shared == len(old_props):
+        return
+
     # Check for removed props
-    for prop_name in old.props:
-        if prop_name not in new.props:
+    for prop_name in old_props:
+        if prop_name not in new_props:
             patches.append(
                 UpdatePropPatch(
-                    target_key=old.key,
+                    target_key=target_key,
                     prop_name=prop_name,
                     value=None,
                 )
             )
 
-    return patches
-
 
-def _reconcile_children(old: VNode, new: VNode) -> list[Patch]:
+def _reconcile_children(old: VNode, new: VNode, patches: list[Patch]) -> None:
     """Reconcile children using React's algorithm.
 
     1. Fast path: Slot-by-slot matching (position N old vs position N new)
@@ -110,19 +139,34 @@ def _reconcile_children(old: VNode, new: VNode) -> list[Patch]:
     Args:
         old: Parent VNode with old children.
         new: Parent VNode with new children.
-
-    Returns:
-        List of patches for child operations.
+        patches: Patch list to append child operations to.
     """
-    patches: list[Patch] = []
     old_children = old.children
     new_children = new.children
-
-    # Build key -> index map for old children
-    old_key_map: dict[str, int] = {child.key: i for i, child in enumerate(old_children)}
-
-    # Track which old children have been matched
-    matched_old_indices: set[int] = set()
+    # Snapshots whose children were all unchanged share the same list
+    if old_children is new_children or (not old_children and not new_children):
+        return
+
+    # Fast path: the same keys in the same order (the usual re-render) pair up
+    # positionally, with no lookup tables and no moves, creates or deletes
+    if len(old_children) == len(new_children) and all(
+        old_child.key == new_child.key
+        for old_child, new_child in zip(old_children, new_children, strict=True)
+    ):
+        for old_child, new_child in zip(old_children, new_children, strict=True):
+            if old_child is not new_child:
+                _reconcile_node(old_child, new_child, patches)
+        return
+
+    # Key -> index map for old children; a snapshot is immutable once built,
+    # so the map is kept on it for the next diff against the same snapshot
+    old_key_map = old._children_key_index
+    if old_key_map is None:
+        old_key_map = {child.key: i for i, child in enumerate(old_children)}
+        old._children_key_index = old_key_map
+
+    # Track which old children have been matched, one byte per old child
+    matched = bytearray(len(old_children))
 
     # Phase 1: Slot-by-slot matching with key lookup
     for new_idx, new_child in enumerate(new_children):
@@ -131,9 +175,10 @@ def _reconcile_children(old: VNode, new: VNode) -> list[Patch]:
 
         if old_idx is not None:
             # Found match - reconcile the pair
-            matched_old_indices.add(old_idx)
-            child_patches = reconcile(old_children[old_idx], new_child)
-            patches.extend(child_patches)
+            matched[old_idx] = 1
+            old_child = old_children[old_idx]
+            if old_child is not new_child:
+                _reconcile_node(old_child, new_child, patches)
 
             # Check if child moved
             if old_idx != new_idx:
@@ -150,7 +195,5 @@ def _reconcile_children(old: VNode, new: VNode) -> list[Patch]:
 
     # Phase 2: Delete unmatched old children
     for old_idx, old_child in enumerate(old_children):
-        if old_idx not in matched_old_indices:
+        if not matched[old_idx]:
             patches.append(DeletePatch(target_key=old_child.key))
-
-    return patches
@@ -1,4 +1,6 @@
+import inspect
 import threading
+import weakref
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -6,28 +8,63 @@ if TYPE_CHECKING:
 
     from wtfui.core.element import Element
 
+_SHARD_COUNT = 16
+_SHARD_MASK = _SHARD_COUNT - 1
+# id() values are object addresses, which CPython aligns to 16 bytes; the low
+# bits carry no entropy, so they are shifted out before picking a shard.
+_SHARD_SHIFT = 4
+
+# Handler kind never changes for a given function, so it is classified once.
+# Keyed weakly on the underlying function (bound methods share their __func__).
+_ASYNC_HANDLERS: weakref.WeakKeyDictionary[Any, bool] = weakref.WeakKeyDictionary()
+
+
+def is_async_handler(handler: Callable[..., Any]) -> bool:
+    target = getattr(handler, "__func__", handler)
+    try:
+        return _ASYNC_HANDLERS[target]
+    except KeyError:
+        pass
+    except TypeError:  # not weak-referenceable (e.g. builtins)
+        return inspect.iscoroutinefunction(handler)
+
+    is_async = inspect.iscoroutinefunction(handler)
+    _ASYNC_HANDLERS[target] = is_async
+    return is_async
+
 
 class ElementRegistry:
+    # Writers lock only their shard; reads are lock-free since dict.get is
+    # atomic (and internally locked per dict on free-threaded builds).
     def __init__(self) -> None:
-        self._elements: dict[int, Element] = {}
-        self._lock = threading.Lock()
+        self._shards: tuple[dict[int, Element], ...] = tuple({} for _ in range(_SHARD_COUNT))
+        self._locks = tuple(threading.Lock() for _ in range(_SHARD_COUNT))
 
     def register(self, element: Element) -> None:
-        with self._lock:
-            self._elements[id(element)] = element
+        element_id = id(element)
+        index = (element_id >> _SHARD_SHIFT) & _SHARD_MASK
+        with self._locks[index]:
+            self._shards[index][element_id] = element
 
     def register_tree(self, root: Element) -> None:
-        with self._lock:
-            self._register_recursive(root)
+        batches: list[dict[int, Element]] = [{} for _ in range(_SHARD_COUNT)]
+
+        stack = [root]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            element = pop()
+            element_id = id(element)
+            batches[(element_id >> _SHARD_SHIFT) & _SHARD_MASK][element_id] = element
+            extend(element.children)
 
-    def _register_recursive(self, element: Element) -> None:
-        self._elements[id(element)] = element
-        for child in element.children:
-            self._register_recursive(child)
+        for index, batch in enumerate(batches):
+            if batch:
+                with self._locks[index]:
+                    self._shards[index].update(batch)
 
     def get(self, element_id: int) -> Element | None:
-        with self._lock:
-            return self._elements.get(element_id)
+        return self._shards[(element_id >> _SHARD_SHIFT) & _SHARD_MASK].get(element_id)
 
     def get_handler(self, element_id: int, event_type: str) -> Callable[..., Any] | None:
         element = self.get(element_id)
@@ -38,9 +75,9 @@ class ElementRegistry:
         return element.props.get(prop_name)
 
     def clear(self) -> None:
-        with self._lock:
-            self._elements.clear()
+        for lock, shard in zip(self._locks, self._shards, strict=True):
+            with lock:
+                shard.clear()
 
     def __len__(self) -> int:
-        with self._lock:
-            return len(self._elements)
+        return sum(len(shard) for shard in self._shards)
@@ -1,8 +1,12 @@
 import threading
 from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from wtfui.core.effect import Effect
 
 _scheduler_lock = threading.Lock()
@@ -14,8 +18,74 @@ _idle_event = threading.Event()
 _idle_event.set()
 
 
+class _Batch:
+    __slots__ = ("effects", "subscribers")
+
+    def __init__(self) -> None:
+        self.effects: list[Effect] = []
+        # Insertion-ordered set: a subscriber fires once per batch.
+        self.subscribers: dict[Callable[[], None], None] = {}
+
+
+_current_batch: ContextVar[_Batch | None] = ContextVar("current_batch", default=None)
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """Defer signal notifications until the outermost batch exits.
+
+    Values are stored (and computeds invalidated) immediately, so reads inside
+    the batch are current; subscribers and effects fire once on exit no matter
+    how many writes touched them. Nested batches join the enclosing one.
+    """
+    if _current_batch.get() is not None:
+        yield
+        return
+
+    pending = _Batch()
+    token = _current_batch.set(pending)
+    body_raised = False
+    try:
+        yield
+    except BaseException:
+        body_raised = True
+        raise
+    finally:
+        _current_batch.reset(token)
+        # Effects go first: they are already marked scheduled, so skipping
+        # them here would wedge them for good.
+        for effect in pending.effects:
+            schedule_effect(effect)
+        # Every subscriber runs even if an earlier one raises; the first
+        # failure is re-raised unless the body's own exception is in flight.
+        error: Exception | None = None
+        for subscriber in pending.subscribers:
+            try:
+                subscriber()
+            except Exception as exc:
+                if error is None:
+                    error = exc
+        if error is not None and not body_raised:
+            raise error
+
+
+def defer_to_batch(subscribers: list[Callable[[], None]]) -> bool:
+    pending = _current_batch.get()
+    if pending is None:
+        return False
+    pending.subscribers.update(dict.fromkeys(subscribers))
+    return True
+
+
 def schedule_effect(effect: Effect) -> None:
     global _worker_thread, _is_shutdown
+    # Effect.schedule() only gets here once until the effect runs, so batched
+    # effects are already unique.
+    pending = _current_batch.get()
+    if pending is not None:
+        pending.effects.append(effect)
+        return
+
     with _scheduler_condition:
         _is_shutdown = False
         _pending_effects.append(effect)
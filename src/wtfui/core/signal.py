@@ -2,6 +2,12 @@ import threading
 import uuid
 from typing import TYPE_CHECKING, Any
 
+# Imported once here rather than inside the value getter, the hottest path in
+# the reactive core; neither module imports this one at load time.
+from wtfui.core.computed import get_evaluating_computed
+from wtfui.core.effect import get_running_effect
+from wtfui.core.scheduler import defer_to_batch
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -21,18 +27,17 @@ class Signal[T]:
 
     @property
     def value(self) -> T:
-        from wtfui.core.computed import get_evaluating_computed
-        from wtfui.core.effect import get_running_effect
-
         effect = get_running_effect()
         computed = get_evaluating_computed()
 
-        with self._lock:
-            if effect is not None:
-                self._effects.add(effect)
-            if computed is not None:
-                self._computeds.add(computed)
-            val = self._value
+        # Lock-free: set.add and the attribute read are each atomic (per-object
+        # locks on free-threaded builds). Subscribing before reading means a
+        # concurrent write either notifies this reader or is already visible.
+        if effect is not None:
+            self._effects.add(effect)
+        if computed is not None:
+            self._computeds.add(computed)
+        val = self._value
 
         if effect is not None:
             effect._track_signal(self)
@@ -43,20 +48,30 @@ class Signal[T]:
 
     @value.setter
     def value(self, new_value: T) -> None:
+        # Unlocked pre-check for no-op writes; it may race, but the locked
+        # re-check below decides, and skipping an equal value is idempotent.
+        # Re-setting the same object skips __eq__ entirely (which for large
+        # containers walks every item).
+        current = self._value
+        if current is new_value or current == new_value:
+            return
+
         subscribers_to_notify = []
         effects_to_schedule = []
         computeds_to_invalidate = []
 
         with self._lock:
-            if self._value != new_value:
+            current = self._value
+            if current is not new_value and current != new_value:
                 self._value = new_value
 
                 subscribers_to_notify = list(self._subscribers)
                 effects_to_schedule = list(self._effects)
                 computeds_to_invalidate = list(self._computeds)
 
-        for subscriber in subscribers_to_notify:
-            subscriber()
+        if subscribers_to_notify and not defer_to_batch(subscribers_to_notify):
+            for subscriber in subscribers_to_notify:
+                subscriber()
 
         for effect in effects_to_schedule:
             effect.schedule()
@@ -64,26 +79,25 @@ class Signal[T]:
         for computed in computeds_to_invalidate:
             computed.invalidate()
 
+    # Subscription changes are single set operations, atomic on their own, so
+    # they never contend on the signal lock; it only orders value publication
+    # with the subscriber snapshot taken in the setter.
+
     def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
-        with self._lock:
-            self._subscribers.add(callback)
+        self._subscribers.add(callback)
         return lambda: self._unsubscribe(callback)
 
     def _unsubscribe(self, callback: Callable[[], None]) -> None:
-        with self._lock:
-            self._subscribers.discard(callback)
+        self._subscribers.discard(callback)
 
     def _remove_effect(self, effect: Effect) -> None:
-        with self._lock:
-            self._effects.discard(effect)
+        self._effects.discard(effect)
 
     def _remove_computed(self, computed: Computed[Any]) -> None:
-        with self._lock:
-            self._computeds.discard(computed)
+        self._computeds.discard(computed)
 
     def __repr__(self) -> str:
-        with self._lock:
-            return f"Signal({self._value!r})"
+        return f"Signal({self._value!r})"
 
 
 class SessionSignal[T]:
@@ -120,24 +134,23 @@ class SessionSignal[T]:
 
     @property
     def value(self) -> T:
-        from wtfui.core.computed import get_evaluating_computed
-        from wtfui.core.effect import get_running_effect
-
         effect = get_running_effect()
         computed = get_evaluating_computed()
 
-        with self._lock:
-            if effect is not None:
-                self._effects.add(effect)
-            if computed is not None:
-                self._computeds.add(computed)
+        # Lock-free, as in Signal.value: the set adds and the session lookup
+        # are each atomic, and subscribing first means a concurrent write
+        # either notifies this reader or is already visible to it.
+        if effect is not None:
+            self._effects.add(effect)
+        if computed is not None:
+            self._computeds.add(computed)
 
-            # Get value from session, or use default
-            session = self._get_session()
-            if session is not None:
-                val = session.signal_values.get(self._name, self._default)
-            else:
-                val = self._default
+        # Get value from session, or use default
+        session = self._get_session()
+        if session is not None:
+            val = session.signal_values.get(self._name, self._default)
+        else:
+            val = self._default
 
         if effect is not None:
             effect._track_signal(self)
@@ -167,8 +180,9 @@ class SessionSignal[T]:
                 effects_to_schedule = list(self._effects)
                 computeds_to_invalidate = list(self._computeds)
 
-        for subscriber in subscribers_to_notify:
-            subscriber()
+        if subscribers_to_notify and not defer_to_batch(subscribers_to_notify):
+            for subscriber in subscribers_to_notify:
+                subscriber()
 
         for effect in effects_to_schedule:
             effect.schedule()
@@ -194,10 +208,11 @@ class SessionSignal[T]:
             self._computeds.discard(computed)
 
     def __repr__(self) -> str:
-        with self._lock:
-            session = self._get_session()
-            if session is not None:
-                val = session.signal_values.get(self._name, self._default)
-            else:
-                val = self._default
-            return f"SessionSignal({val!r}, name={self._name!r})"
+        # Debug-only read: a single dict lookup, so it takes no lock and stays
+        # safe to call from a subscriber while the signal is being written.
+        session = self._get_session()
+        if session is not None:
+            val = session.signal_values.get(self._name, self._default)
+        else:
+            val = self._default
+        return f"SessionSignal({val!r}, name={self._name!r})"
@@ -1,8 +1,15 @@
 from dataclasses import dataclass
 
 
+class _CSSMemo:
+    # CSS declarations memoized by the HTML renderer on first use. The slot
+    # lives outside the dataclass so fields(), asdict() and the RPC encoder
+    # never see it; Style is frozen, so it never goes stale for an instance.
+    __slots__ = ("_css_cache",)
+
+
 @dataclass(frozen=True, slots=True)
-class Style:
+class Style(_CSSMemo):
     color: str | None = None
     bg: str | None = None
 
@@ -59,16 +66,18 @@ class Style:
         from dataclasses import fields, replace
 
         merged_kwargs: dict[str, object] = {}
-        for field in fields(self):
-            if field.name == "hover":
+        for style_field in fields(self):
+            if style_field.name == "hover":
                 merged_kwargs["hover"] = other.hover if other.hover is not None else self.hover
             else:
-                self_val = getattr(self, field.name)
-                other_val = getattr(other, field.name)
+                self_val = getattr(self, style_field.name)
+                other_val = getattr(other, style_field.name)
 
                 if isinstance(other_val, bool):
-                    merged_kwargs[field.name] = other_val if other_val else self_val
+                    merged_kwargs[style_field.name] = other_val if other_val else self_val
                 else:
-                    merged_kwargs[field.name] = other_val if other_val is not None else self_val
+                    merged_kwargs[style_field.name] = (
+                        other_val if other_val is not None else self_val
+                    )
 
         return replace(self, **merged_kwargs)
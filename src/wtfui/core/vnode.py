@@ -20,6 +20,9 @@ class VNode:
     props: dict[str, Any]
     children: list[VNode] = field(default_factory=list)
     element: Element | None = None
+    # Child key -> position, built lazily the first time this snapshot is
+    # diffed as the old side of a keyed child reconcile.
+    _children_key_index: dict[str, int] | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_element(cls, element: Element) -> VNode:
@@ -29,25 +32,65 @@ class VNode:
             element: Root element to snapshot.
 
         Returns:
-            VNode tree mirroring the element structure.
+            VNode tree mirroring the element structure. An element whose
+            version is unchanged since its last snapshot returns that same
+            VNode, so reconcile() can skip the subtree by identity.
         """
-        # Use explicit key or fall back to internal key
-        key = element.key if element.key is not None else element._internal_key
-
-        # Copy props, excluding internal attributes
-        props = dict(element.props)
-
-        # For Text elements, capture content
-        if hasattr(element, "content"):
-            props["content"] = element.content
-
-        # Recursively build children
-        children = [cls.from_element(child) for child in element.children]
-
-        return cls(
-            key=key,
-            tag=element.tag,
-            props=props,
-            children=children,
-            element=element,
-        )
+        # Iterative walk with the per-node snapshot inlined: Python-level
+        # recursion paid a call per element, which dominated for small leaves.
+        # Each stack entry pairs a children list with the elements whose
+        # snapshots belong in it, in order.
+        roots: list[VNode] = []
+        stack: list[tuple[list[VNode], list[Element]]] = [(roots, [element])]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            snapshots, elements = pop()
+            append = snapshots.append
+            for child in elements:
+                cached = child._vnode
+                if cached is not None and cached[0] == child._version and type(cached[1]) is cls:
+                    append(cached[1])
+                    continue
+
+                # Use explicit key or fall back to internal key
+                key = child.key if child.key is not None else child._internal_key
+
+                # Props are copied: Element.props is public and may be edited
+                # in place, which must not rewrite an earlier snapshot.
+                # For Text elements, capture content
+                if hasattr(child, "content"):
+                    props = {**child.props, "content": child.content}
+                else:
+                    props = dict(child.props)
+
+                # When only the element itself changed, its previous snapshot's
+                # children list is reused, so reconcile() skips it by identity
+                children: list[VNode] = []
+                element_children = child.children
+                if element_children:
+                    if (
+                        cached is not None
+                        and type(cached[1]) is cls
+                        and _same_snapshots(element_children, cached[1].children)
+                    ):
+                        children = cached[1].children
+                    else:
+                        push((children, element_children))
+
+                vnode = cls(key, child.tag, props, children, child)
+                child._vnode = (child._version, vnode)
+                append(vnode)
+
+        return roots[0]
+
+
+def _same_snapshots(elements: list[Element], snapshots: list[VNode]) -> bool:
+    # True when every element's current snapshot is the one already in the list.
+    if len(elements) != len(snapshots):
+        return False
+    for element, snapshot in zip(elements, snapshots, strict=True):
+        cached = element._vnode
+        if cached is None or cached[1] is not snapshot or cached[0] != element._version:
+            return False
+    return True
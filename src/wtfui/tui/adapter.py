@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+from wtfui.core.signal import Signal
+from wtfui.core.style import Style
 from wtfui.tui.layout.node import LayoutNode
 from wtfui.tui.layout.reactive import ReactiveLayoutNode
 from wtfui.tui.layout.style import (
@@ -39,8 +41,6 @@ class LayoutAdapter:
         return self._extract_flex_style(element)
 
     def _extract_flex_style(self, element: Element) -> FlexStyle:
-        from wtfui.core.style import Style
-
         props = element.props
 
         style_obj: Style | None = None
@@ -160,8 +160,6 @@ class LayoutAdapter:
 
 class ReactiveLayoutAdapter:
     def to_reactive_layout_node(self, element: Element) -> ReactiveLayoutNode:
-        from wtfui.core.signal import Signal
-
         layout_prop_names = {
             "width",
             "height",
@@ -1,17 +1,23 @@
 from typing import TYPE_CHECKING
 
+from wtfui.core.element import HAS_CONTENT, HAS_FRAME, HAS_LABEL, HAS_VALUE
+from wtfui.core.protocol import RenderNode
+from wtfui.core.style import Style
+from wtfui.tui.layout.style_resolver import resolve_style_conflict
+
 if TYPE_CHECKING:
     from wtfui.core.element import Element
-    from wtfui.core.protocol import RenderNode
     from wtfui.tui.layout.node import LayoutNode
 
+# Optional element attributes are read with a single getattr each rather
+# than a hasattr probe followed by a second lookup (content and text_value
+# are properties, so the probe used to evaluate them twice), and only on
+# element classes whose _render_features say they can have them.
+_MISSING = object()
+
 
 class RenderTreeBuilder:
     def build(self, element: Element) -> RenderNode:
-        from wtfui.core.protocol import RenderNode
-        from wtfui.core.style import Style
-        from wtfui.tui.layout.style_resolver import resolve_style_conflict
-
         props = dict(element.props)
 
         if "class_" in props:
@@ -34,38 +40,45 @@ class RenderTreeBuilder:
                 "_wtfui_style": typed_style,
             }
 
-        # Get stable key for reconciliation
-        element_key = getattr(element, "_internal_key", None)
-
         node = RenderNode(
             tag=element.tag,
             element_id=id(element),
             props=props,
-            element_key=element_key,
+            # Stable key for reconciliation; every Element sets it in __init__
+            element_key=element._internal_key,
         )
 
-        if hasattr(element, "content") and element.content:
-            node.text_content = str(element.content)
-
-        if hasattr(element, "current_frame"):
-            node.text_content = str(element.current_frame)
-
-        if hasattr(element, "label") and element.label:
-            node.label = str(element.label)
-
-        # Extract text_value for Input elements to render as value attribute
-        # This handles both bound (bind=Signal) and unbound (on_change only) inputs
-        if hasattr(element, "text_value"):
-            node.props["value"] = element.text_value
-
-        node.children = [self.build(child) for child in element.children]
+        features = element._render_features
+        if features:
+            if features & HAS_CONTENT:
+                content = getattr(element, "content", None)
+                if content:
+                    node.text_content = str(content)
+
+            if features & HAS_FRAME:
+                current_frame = getattr(element, "current_frame", _MISSING)
+                if current_frame is not _MISSING:
+                    node.text_content = str(current_frame)
+
+            if features & HAS_LABEL:
+                label = getattr(element, "label", None)
+                if label:
+                    node.label = str(label)
+
+            # Extract text_value for Input elements to render as value attribute
+            # This handles both bound (bind=Signal) and unbound (on_change only) inputs
+            if features & HAS_VALUE:
+                text_value = getattr(element, "text_value", _MISSING)
+                if text_value is not _MISSING:
+                    node.props["value"] = text_value
+
+        children = element.children
+        if children:
+            node.children = [self.build(child) for child in children]
 
         return node
 
     def build_with_layout(self, element: Element, layout_node: LayoutNode) -> RenderNode:
-        from wtfui.core.protocol import RenderNode
-        from wtfui.core.style import Style
-
         layout = layout_node.layout
 
         props = dict(element.props)
@@ -80,27 +93,33 @@ class RenderTreeBuilder:
                 if k not in ("position", "top", "left", "width", "height")
             }
 
-        # Get stable key for reconciliation
-        element_key = getattr(element, "_internal_key", None)
-
         node = RenderNode(
             tag=element.tag,
             element_id=id(element),
             props=props,
             layout=layout,
-            element_key=element_key,
+            # Stable key for reconciliation; every Element sets it in __init__
+            element_key=element._internal_key,
         )
 
-        if hasattr(element, "content") and element.content:
-            node.text_content = str(element.content)
-
-        if hasattr(element, "label") and element.label:
-            node.label = str(element.label)
-
-        # Extract text_value for Input elements to render as value attribute
-        # This handles both bound (bind=Signal) and unbound (on_change only) inputs
-        if hasattr(element, "text_value"):
-            node.props["value"] = element.text_value
+        features = element._render_features
+        if features:
+            if features & HAS_CONTENT:
+                content = getattr(element, "content", None)
+                if content:
+                    node.text_content = str(content)
+
+            if features & HAS_LABEL:
+                label = getattr(element, "label", None)
+                if label:
+                    node.label = str(label)
+
+            # Extract text_value for Input elements to render as value attribute
+            # This handles both bound (bind=Signal) and unbound (on_change only) inputs
+            if features & HAS_VALUE:
+                text_value = getattr(element, "text_value", _MISSING)
+                if text_value is not _MISSING:
+                    node.props["value"] = text_value
 
         for i, child in enumerate(element.children):
             if i < len(layout_node.children):
@@ -76,6 +76,24 @@ GEOMETRY_CLASS_PATTERNS: dict[str, list[str]] = {
 }
 
 
+# Bound on memoized strip results; the cache is dropped when full. Apps reuse
+# a small set of class strings, so the same inputs recur on every render.
+_STRIP_CACHE_SIZE = 4096
+_strip_cache: dict[tuple[str, tuple[bool, ...]], str] = {}
+
+# Flag order for cache keys and the pattern groups each flag strips.
+_GEOMETRY_GROUPS = (
+    "width",
+    "height",
+    "flex_direction",
+    "flex_wrap",
+    "justify",
+    "align",
+    "gap",
+    "flex_grow",
+)
+
+
 def strip_geometry_classes(
     cls: str,
     *,
@@ -91,32 +109,38 @@ def strip_geometry_classes(
     if not cls:
         return cls
 
-    classes = cls.split()
-    patterns_to_strip: list[str] = []
+    flags = (
+        has_width,
+        has_height,
+        has_flex_direction,
+        has_flex_wrap,
+        has_justify,
+        has_align,
+        has_gap,
+        has_flex_grow,
+    )
+    key = (cls, flags)
+    result = _strip_cache.get(key)
+    if result is None:
+        result = _strip(cls, flags)
+        if len(_strip_cache) >= _STRIP_CACHE_SIZE:
+            _strip_cache.clear()
+        _strip_cache[key] = result
+    return result
+
 
-    if has_width:
-        patterns_to_strip.extend(GEOMETRY_CLASS_PATTERNS["width"])
-    if has_height:
-        patterns_to_strip.extend(GEOMETRY_CLASS_PATTERNS["height"])
-    if has_flex_direction:
-        patterns_to_strip.extend(GEOMETRY_CLASS_PATTERNS["flex_direction"])
-    if has_flex_wrap:
-        patterns_to_strip.extend(GEOMETRY_CLASS_PATTERNS["flex_wrap"])
-    if has_justify:
-        patterns_to_strip.extend(GEOMETRY_CLASS_PATTERNS["justify"])
-    if has_align:
-        patterns_to_strip.extend(GEOMETRY_CLASS_PATTERNS["align"])
-    if has_gap:
-        patterns_to_strip.extend(GEOMETRY_CLASS_PATTERNS["gap"])
-    if has_flex_grow:
-        patterns_to_strip.extend(GEOMETRY_CLASS_PATTERNS["flex_grow"])
+def _strip(cls: str, flags: tuple[bool, ...]) -> str:
+    patterns_to_strip: list[str] = []
+    for group, enabled in zip(_GEOMETRY_GROUPS, flags, strict=True):
+        if enabled:
+            patterns_to_strip.extend(GEOMETRY_CLASS_PATTERNS[group])
 
     if not patterns_to_strip:
         return cls
 
     combined_pattern = re.compile(r"^(" + "|".join(patterns_to_strip) + r")$")
 
-    filtered = [c for c in classes if not combined_pattern.match(c)]
+    filtered = [c for c in cls.split() if not combined_pattern.match(c)]
     return " ".join(filtered)
 
 
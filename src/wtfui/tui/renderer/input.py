@@ -9,7 +9,7 @@ ENTER = "\r"
 BACKSPACE = "\x7f"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KeyEvent:
     key: str
     ctrl: bool = False
@@ -83,6 +83,13 @@ def parse_input_sequence(seq: str) -> KeyEvent | MouseEvent:
 
 
 def parse_key_sequence(seq: str) -> KeyEvent:
+    event = _KEY_CACHE.get(seq)
+    if event is not None:
+        return event
+    return _build_key_event(seq)
+
+
+def _build_key_event(seq: str) -> KeyEvent:
     if not seq:
         return KeyEvent(key="")
 
@@ -113,6 +120,23 @@ def parse_key_sequence(seq: str) -> KeyEvent:
     return KeyEvent(key=seq)
 
 
+# Shared immutable instances for every sequence we know up front: escape
+# sequences, control keys and printable ASCII cover nearly all keystrokes.
+_KEY_CACHE: dict[str, KeyEvent] = {
+    seq: _build_key_event(seq)
+    for seq in (
+        "",
+        ESCAPE,
+        "\n",
+        "\x08",
+        BACKSPACE,
+        *ESCAPE_SEQUENCES,
+        *(chr(code) for code in range(1, 27)),
+        *(chr(code) for code in range(32, 127)),
+    )
+}
+
+
 async def read_key_async() -> str:
     import asyncio
     import sys
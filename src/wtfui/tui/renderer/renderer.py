@@ -46,18 +46,20 @@ class ConsoleRenderer(Renderer):
         return self.flush()
 
     def render_node(self, node: RenderNode, x: int = 0, y: int = 0) -> Any:
-        cls = node.props.get("cls", "")
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            cls = current.props.get("cls", "")
 
-        if node.text_content:
-            self.render_text_at(x, y, node.text_content, cls=cls)
-            return None
+            if current.text_content:
+                self.render_text_at(x, y, current.text_content, cls=cls)
+                continue
 
-        if node.label:
-            self.render_text_at(x, y, node.label, cls=cls)
-            return None
+            if current.label:
+                self.render_text_at(x, y, current.label, cls=cls)
+                continue
 
-        for child in node.children:
-            self.render_node(child, x, y)
+            stack.extend(reversed(current.children))
 
         return None
 
@@ -67,48 +69,62 @@ class ConsoleRenderer(Renderer):
         parent_x: int = 0,
         parent_y: int = 0,
     ) -> None:
-        if node.layout is not None:
-            left = int(node.layout.x)
-            top = int(node.layout.y)
-            width = int(node.layout.width)
-            height = max(1, int(node.layout.height))
-        else:
-            style_dict = node.props.get("style", {})
-            left = parse_css_dimension(style_dict.get("left", 0))
-            top = parse_css_dimension(style_dict.get("top", 0))
-            width = parse_css_dimension(style_dict.get("width", 0))
-            height = parse_css_dimension(style_dict.get("height", 1))
-
-        style_dict = node.props.get("style") or {}
-
-        abs_x = parent_x + left
-        abs_y = parent_y + top
-
-        fuse_style: Style | None = style_dict.get("_wtfui_style") if style_dict else None
-
-        if fuse_style and fuse_style.hover:
-            is_hovered = (
-                self.mouse_x >= abs_x
-                and self.mouse_x < abs_x + (width or 1)
-                and self.mouse_y >= abs_y
-                and self.mouse_y < abs_y + (height or 1)
-            )
-            if is_hovered:
-                fuse_style = fuse_style | fuse_style.hover
-
-        cls = node.props.get("cls", "")
-
-        if node.text_content:
-            self._render_text_with_style(
-                abs_x, abs_y, node.text_content, cls=cls, fuse_style=fuse_style, max_width=width
-            )
-        elif node.label:
-            self._render_text_with_style(
-                abs_x, abs_y, node.label, cls=cls, fuse_style=fuse_style, max_width=width
-            )
-
-        for child in node.children:
-            self.render_node_with_layout(child, abs_x, abs_y)
+        # Explicit stack instead of recursion; children are pushed reversed so
+        # they are still painted in document order (later siblings on top).
+        stack: list[tuple[RenderNode, int, int]] = [(node, parent_x, parent_y)]
+        while stack:
+            current, px, py = stack.pop()
+            layout = current.layout
+            props = current.props
+
+            if layout is not None:
+                left = int(layout.x)
+                top = int(layout.y)
+                width = int(layout.width)
+                height = max(1, int(layout.height))
+            else:
+                style_dict = props.get("style", {})
+                left = parse_css_dimension(style_dict.get("left", 0))
+                top = parse_css_dimension(style_dict.get("top", 0))
+                width = parse_css_dimension(style_dict.get("width", 0))
+                height = parse_css_dimension(style_dict.get("height", 1))
+
+            style_dict = props.get("style") or {}
+
+            abs_x = px + left
+            abs_y = py + top
+
+            fuse_style: Style | None = style_dict.get("_wtfui_style") if style_dict else None
+
+            if fuse_style and fuse_style.hover:
+                is_hovered = (
+                    self.mouse_x >= abs_x
+                    and self.mouse_x < abs_x + (width or 1)
+                    and self.mouse_y >= abs_y
+                    and self.mouse_y < abs_y + (height or 1)
+                )
+                if is_hovered:
+                    fuse_style = fuse_style | fuse_style.hover
+
+            cls = props.get("cls", "")
+
+            if current.text_content:
+                self._render_text_with_style(
+                    abs_x,
+                    abs_y,
+                    current.text_content,
+                    cls=cls,
+                    fuse_style=fuse_style,
+                    max_width=width,
+                )
+            elif current.label:
+                self._render_text_with_style(
+                    abs_x, abs_y, current.label, cls=cls, fuse_style=fuse_style, max_width=width
+                )
+
+            children = current.children
+            if children:
+                stack.extend((child, abs_x, abs_y) for child in reversed(children))
 
     def _render_text_with_style(
         self,
@@ -127,16 +143,13 @@ class ConsoleRenderer(Renderer):
         if max_width > 0:
             text = text[:max_width]
 
-        for i, char in enumerate(text):
-            cell = Cell(char=char, fg=fg, bg=bg)
-
-            if cls:
-                apply_cls_to_cell(cell, cls)
+        template = Cell(fg=fg, bg=bg)
+        if cls:
+            apply_cls_to_cell(template, cls)
+        if fuse_style:
+            apply_style_to_cell(template, fuse_style)
 
-            if fuse_style:
-                apply_style_to_cell(cell, fuse_style)
-
-            self.back_buffer.set(x + i, y, cell)
+        self._write_cells(x, y, text, template)
 
     def render_text(self, content: str) -> Any:
         return content
@@ -150,11 +163,25 @@ class ConsoleRenderer(Renderer):
         fg: tuple[int, int, int] | None = None,
         bg: tuple[int, int, int] | None = None,
     ) -> None:
+        template = Cell(fg=fg, bg=bg)
+        if cls:
+            apply_cls_to_cell(template, cls)
+
+        self._write_cells(x, y, text, template)
+
+    def _write_cells(self, x: int, y: int, text: str, template: Cell) -> None:
+        # Styles are resolved once into the template; each character only
+        # needs a fresh Cell since buffers mutate cells in place on clear().
+        fg = template.fg
+        bg = template.bg
+        bold = template.bold
+        dim = template.dim
+        italic = template.italic
+        underline = template.underline
+        buffer_set = self.back_buffer.set
+
         for i, char in enumerate(text):
-            cell = Cell(char=char, fg=fg, bg=bg)
-            if cls:
-                apply_cls_to_cell(cell, cls)
-            self.back_buffer.set(x + i, y, cell)
+            buffer_set(x + i, y, Cell(char, fg, bg, bold, dim, italic, underline))
 
     def flush(self, inline: bool = False) -> str:
         self._cached_frame = None
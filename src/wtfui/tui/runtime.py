@@ -13,11 +13,16 @@ if TYPE_CHECKING:
     from wtfui.tui.layout.reactive import ReactiveLayoutNode
     from wtfui.tui.renderer.input import KeyEvent, MouseEvent, ResizeEvent
 
-from wtfui.core.registry import ElementRegistry
+from wtfui.core.registry import ElementRegistry, is_async_handler
+from wtfui.core.scheduler import batch
 from wtfui.tui.adapter import ReactiveLayoutAdapter
 
 
 class TUIRuntime:
+    # protocol.Runtime flags, set by elements from any thread
+    needs_rebuild: bool = False
+    is_dirty: bool = True
+
     def __init__(
         self,
         app_factory: Callable[[], Any],
@@ -189,10 +194,11 @@ class TUIRuntime:
 
                             handler = self._registry.get_handler(id(element), "click")
                             if handler is not None:
-                                if inspect.iscoroutinefunction(handler):
-                                    await handler()
-                                else:
-                                    handler()
+                                with batch():
+                                    if is_async_handler(handler):
+                                        await handler()
+                                    else:
+                                        handler()
                                 self.is_dirty = True
 
             case KeyEvent(key=key, ctrl=ctrl):
@@ -201,10 +207,11 @@ class TUIRuntime:
                     if element is not None:
                         handler = element.props.get("on_keydown")
                         if handler is not None:
-                            if inspect.iscoroutinefunction(handler):
-                                await handler(key)
-                            else:
-                                handler(key)
+                            with batch():
+                                if is_async_handler(handler):
+                                    await handler(key)
+                                else:
+                                    handler(key)
                             self.is_dirty = True
 
                 if self.on_key is not None:
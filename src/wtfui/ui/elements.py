@@ -1,7 +1,6 @@
-import weakref
 from typing import TYPE_CHECKING, Any
 
-from wtfui.core.context import get_current_runtime
+from wtfui.core.effect import Effect
 from wtfui.core.element import Element
 
 if TYPE_CHECKING:
@@ -32,28 +31,50 @@ class HStack(Element):
 
 
 class Card(Element):
-    __slots__ = ("title",)
+    __slots__ = ("_title",)
 
     def __init__(self, title: str | None = None, **props: Any) -> None:
         super().__init__(**props)
-        self.title = title
+        self._title = title
+
+    # Attributes a renderer may read bump the version when reassigned, so
+    # render and snapshot caches keyed on it never serve stale output.
+
+    @property
+    def title(self) -> str | None:
+        return self._title
+
+    @title.setter
+    def title(self, title: str | None) -> None:
+        self._title = title
+        self._bump_version()
+
+
+class _ContentEffect(Effect):
+    # Re-reads a Text's reactive content. The version is bumped as soon as a
+    # source is written, while the effect itself re-runs later on the
+    # scheduler thread, so snapshots taken in between read the new content.
+    __slots__ = ("_text",)
+
+    def __init__(self, text: Text) -> None:
+        self._text = text
+        super().__init__(text._on_content_change)
+
+    def schedule(self) -> None:
+        self._text._bump_version()
+        super().schedule()
 
 
 class Text(Element):
-    __slots__ = ("_content_source", "_effect", "_runtime_ref")
+    __slots__ = ("_content_source", "_effect")
 
     def __init__(self, content: str | Signal[Any] | Computed[Any] = "", **props: Any) -> None:
         super().__init__(**props)
         self._content_source = content
         self._effect = None
 
-        runtime = get_current_runtime()
-        self._runtime_ref = weakref.ref(runtime) if runtime is not None else None
-
         if hasattr(content, "value") or callable(content):
-            from wtfui.core.effect import Effect
-
-            self._effect = Effect(self._on_content_change)
+            self._effect = _ContentEffect(self)
 
     @property
     def content(self) -> str:
@@ -66,14 +87,10 @@ class Text(Element):
 
     def _on_content_change(self) -> None:
         _ = self.content
+        # Flags the runtime captured when the element was built, since this
+        # re-runs on the scheduler thread outside the runtime's context.
         self.invalidate_layout()
 
-        if self._runtime_ref is not None:
-            runtime = self._runtime_ref()
-            if runtime is not None:
-                runtime.is_dirty = True
-                runtime.needs_rebuild = True
-
     def dispose(self) -> None:
         if self._effect:
             self._effect.dispose()
@@ -85,7 +102,7 @@ class Text(Element):
 
 
 class Button(Element):
-    __slots__ = ("label",)
+    __slots__ = ("_label",)
 
     def __init__(
         self,
@@ -95,11 +112,20 @@ class Button(Element):
         **props: Any,
     ) -> None:
         super().__init__(on_click=on_click, disabled=disabled, **props)
-        self.label = label
+        self._label = label
+
+    @property
+    def label(self) -> str:
+        return self._label
+
+    @label.setter
+    def label(self, label: str) -> None:
+        self._label = label
+        self._bump_version()
 
 
 class Input(Element):
-    __slots__ = ("_text_value", "bind", "cursor_pos")
+    __slots__ = ("_bind", "_text", "cursor_pos")
 
     def __init__(
         self,
@@ -116,10 +142,10 @@ class Input(Element):
         # Wrap on_input to update text_value first, then call user's handler
         props["on_input"] = self._make_input_handler(on_input)
         super().__init__(placeholder=placeholder, on_change=on_change, on_enter=on_enter, **props)
-        self.bind = bind
+        self._bind = bind
 
-        self._text_value = bind.value if bind is not None else ""
-        self.cursor_pos = len(self._text_value)
+        self._text = bind.value if bind is not None else ""
+        self.cursor_pos = len(self._text)
 
     def _make_input_handler(
         self, user_handler: Callable[[str], Any] | None
@@ -133,11 +159,30 @@ class Input(Element):
 
         return handler
 
+    @property
+    def bind(self) -> Signal[str] | None:
+        return self._bind
+
+    @bind.setter
+    def bind(self, bind: Signal[str] | None) -> None:
+        self._bind = bind
+        self._bump_version()
+
+    @property
+    def _text_value(self) -> str:
+        return self._text
+
+    @_text_value.setter
+    def _text_value(self, value: str) -> None:
+        # Also written directly by the server for unbound inputs.
+        self._text = value
+        self._bump_version()
+
     @property
     def text_value(self) -> str:
-        if self.bind is not None:
-            return self.bind.value
-        return self._text_value
+        if self._bind is not None:
+            return self._bind.value
+        return self._text
 
     @text_value.setter
     def text_value(self, value: str) -> None:
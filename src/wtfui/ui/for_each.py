@@ -1,8 +1,6 @@
 import threading
-import weakref
 from typing import TYPE_CHECKING, Any
 
-from wtfui.core.context import get_current_runtime
 from wtfui.core.effect import Effect
 from wtfui.core.element import Element
 from wtfui.ui.elements import Div
@@ -21,7 +19,6 @@ class For[T](Element):
         "_initial_sync_done",
         "_items",
         "_lock",
-        "_runtime_ref",
         "each",
         "key",
         "render",
@@ -50,9 +47,6 @@ class For[T](Element):
         self.render = render
         self.key = key or id
 
-        runtime = get_current_runtime()
-        self._runtime_ref = weakref.ref(runtime) if runtime is not None else None
-
         self._items = {}
         self._lock = threading.Lock()
         self._disposed = False
@@ -92,7 +86,7 @@ class For[T](Element):
             return
 
         runtime = self._runtime_ref()
-        if runtime is not None and hasattr(runtime, "needs_rebuild"):
+        if runtime is not None:
             runtime.needs_rebuild = True
             runtime.is_dirty = True
 
@@ -1,30 +1,75 @@
+import sys
+from typing import TYPE_CHECKING
+
 from wtfui.core.element import Element
 
-BRAILLE_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-DOT_FRAMES = ["⣾", "⣽", "⣻", "⢿", "⡿", "⣟", "⣯", "⣷"]
-LINE_FRAMES = ["-", "\\", "|", "/"]
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Shared by every spinner using them, so they are immutable; the frames are
+# interned so all spinners hand the renderer the very same string objects.
+BRAILLE_FRAMES = tuple(map(sys.intern, ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")))
+DOT_FRAMES = tuple(map(sys.intern, ("⣾", "⣽", "⣻", "⢿", "⡿", "⣟", "⣯", "⣷")))
+LINE_FRAMES = tuple(map(sys.intern, ("-", "\\", "|", "/")))
 
 
 class Spinner(Element):
-    __slots__ = ("_frame_idx", "cls", "frames")
+    __slots__ = ("_frame", "_frame_idx", "_frames", "_interval_ms", "cls")
 
     def __init__(
         self,
-        frames: list[str] | None = None,
+        frames: Sequence[str] | None = None,
         cls: str = "",
+        interval_ms: int = 80,
         **kwargs: object,
     ) -> None:
-        super().__init__(cls=cls, **kwargs)
-        self.frames = frames if frames is not None else BRAILLE_FRAMES
+        frames = frames if frames is not None else BRAILLE_FRAMES
+        # The web renderer ships the frame list once and the browser cycles it
+        # locally, so advance() never has to cross the wire.
+        super().__init__(cls=cls, frames=frames, interval_ms=interval_ms, **kwargs)
+        self._frames = frames
+        self._interval_ms = interval_ms
         self._frame_idx = 0
+        # The render path reads the current frame on every tick; keep it as a
+        # plain attribute instead of re-indexing frames each time.
+        self._frame = frames[0] if frames else ""
         self.cls = cls
 
+    @property
+    def frames(self) -> Sequence[str]:
+        return self._frames
+
+    @frames.setter
+    def frames(self, frames: Sequence[str]) -> None:
+        # The current frame and the frame list shipped to the browser both
+        # derive from frames, so a new list restarts the animation. The props
+        # write bumps the version.
+        self._frames = frames
+        self._frame_idx = 0
+        self._frame = frames[0] if frames else ""
+        self.props["frames"] = frames
+
+    @property
+    def interval_ms(self) -> int:
+        return self._interval_ms
+
+    @interval_ms.setter
+    def interval_ms(self, interval_ms: int) -> None:
+        self._interval_ms = interval_ms
+        self.props["interval_ms"] = interval_ms
+
     @property
     def current_frame(self) -> str:
-        return self.frames[self._frame_idx]
+        return self._frame
 
     def advance(self) -> None:
-        self._frame_idx = (self._frame_idx + 1) % len(self.frames)
+        if not self._frames:
+            return
+        self._frame_idx = (self._frame_idx + 1) % len(self._frames)
+        self._frame = self._frames[self._frame_idx]
+        self._bump_version()
 
     def reset(self) -> None:
         self._frame_idx = 0
+        self._frame = self._frames[0] if self._frames else ""
+        self._bump_version()
@@ -2,6 +2,7 @@ import warnings
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from wtfui.core.protocol import Renderer, RenderNode
+from wtfui.tui.builder import RenderTreeBuilder
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -22,6 +23,10 @@ EVENT_MAP: dict[str, str] = {
     "on_mouseout": "mouseout",
 }
 
+# Spinner animation data, only meaningful to the server's page script (the
+# HTML renderer emits it as data-* attributes); the DOM has no use for it.
+_CLIENT_ANIMATION_PROPS = frozenset({"frames", "interval_ms"})
+
 
 class DOMRenderer(Renderer):
     TAG_MAP: ClassVar[dict[str, str]] = {
@@ -51,8 +56,6 @@ class DOMRenderer(Renderer):
             self._proxy_factory = proxy_factory
 
     def render(self, element: Element) -> Any:
-        from wtfui.tui.builder import RenderTreeBuilder
-
         node = RenderTreeBuilder().build(element)
         return self.render_node(node)
 
@@ -67,6 +70,8 @@ class DOMRenderer(Renderer):
                 el.className = value
             elif key in EVENT_MAP:
                 self._bind_event(el, key, value)
+            elif key in _CLIENT_ANIMATION_PROPS:
+                continue
             elif isinstance(value, bool):
                 if value:
                     el.setAttribute(key, "")
@@ -1,14 +1,113 @@
 import html
+import json
+import re
 from typing import TYPE_CHECKING, ClassVar
 
 from wtfui.core.protocol import Renderer, RenderNode
+from wtfui.core.style import Style
+from wtfui.tui.builder import RenderTreeBuilder
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from concurrent.futures import Executor
+
     from wtfui.core.element import Element
-    from wtfui.core.style import Style
     from wtfui.tui.layout.node import LayoutNode
 
 
+# CSS lookup tables for _style_to_css, built once rather than per call.
+_FONT_SIZES = {
+    "xs": "0.75rem",
+    "sm": "0.875rem",
+    "base": "1rem",
+    "lg": "1.125rem",
+    "xl": "1.25rem",
+    "2xl": "1.5rem",
+    "3xl": "1.875rem",
+    "4xl": "2.25rem",
+}
+
+_RADIUS_MAP = {
+    "sm": "0.125rem",
+    "md": "0.375rem",
+    "lg": "0.5rem",
+    "xl": "0.75rem",
+    "2xl": "1rem",
+    "full": "9999px",
+}
+
+_SHADOW_MAP = {
+    "sm": "0 1px 2px 0 rgb(0 0 0 / 0.05)",
+    "md": "0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
+    "lg": "0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
+}
+
+# Tailwind-style colors like "slate-500" map to CSS hex values
+_COLOR_MAP = {
+    "slate-50": "#f8fafc",
+    "slate-100": "#f1f5f9",
+    "slate-200": "#e2e8f0",
+    "slate-300": "#cbd5e1",
+    "slate-400": "#94a3b8",
+    "slate-500": "#64748b",
+    "slate-600": "#475569",
+    "slate-700": "#334155",
+    "slate-800": "#1e293b",
+    "slate-900": "#0f172a",
+    "slate-950": "#020617",
+    "red-50": "#fef2f2",
+    "red-100": "#fee2e2",
+    "red-500": "#ef4444",
+    "green-50": "#f0fdf4",
+    "green-500": "#22c55e",
+    "emerald-50": "#ecfdf5",
+    "emerald-500": "#10b981",
+    "blue-50": "#eff6ff",
+    "blue-500": "#3b82f6",
+    "blue-600": "#2563eb",
+    "white": "#ffffff",
+    "black": "#000000",
+}
+
+
+def _color_to_css(color: str) -> str:
+    return _COLOR_MAP.get(color, color)
+
+
+# Led by container defaults; prepended for other elements with flex props
+_DISPLAY_FLEX = "display: flex"
+
+# Layout props that imply display: flex on the element
+_FLEX_PROPS = frozenset({"flex_direction", "flex_wrap", "justify_content", "align_items", "gap"})
+
+_HTML_SPECIAL = frozenset("&<>\"'")
+
+
+def _escape(value: str) -> str:
+    # Most text and attribute values contain nothing to escape; the set check
+    # is cheaper than html.escape's five str.replace passes.
+    if _HTML_SPECIAL.isdisjoint(value):
+        return value
+    return html.escape(value, quote=True)
+
+
+# Inline style keys come from a small vocabulary, so each camelCase key is
+# converted once; the cache is bounded in case keys are generated.
+_KEBAB_CACHE_SIZE = 512
+_kebab_cache: dict[str, str] = {}
+_CAMEL_PATTERN = re.compile(r"[A-Z]")
+
+
+def _to_kebab(name: str) -> str:
+    result = _kebab_cache.get(name)
+    if result is None:
+        result = name[:1] + _CAMEL_PATTERN.sub(r"-\g<0>", name[1:]).lower()
+        if len(_kebab_cache) >= _KEBAB_CACHE_SIZE:
+            _kebab_cache.clear()
+        _kebab_cache[name] = result
+    return result
+
+
 class HTMLRenderer(Renderer):
     TAG_MAP: ClassVar[dict[str, str]] = {
         "Div": "div",
@@ -28,15 +127,34 @@ class HTMLRenderer(Renderer):
     # Tags that should default to flex row layout
     FLEX_ROW_TAGS: ClassVar[set[str]] = {"HStack"}
 
-    def render(self, element: Element) -> str:
-        from wtfui.tui.builder import RenderTreeBuilder
+    # HTML elements without a closing tag; rendered self-closing
+    VOID_TAGS: ClassVar[frozenset[str]] = frozenset({"input", "img", "br", "hr"})
+
+    # Default style fragments per tag, built once from the sets above
+    _DEFAULT_STYLE_PREFIX: ClassVar[dict[str, tuple[str, str]]] = {
+        **dict.fromkeys(FLEX_COLUMN_TAGS, (_DISPLAY_FLEX, "flex-direction: column")),
+        **dict.fromkeys(FLEX_ROW_TAGS, (_DISPLAY_FLEX, "flex-direction: row")),
+    }
+
+    # A renderer with an executor splits the first fan-out at least this wide
+    # into this many contiguous batches of children
+    PARALLEL_BATCHES: ClassVar[int] = 16
+
+    # Opt-in: the first node with a wide enough fan-out renders its children
+    # on the executor, each batch serially. Only worth it on free-threaded
+    # builds, and the executor's own tasks must not render through this
+    # renderer, or they would wait on themselves. A class-level default keeps
+    # subclasses that skip super().__init__() serial.
+    executor: Executor | None = None
+
+    def __init__(self, executor: Executor | None = None) -> None:
+        self.executor = executor
 
+    def render(self, element: Element) -> str:
         node = RenderTreeBuilder().build(element)
         return self.render_node(node)
 
     def render_with_layout(self, element: Element, layout_node: LayoutNode) -> str:
-        from wtfui.tui.builder import RenderTreeBuilder
-
         node = RenderTreeBuilder().build_with_layout(element, layout_node)
         return self.render_node(node)
 
@@ -75,195 +193,142 @@ class HTMLRenderer(Renderer):
     }
 
     def render_node(self, node: RenderNode) -> str:
+        out: list[str] = []
+        self._emit(node, out, self.executor)
+        return "".join(out)
+
+    def _render_batch(self, nodes: list[RenderNode]) -> str:
+        out: list[str] = []
+        for node in nodes:
+            self._emit(node, out)
+        return "".join(out)
+
+    def _emit(self, node: RenderNode, out: list[str], executor: Executor | None = None) -> None:
+        # Appends the markup for node and its subtree to out, so a whole
+        # document is joined once rather than once per nesting level.
         html_tag = self.TAG_MAP.get(node.tag, "div")
 
-        attrs_parts: list[str] = []
-        attrs_parts.append(f'id="wtfui-{node.element_id}"')
-
         # Add stable key for reconciliation (doesn't change on re-render)
-        if node.element_key:
-            attrs_parts.append(f'data-key="{node.element_key}"')
+        element_key = node.element_key
+        if element_key:
+            attrs_parts = [f'id="wtfui-{node.element_id}" data-key="{element_key}"']
+        else:
+            attrs_parts = [f'id="wtfui-{node.element_id}"']
 
-        style_parts: list[str] = []
+        # Apply default flex layout for container components
+        prefix = self._DEFAULT_STYLE_PREFIX.get(node.tag)
+        if prefix is not None:
+            style_parts = list(prefix)
+            display_flex = True
+        else:
+            style_parts = []
+            display_flex = False
         has_flex_props = False
 
-        # Apply default flex layout for container components
-        if node.tag in self.FLEX_COLUMN_TAGS:
-            style_parts.append("display: flex")
-            style_parts.append("flex-direction: column")
-            has_flex_props = True
-        elif node.tag in self.FLEX_ROW_TAGS:
-            style_parts.append("display: flex")
-            style_parts.append("flex-direction: row")
-            has_flex_props = True
-
-        if node.layout is not None:
-            style_parts.append("position: absolute")
-            style_parts.append(f"top: {int(node.layout.y)}px")
-            style_parts.append(f"left: {int(node.layout.x)}px")
-            style_parts.append(f"width: {int(node.layout.width)}px")
-            style_parts.append(f"height: {int(node.layout.height)}px")
+        layout = node.layout
+        if layout is not None:
+            style_parts.append(
+                f"position: absolute; top: {int(layout.y)}px; left: {int(layout.x)}px; "
+                f"width: {int(layout.width)}px; height: {int(layout.height)}px"
+            )
 
+        layout_props = self.LAYOUT_PROPS
         for key, value in node.props.items():
-            if key == "cls":
-                attrs_parts.append(f'class="{value}"')
-            elif key == "style" and isinstance(value, dict):
-                css_str = self._style_dict_to_css(value)
-                if css_str:
-                    style_parts.append(css_str)
-            elif key.startswith("on_"):
-                continue
-            elif key in self.LAYOUT_PROPS:
+            css_prop = layout_props.get(key)
+            if css_prop is not None:
                 # Convert layout props to CSS
-                css_prop = self.LAYOUT_PROPS[key]
                 if value is not None:
-                    if key in self.PX_PROPS and isinstance(value, int | float):
-                        css_value = f"{value}px"
+                    if isinstance(value, (int, float)) and key in self.PX_PROPS:
+                        style_parts.append(f"{css_prop}: {value}px")
                     else:
-                        css_value = str(value)
-                    style_parts.append(f"{css_prop}: {css_value}")
+                        style_parts.append(f"{css_prop}: {value}")
                     # Track if we have flex-related props
-                    if key in (
-                        "flex_direction",
-                        "flex_wrap",
-                        "justify_content",
-                        "align_items",
-                        "gap",
-                    ):
+                    if key in _FLEX_PROPS:
                         has_flex_props = True
-            elif isinstance(value, bool):
-                if value:
-                    attrs_parts.append(key)
-            elif value is not None:
-                escaped_value = html.escape(str(value), quote=True)
-                attrs_parts.append(f'{key}="{escaped_value}"')
-
-        # Add display: flex if we have flex properties (and not already added)
-        if has_flex_props and "display: flex" not in style_parts:
-            style_parts.insert(0, "display: flex")
+            elif key.startswith("on_"):
+                continue
+            elif key == "cls":
+                attrs_parts.append(f'class="{value}"')
+            elif key == "style" and isinstance(value, dict):
+                declarations = self._style_dict_to_css(value)
+                style_parts.extend(declarations)
+                if not display_flex and _DISPLAY_FLEX in declarations:
+                    display_flex = True
+            elif key == "frames":
+                frames_json = json.dumps(value, ensure_ascii=False)
+                attrs_parts.append(f'data-frames="{html.escape(frames_json, quote=True)}"')
+            elif key == "interval_ms":
+                attrs_parts.append(f'data-interval="{int(value)}"')
+            elif value is True:
+                attrs_parts.append(key)
+            elif value is not None and value is not False:
+                attrs_parts.append(f'{key}="{_escape(str(value))}"')
 
         if style_parts:
-            attrs_parts.append(f'style="{"; ".join(style_parts)}"')
+            # Add display: flex if we have flex properties (and not already
+            # added), leading the declarations without shifting the list
+            if has_flex_props and not display_flex:
+                attrs_parts.append(f'style="{_DISPLAY_FLEX}; {"; ".join(style_parts)}"')
+            else:
+                attrs_parts.append(f'style="{"; ".join(style_parts)}"')
 
         attrs_str = " ".join(attrs_parts)
 
-        inner_html = self._render_inner(node)
-
-        if html_tag in ("input", "img", "br", "hr"):
-            return f"<{html_tag} {attrs_str} />"
+        if html_tag in self.VOID_TAGS:
+            out.append(f"<{html_tag} {attrs_str} />")
+            return
 
-        return f"<{html_tag} {attrs_str}>{inner_html}</{html_tag}>"
-
-    def _render_inner(self, node: RenderNode) -> str:
+        out.append(f"<{html_tag} {attrs_str}>")
         if node.text_content:
-            return self.render_text(node.text_content)
-
-        if node.label:
-            return self.render_text(node.label)
-
-        return "".join(self.render_node(child) for child in node.children)
+            out.append(self.render_text(node.text_content))
+        elif node.label:
+            out.append(self.render_text(node.label))
+        elif executor is None:
+            for child in node.children:
+                self._emit(child, out)
+        elif len(node.children) >= self.PARALLEL_BATCHES:
+            children = node.children
+            size = -(-len(children) // self.PARALLEL_BATCHES)
+            batches = [children[i : i + size] for i in range(0, len(children), size)]
+            out.extend(executor.map(self._render_batch, batches))
+        else:
+            for child in node.children:
+                self._emit(child, out, executor)
+        out.append(f"</{html_tag}>")
 
     def render_text(self, content: str) -> str:
-        return html.escape(content, quote=True)
-
-    def _style_dict_to_css(self, style: dict[str, object]) -> str:
-        from wtfui.core.style import Style
+        return _escape(content)
 
+    def _style_dict_to_css(self, style: dict[str, object]) -> Sequence[str]:
         # Handle _wtfui_style containing a Style object
         if "_wtfui_style" in style:
             wtfui_style = style["_wtfui_style"]
             if isinstance(wtfui_style, Style):
                 return self._style_to_css(wtfui_style)
 
-        def to_kebab(s: str) -> str:
-            result = []
-            for i, c in enumerate(s):
-                if c.isupper() and i > 0:
-                    result.append("-")
-                    result.append(c.lower())
-                else:
-                    result.append(c)
-            return "".join(result)
-
-        parts = [f"{to_kebab(k)}: {v}" for k, v in style.items()]
-        return "; ".join(parts)
-
-    def _style_to_css(self, style: Style) -> str:
-        """Convert a Style object to CSS string."""
-        parts: list[str] = []
+        return [f"{_to_kebab(k)}: {v}" for k, v in style.items()]
 
-        # Font size mapping
-        font_sizes = {
-            "xs": "0.75rem",
-            "sm": "0.875rem",
-            "base": "1rem",
-            "lg": "1.125rem",
-            "xl": "1.25rem",
-            "2xl": "1.5rem",
-            "3xl": "1.875rem",
-            "4xl": "2.25rem",
-        }
-
-        # Border radius mapping
-        radius_map = {
-            "sm": "0.125rem",
-            "md": "0.375rem",
-            "lg": "0.5rem",
-            "xl": "0.75rem",
-            "2xl": "1rem",
-            "full": "9999px",
-        }
-
-        # Shadow mapping
-        shadow_map = {
-            "sm": "0 1px 2px 0 rgb(0 0 0 / 0.05)",
-            "md": "0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
-            "lg": "0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
-        }
-
-        # Color conversion helper
-        def color_to_css(color: str) -> str:
-            # Tailwind-style colors like "slate-500" need to be converted to CSS
-            color_map = {
-                "slate-50": "#f8fafc",
-                "slate-100": "#f1f5f9",
-                "slate-200": "#e2e8f0",
-                "slate-300": "#cbd5e1",
-                "slate-400": "#94a3b8",
-                "slate-500": "#64748b",
-                "slate-600": "#475569",
-                "slate-700": "#334155",
-                "slate-800": "#1e293b",
-                "slate-900": "#0f172a",
-                "slate-950": "#020617",
-                "red-50": "#fef2f2",
-                "red-100": "#fee2e2",
-                "red-500": "#ef4444",
-                "green-50": "#f0fdf4",
-                "green-500": "#22c55e",
-                "emerald-50": "#ecfdf5",
-                "emerald-500": "#10b981",
-                "blue-50": "#eff6ff",
-                "blue-500": "#3b82f6",
-                "blue-600": "#2563eb",
-                "white": "#ffffff",
-                "black": "#000000",
-            }
-            return color_map.get(color, color)
+    def _style_to_css(self, style: Style) -> tuple[str, ...]:
+        """Convert a Style object to CSS declarations, joined once by render_node."""
+        cached = getattr(style, "_css_cache", None)
+        if cached is not None:
+            return cached
+
+        parts: list[str] = []
 
         # Background
         if style.bg:
-            parts.append(f"background-color: {color_to_css(style.bg)}")
+            parts.append(f"background-color: {_color_to_css(style.bg)}")
 
         # Text color
         if style.color:
-            parts.append(f"color: {color_to_css(style.color)}")
+            parts.append(f"color: {_color_to_css(style.color)}")
 
         # Font
         if style.font_weight:
             parts.append(f"font-weight: {style.font_weight}")
         if style.font_size:
-            size = font_sizes.get(style.font_size, style.font_size)
+            size = _FONT_SIZES.get(style.font_size, style.font_size)
             parts.append(f"font-size: {size}")
         if style.text_align:
             parts.append(f"text-align: {style.text_align}")
@@ -333,7 +398,7 @@ class HTMLRenderer(Renderer):
             parts.append(f"overflow: {style.overflow}")
 
         # Borders
-        border_color = color_to_css(style.border_color) if style.border_color else "#e2e8f0"
+        border_color = _color_to_css(style.border_color) if style.border_color else "#e2e8f0"
         if style.border:
             parts.append(f"border: 1px solid {border_color}")
         else:
@@ -348,12 +413,15 @@ class HTMLRenderer(Renderer):
 
         # Border radius
         if style.rounded:
-            radius = radius_map.get(style.rounded, style.rounded)
+            radius = _RADIUS_MAP.get(style.rounded, style.rounded)
             parts.append(f"border-radius: {radius}")
 
         # Shadow
         if style.shadow:
-            shadow = shadow_map.get(style.shadow, style.shadow)
+            shadow = _SHADOW_MAP.get(style.shadow, style.shadow)
             parts.append(f"box-shadow: {shadow}")
 
-        return "; ".join(parts)
+        declarations = tuple(parts)
+        # Style is frozen; the memo slot is the only attribute written after __init__
+        object.__setattr__(style, "_css_cache", declarations)
+        return declarations
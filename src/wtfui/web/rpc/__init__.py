@@ -1,9 +1,16 @@
-from wtfui.web.rpc.encoder import WtfUIJSONEncoder, wtfui_json_dumps
+from wtfui.web.rpc.encoder import (
+    WtfUIJSONEncoder,
+    wtfui_json_dumpb,
+    wtfui_json_dumps,
+    wtfui_json_loads,
+)
 from wtfui.web.rpc.registry import RpcRegistry, rpc
 
 __all__ = [
     "RpcRegistry",
     "WtfUIJSONEncoder",
     "rpc",
+    "wtfui_json_dumpb",
     "wtfui_json_dumps",
+    "wtfui_json_loads",
 ]
@@ -7,9 +7,18 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
+try:
+    import orjson
+except ImportError:  # orjson is optional (install the "fast" extra)
+    orjson = None  # type: ignore[assignment]
+
 
 class WtfUIJSONEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any:
+        convert = _CONVERTERS.get(type(o))
+        if convert is not None:
+            return convert(o)
+
         match o:
             case datetime() | date() | time():
                 return o.isoformat()
@@ -20,7 +29,7 @@ class WtfUIJSONEncoder(json.JSONEncoder):
             case Enum():
                 return o.value
             case bytes():
-                return base64.b64encode(o).decode("ascii")
+                return _encode_bytes(o)
             case set() | frozenset():
                 return list(o)
             case _ if dataclasses.is_dataclass(o) and not isinstance(o, type):
@@ -29,32 +38,72 @@ class WtfUIJSONEncoder(json.JSONEncoder):
                 return super().default(o)
 
     def _encode_dataclass(self, obj: Any) -> dict[str, Any]:
+        # Shallow on purpose: the JSON encoder walks nested containers itself
+        # and re-enters default() for inner dataclasses and rich types.
         result: dict[str, Any] = {}
-        for field in dataclasses.fields(obj):
-            value = getattr(obj, field.name)
-
-            if dataclasses.is_dataclass(value) and not isinstance(value, type):
-                result[field.name] = self._encode_dataclass(value)
-            elif isinstance(value, datetime | date | time | UUID | Decimal | Enum):
-                result[field.name] = self.default(value)
-            elif isinstance(value, list | tuple):
-                result[field.name] = [
-                    self._encode_dataclass(v)
-                    if dataclasses.is_dataclass(v) and not isinstance(v, type)
-                    else v
-                    for v in value
-                ]
-            elif isinstance(value, dict):
-                result[field.name] = {
-                    k: self._encode_dataclass(v)
-                    if dataclasses.is_dataclass(v) and not isinstance(v, type)
-                    else v
-                    for k, v in value.items()
-                }
-            else:
-                result[field.name] = value
+        for name in _field_names(type(obj)):
+            value = getattr(obj, name)
+            convert = _CONVERTERS.get(type(value))
+            result[name] = value if convert is None else convert(value)
         return result
 
 
+def _encode_bytes(value: bytes) -> str:
+    return base64.b64encode(value).decode("ascii")
+
+
+# Exact-type converters; subclasses (and Enum members) miss and take the
+# isinstance path instead.
+_CONVERTERS: dict[type, Any] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+    UUID: str,
+    Decimal: str,
+    bytes: _encode_bytes,
+    set: list,
+    frozenset: list,
+}
+
+_FIELD_CACHE: dict[type, tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> tuple[str, ...]:
+    names = _FIELD_CACHE.get(cls)
+    if names is None:
+        names = tuple(f.name for f in dataclasses.fields(cls))
+        _FIELD_CACHE[cls] = names
+    return names
+
+
+_ENCODER = WtfUIJSONEncoder()
+
+# orjson serializes datetime/UUID/Enum/dataclass natively in C; only the
+# residual types (Decimal, bytes, sets) fall back to the encoder's default().
+# Non-str keys are stringified to match json.dumps.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
 def wtfui_json_dumps(obj: Any, **kwargs: Any) -> str:
+    # Default options reuse the shared encoder; only custom ones build a new one.
+    if not kwargs:
+        return _ENCODER.encode(obj)
     return json.dumps(obj, cls=WtfUIJSONEncoder, **kwargs)
+
+
+def wtfui_json_dumpb(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_ENCODER.default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # orjson rejects what json.dumps accepts (integers beyond 64 bits),
+            # so the stdlib encoder settles it; truly unsupported objects
+            # raise TypeError there too.
+            pass
+    return _ENCODER.encode(obj).encode("utf-8")
+
+
+def wtfui_json_loads(payload: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
@@ -1,30 +1,59 @@
-import inspect
-import json
+import asyncio
+import contextlib
+import gzip
+import hashlib
 import logging
 import threading
 import uuid
 from contextvars import ContextVar
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
 from fastapi import FastAPI, HTTPException, Request, WebSocket
-from fastapi.responses import HTMLResponse, JSONResponse, Response
+from fastapi.responses import HTMLResponse, Response
 
-from wtfui.core.registry import ElementRegistry
+from wtfui.core.computed import Computed
+from wtfui.core.registry import ElementRegistry, is_async_handler
+from wtfui.core.scheduler import batch
+from wtfui.tui.builder import RenderTreeBuilder
+from wtfui.web.server.codec import MSGPACK_SCRIPT, WireCodec, coalesce_events, parse_target_id
 
 if TYPE_CHECKING:
-    from wtfui.core.protocol import Renderer
+    from collections.abc import Awaitable, Callable
+
+    from wtfui.core.protocol import Renderer, RenderNode
 from wtfui.web.renderer import HTMLRenderer
 from wtfui.web.rpc import RpcRegistry
-from wtfui.web.rpc.encoder import wtfui_json_dumps
+from wtfui.web.rpc.encoder import wtfui_json_dumpb, wtfui_json_loads
 
 logger = logging.getLogger(__name__)
 
 # Context variable for current session (React 19-style per-client isolation)
 _current_session: ContextVar[SessionState | None] = ContextVar("current_session", default=None)
 
+# Sessions pushed concurrently per broadcast batch; the loop yields between batches.
+BROADCAST_BATCH_SIZE = 50
+
 CLIENT_JS = """
 const socket = new WebSocket(`ws://${location.host}/ws`);
 
+// Binary MessagePack frames when the server shipped the decoder, JSON otherwise
+const useMsgpack = typeof MessagePack !== 'undefined';
+if (useMsgpack) {
+    socket.binaryType = 'arraybuffer';
+}
+// MessagePack.encode/decode build a fresh codec per call; reuse one of each
+const msgpackEncoder = useMsgpack ? new MessagePack.Encoder() : null;
+const msgpackDecoder = useMsgpack ? new MessagePack.Decoder() : null;
+
+function sendEvent(payload) {
+    socket.send(useMsgpack ? msgpackEncoder.encode(payload) : JSON.stringify(payload));
+}
+
+function decodeFrame(data) {
+    return typeof data === 'string' ? JSON.parse(data) : msgpackDecoder.decode(new Uint8Array(data));
+}
+
 // Connection state
 let connected = false;
 
@@ -47,19 +76,27 @@ function findByKey(key) {
     return document.querySelector(`[data-key="${key}"]`);
 }
 
-// Handle incoming patches from server
-socket.onmessage = (event) => {
-    const patch = JSON.parse(event.data);
-    console.log('[wtfui] Received patch:', patch);
-
-    // Preserve focus and selection state for inputs BEFORE any DOM changes
-    const activeEl = document.activeElement;
-    const wasInput = activeEl && (activeEl.tagName === 'INPUT' || activeEl.tagName === 'TEXTAREA');
-    const selectionStart = wasInput ? activeEl.selectionStart : null;
-    const selectionEnd = wasInput ? activeEl.selectionEnd : null;
-    // Use data-key as stable identifier (doesn't change on re-render)
-    const activeKey = wasInput ? activeEl.getAttribute('data-key') : null;
+// Spinners arrive with their frame list and cycle locally; the server never
+// sends a patch per animation frame.
+function animateSpinners() {
+    document.querySelectorAll('[data-frames]:not([data-animating])').forEach((el) => {
+        const frames = JSON.parse(el.dataset.frames);
+        if (frames.length < 2) return;
+        el.dataset.animating = '';
+        let index = Math.max(0, frames.indexOf(el.textContent));
+        const timer = setInterval(() => {
+            if (!el.isConnected) {
+                clearInterval(timer);
+                return;
+            }
+            index = (index + 1) % frames.length;
+            el.textContent = frames[index];
+        }, +el.dataset.interval || 80);
+    });
+}
+animateSpinners();
 
+function applyPatch(patch, activeEl) {
     switch (patch.op) {
         case 'update_prop':
             // Granular property update - no DOM replacement, focus preserved
@@ -124,7 +161,29 @@ socket.onmessage = (event) => {
                 root.innerHTML = patch.html;
             }
             break;
+
+        case 'batch':
+            // Several patches from one update, applied in order
+            patch.patches.forEach((inner) => applyPatch(inner, activeEl));
+            break;
     }
+}
+
+// Handle incoming patches from server
+socket.onmessage = (event) => {
+    const patch = decodeFrame(event.data);
+    console.log('[wtfui] Received patch:', patch);
+
+    // Preserve focus and selection state for inputs BEFORE any DOM changes
+    const activeEl = document.activeElement;
+    const wasInput = activeEl && (activeEl.tagName === 'INPUT' || activeEl.tagName === 'TEXTAREA');
+    const selectionStart = wasInput ? activeEl.selectionStart : null;
+    const selectionEnd = wasInput ? activeEl.selectionEnd : null;
+    // Use data-key as stable identifier (doesn't change on re-render)
+    const activeKey = wasInput ? activeEl.getAttribute('data-key') : null;
+
+    applyPatch(patch, activeEl);
+    animateSpinners();
 
     // Restore focus using stable data-key (doesn't change on re-render)
     if (activeKey) {
@@ -149,10 +208,11 @@ document.addEventListener('click', (e) => {
     const target = e.target.closest('[id^="wtfui-"]');
     if (target && connected) {
         console.log('[wtfui] Click on:', target.id);
-        socket.send(JSON.stringify({
+        sendEvent({
             type: 'click',
-            target_id: target.id
-        }));
+            target_id: +target.id.slice(6),
+            target_key: target.dataset.key
+        });
     }
 });
 
@@ -161,11 +221,12 @@ document.addEventListener('input', (e) => {
     const target = e.target.closest('[id^="wtfui-"]');
     if (target && connected) {
         console.log('[wtfui] Input on:', target.id, 'value:', target.value);
-        socket.send(JSON.stringify({
+        sendEvent({
             type: 'input',
-            target_id: target.id,
+            target_id: +target.id.slice(6),
+            target_key: target.dataset.key,
             value: target.value
-        }));
+        });
     }
 });
 
@@ -174,11 +235,12 @@ document.addEventListener('change', (e) => {
     const target = e.target.closest('[id^="wtfui-"]');
     if (target && connected) {
         console.log('[wtfui] Change on:', target.id, 'value:', target.value);
-        socket.send(JSON.stringify({
+        sendEvent({
             type: 'change',
-            target_id: target.id,
+            target_id: +target.id.slice(6),
+            target_key: target.dataset.key,
             value: target.value
-        }));
+        });
     }
 });
 
@@ -187,10 +249,11 @@ document.addEventListener('submit', (e) => {
     e.preventDefault();
     const target = e.target.closest('[id^="wtfui-"]');
     if (target && connected) {
-        socket.send(JSON.stringify({
+        sendEvent({
             type: 'submit',
-            target_id: target.id
-        }));
+            target_id: +target.id.slice(6),
+            target_key: target.dataset.key
+        });
     }
 });
 
@@ -200,16 +263,48 @@ document.addEventListener('keydown', (e) => {
         const target = e.target.closest('input[id^="wtfui-"]');
         if (target && connected) {
             console.log('[wtfui] Enter key on:', target.id);
-            socket.send(JSON.stringify({
+            sendEvent({
                 type: 'enter',
-                target_id: target.id,
+                target_id: +target.id.slice(6),
+                target_key: target.dataset.key,
                 value: target.value
-            }));
+            });
         }
     }
 });
 """
 
+# The client script is served once as a browser-cacheable asset. Its URL
+# carries a content hash, so the immutable cache never goes stale.
+_CLIENT_JS_BYTES = CLIENT_JS.encode()
+_CLIENT_JS_GZIP = gzip.compress(_CLIENT_JS_BYTES)
+_CLIENT_JS_ETAG = f'"{hashlib.sha256(_CLIENT_JS_BYTES).hexdigest()[:16]}"'
+_CLIENT_JS_PATH = "/_wtfui/client.js"
+_CLIENT_JS_HEADERS = {
+    "Cache-Control": "public, max-age=31536000, immutable",
+    "ETag": _CLIENT_JS_ETAG,
+    "Vary": "Accept-Encoding",
+}
+
+# The page envelope is constant, so it is encoded once; index() only
+# encodes the rendered body between the two halves.
+_HTML_PREFIX = f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>WtfUI App</title>
+    <script src="https://cdn.tailwindcss.com"></script>{MSGPACK_SCRIPT}
+</head>
+<body>
+    <div id="wtfui-root">""".encode()
+
+_HTML_SUFFIX = f"""</div>
+    <script src="{_CLIENT_JS_PATH}?v={_CLIENT_JS_ETAG[1:-1]}" defer></script>
+</body>
+</html>
+""".encode()
+
 
 class SessionState:
     """Per-connection session state (React 19-style client isolation).
@@ -227,7 +322,12 @@ class SessionState:
         self.registry: ElementRegistry = ElementRegistry()
         self.root_element: Any = None
         self.websocket: WebSocket | None = None  # For broadcast
-        self._render_lock = threading.Lock()
+        self.codec = WireCodec()
+        # Render tree as last sent to the client (element_id = DOM id), and
+        # stable element key -> id of the element currently registered for it.
+        self.mounted: RenderNode | None = None
+        self.element_ids: dict[str, int] = {}
+        self._render_lock = asyncio.Lock()
 
     def get_signal(self, name: str, default: Any = None) -> Any:
         """Get a signal value for this session."""
@@ -279,14 +379,158 @@ class SessionManager:
             self._sessions.pop(session_id, None)
 
 
+def _index_keys(tree: RenderNode) -> dict[str, int]:
+    index: dict[str, int] = {}
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node.element_key is not None:
+            index[node.element_key] = node.element_id
+        stack.extend(node.children)
+    return index
+
+
+def _same_node(old: RenderNode, new: RenderNode) -> bool:
+    # Compares what a node renders by itself; handlers (on_*) never reach the
+    # HTML and are recreated on every rebuild, so only their presence counts.
+    # Animated nodes (spinners) cycle their text in the browser, so a frame
+    # change alone is not worth a patch.
+    if (
+        old.tag != new.tag
+        or old.element_key != new.element_key
+        or (old.text_content != new.text_content and "frames" not in new.props)
+        or old.label != new.label
+        or old.layout != new.layout
+        or len(old.children) != len(new.children)
+        or old.props.keys() != new.props.keys()
+    ):
+        return False
+    new_props = new.props
+    for name, value in old.props.items():
+        if not name.startswith("on_") and value != new_props[name]:
+            return False
+    return True
+
+
+def _changed_subtrees(
+    old: RenderNode, new: RenderNode
+) -> list[tuple[RenderNode, RenderNode]] | None:
+    """Pair up the subtrees of ``new`` whose output differs from ``old``.
+
+    Returns None when the root itself changed. Unchanged nodes inherit the
+    DOM id of the node they match, so ``new`` keeps mirroring the client.
+    """
+    if not _same_node(old, new):
+        return None
+
+    changed: list[tuple[RenderNode, RenderNode]] = []
+    stack = [(old, new)]
+    while stack:
+        old_node, new_node = stack.pop()
+        new_node.element_id = old_node.element_id
+        for old_child, new_child in zip(old_node.children, new_node.children, strict=True):
+            if _same_node(old_child, new_child):
+                stack.append((old_child, new_child))
+            else:
+                changed.append((old_child, new_child))
+    return changed
+
+
+def _text_only_change(old: RenderNode, new: RenderNode) -> bool:
+    # A keyed leaf whose text alone changed is patched in place on the client
+    # (update_prop "content") instead of re-rendered and re-parsed.
+    return (
+        bool(old.text_content)
+        and bool(new.text_content)
+        and new.element_key is not None
+        and not old.children
+        and not new.children
+        and _same_node(replace(old, text_content=new.text_content), new)
+    )
+
+
+async def _run_handler(session: SessionState, element_id: int, event_type: str, *args: Any) -> bool:
+    handler = session.registry.get_handler(element_id, event_type)
+    if not handler:
+        return False
+    with batch():
+        if is_async_handler(handler):
+            await handler(*args)
+        else:
+            handler(*args)
+    return True
+
+
+async def _on_click(
+    session: SessionState, element_id: int, data: dict[str, Any]
+) -> tuple[bool, bool]:
+    ran = await _run_handler(session, element_id, "click")
+    return ran, ran
+
+
+async def _on_input(
+    session: SessionState, element_id: int, data: dict[str, Any]
+) -> tuple[bool, bool]:
+    # Live updates on every keystroke
+    element = session.registry.get(element_id)
+    value = data.get("value", "")
+
+    if element:
+        bind = getattr(element, "bind", None)
+        if bind is not None:
+            bind.value = value
+
+    return await _run_handler(session, element_id, "change", value), False
+
+
+async def _on_change(
+    session: SessionState, element_id: int, data: dict[str, Any]
+) -> tuple[bool, bool]:
+    element = session.registry.get(element_id)
+    value = data.get("value", "")
+
+    if element and hasattr(element, "_text_value"):
+        if getattr(element, "bind", None) is not None:
+            element.bind.value = value
+        else:
+            element._text_value = value
+
+    return await _run_handler(session, element_id, "change", value), False
+
+
+async def _on_enter(
+    session: SessionState, element_id: int, data: dict[str, Any]
+) -> tuple[bool, bool]:
+    # Handle Enter key in input fields
+    ran = await _run_handler(session, element_id, "enter")
+    return ran, ran
+
+
+# Each event handler returns (needs_render, needs_broadcast); the WebSocket
+# loop pushes the session's update and broadcasts once, after the handler.
+_EVENT_DISPATCH: dict[
+    str, Callable[[SessionState, int, dict[str, Any]], Awaitable[tuple[bool, bool]]]
+] = {
+    "click": _on_click,
+    "input": _on_input,
+    "change": _on_change,
+    "enter": _on_enter,
+}
+
+
 class AppState:
     def __init__(self) -> None:
         self.root_component: Any = None
         self.root_element: Any = None
         self.registry: ElementRegistry = ElementRegistry()
         self.renderer = HTMLRenderer()
-        self._render_lock = threading.Lock()
+        self._render_lock = asyncio.Lock()
         self.session_manager = SessionManager()
+        # id(root) -> (root, root._version, memoized render). Holding the root
+        # keeps its id from being reused while the entry exists.
+        self._render_cache: dict[int, tuple[Any, int, Computed[str]]] = {}
+        # (rendered HTML, encoded page, ETag) for the last page served.
+        self._page: tuple[str, bytes, str] | None = None
 
 
 def create_app(
@@ -299,15 +543,38 @@ def create_app(
     state.renderer = renderer or HTMLRenderer()
 
     async def _get_or_create_root() -> Any:
-        with state._render_lock:
+        async with state._render_lock:
             if state.root_element is None:
                 state.root_element = await state.root_component()
 
                 state.registry.register_tree(state.root_element)
             return state.root_element
 
+    def _cached_render(root: Any) -> str:
+        # The Computed re-renders when a Signal read during rendering changes;
+        # every other render-visible edit anywhere in the tree (props,
+        # children, keys, and element attributes such as Button.label) bumps
+        # root._version, so the page and its ETag never outlive the change.
+        key = id(root)
+        version = getattr(root, "_version", 0)
+        hit = state._render_cache.get(key)
+        if hit is not None and hit[0] is root and hit[1] == version:
+            return hit[2]()
+
+        if hit is not None:
+            hit[2].dispose()
+        memo = Computed(lambda: state.renderer.render(root))
+        state._render_cache[key] = (root, version, memo)
+        return memo()
+
+    def _evict_render(root: Any) -> None:
+        hit = state._render_cache.pop(id(root), None)
+        if hit is not None:
+            hit[2].dispose()
+
     async def _re_render_root() -> Any:
-        with state._render_lock:
+        async with state._render_lock:
+            _evict_render(state.root_element)
             state.registry.clear()
 
             state.root_element = await state.root_component()
@@ -315,27 +582,119 @@ def create_app(
             state.registry.register_tree(state.root_element)
             return state.root_element
 
+    async def _session_render(target: SessionState) -> Any:
+        """Render root with session-specific state.
+
+        The caller holds ``target._render_lock``.
+        """
+        target.registry.clear()
+        # Set current session context before rendering
+        set_current_session(target)
+        try:
+            target.root_element = await state.root_component()
+            target.registry.register_tree(target.root_element)
+        finally:
+            set_current_session(None)
+        return target.root_element
+
+    async def _push_update(target: SessionState) -> None:
+        # The session's own pushes and broadcast pushes to it run concurrently;
+        # the lock keeps each diff against the tree its last frame mounted.
+        async with target._render_lock:
+            await _render_and_send(target)
+
+    async def _render_and_send(target: SessionState) -> None:
+        # Components read signals while building, so the tree is rebuilt; only
+        # the subtrees whose output changed since the last push are re-sent.
+        root = await _session_render(target)
+        tree = RenderTreeBuilder().build(root)
+        target.element_ids = _index_keys(tree)
+
+        changed = None
+        if target.mounted is not None:
+            changed = _changed_subtrees(target.mounted, tree)
+        target.mounted = tree
+
+        websocket = target.websocket
+        if changed is None:
+            # Whole-root frames go through render(), like the index page, so a
+            # custom renderer overriding it renders every full page; subtree
+            # patches go through the protocol's render_node().
+            await target.codec.send_root(websocket, state.renderer.render(root))
+            return
+        if not changed:
+            return
+        if len(changed) == 1 and not _text_only_change(*changed[0]):
+            old_node, new_node = changed[0]
+            await target.codec.send_replace(
+                websocket,
+                f"wtfui-{old_node.element_id}",
+                state.renderer.render_node(new_node),
+                target_key=old_node.element_key,
+            )
+            return
+
+        # Several changes (or a text edit) go out as one frame.
+        patches = [_subtree_patch(old_node, new_node) for old_node, new_node in changed]
+        await target.codec.send(
+            websocket, patches[0] if len(patches) == 1 else {"op": "batch", "patches": patches}
+        )
+
+    def _subtree_patch(old_node: RenderNode, new_node: RenderNode) -> dict[str, Any]:
+        if _text_only_change(old_node, new_node):
+            # The client keeps its DOM node, so the new node takes over its id.
+            new_node.element_id = old_node.element_id
+            return {
+                "op": "update_prop",
+                "target_key": new_node.element_key,
+                "prop_name": "content",
+                "value": new_node.text_content,
+            }
+        patch = {
+            "op": "replace",
+            "target_id": f"wtfui-{old_node.element_id}",
+            "html": state.renderer.render_node(new_node),
+        }
+        if old_node.element_key is not None:
+            patch["target_key"] = old_node.element_key
+        return patch
+
     @app.get("/", response_class=HTMLResponse)
-    async def index(request: Request) -> HTMLResponse:
+    async def index(request: Request) -> Response:
         root = await _get_or_create_root()
 
-        full_html = state.renderer.render(root)
-
-        html_doc = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>WtfUI App</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-</head>
-<body>
-    <div id="wtfui-root">{full_html}</div>
-    <script>{CLIENT_JS}</script>
-</body>
-</html>
-"""
-        return HTMLResponse(content=html_doc)
+        full_html = _cached_render(root)
+
+        # The memoized render returns the same string until it changes, so the
+        # encoded page and its ETag are built once per render, not per request.
+        page = state._page
+        if page is None or page[0] is not full_html:
+            # One join copies the (possibly large) body once; chained + copies it twice.
+            body = b"".join((_HTML_PREFIX, full_html.encode(), _HTML_SUFFIX))
+            page = (full_html, body, f'"{hashlib.sha256(body).hexdigest()[:16]}"')
+            state._page = page
+
+        headers = {"Cache-Control": "no-cache", "ETag": page[2]}
+        if request.headers.get("if-none-match") == page[2]:
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(content=page[1], headers=headers)
+
+    @app.get(_CLIENT_JS_PATH)
+    async def client_js(request: Request) -> Response:
+        if request.headers.get("if-none-match") == _CLIENT_JS_ETAG:
+            return Response(status_code=304, headers=_CLIENT_JS_HEADERS)
+
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(
+                content=_CLIENT_JS_GZIP,
+                media_type="application/javascript",
+                headers={**_CLIENT_JS_HEADERS, "Content-Encoding": "gzip"},
+            )
+        return Response(
+            content=_CLIENT_JS_BYTES,
+            media_type="application/javascript",
+            headers=_CLIENT_JS_HEADERS,
+        )
 
     @app.websocket("/ws")
     async def websocket_endpoint(websocket: WebSocket) -> None:
@@ -345,167 +704,110 @@ def create_app(
         session = state.session_manager.create_session(websocket=websocket)
         logger.debug(f"Created session {session.session_id} for WebSocket connection")
 
-        async def _session_render() -> Any:
-            """Render root with session-specific state."""
-            with session._render_lock:
-                session.registry.clear()
-                # Set current session context before rendering
-                set_current_session(session)
-                try:
-                    session.root_element = await state.root_component()
-                    session.registry.register_tree(session.root_element)
-                finally:
-                    set_current_session(None)
-                return session.root_element
-
         async def _broadcast_to_others() -> None:
             """Broadcast update to all other connected sessions (real-time updates)."""
-            for other_session in state.session_manager.get_all_sessions():
-                if other_session.session_id == session.session_id:
-                    continue  # Don't send to self
-                if other_session.websocket is None:
-                    continue
-
-                try:
-                    # Re-render for other session's context
-                    set_current_session(other_session)
-                    try:
-                        other_session.registry.clear()
-                        other_session.root_element = await state.root_component()
-                        other_session.registry.register_tree(other_session.root_element)
-                        html = state.renderer.render(other_session.root_element)
-                    finally:
-                        set_current_session(None)
-
-                    await other_session.websocket.send_json({"op": "update_root", "html": html})
-                except Exception:
-                    logger.debug(f"Failed to broadcast to session {other_session.session_id}")
-
+            others = [
+                other_session
+                for other_session in state.session_manager.get_all_sessions()
+                if other_session.session_id != session.session_id  # Don't send to self
+                and other_session.websocket is not None
+            ]
+            # gather() runs each push as its own task on a copy of the context,
+            # so concurrent renders never see each other's current session.
+            for start in range(0, len(others), BROADCAST_BATCH_SIZE):
+                if start:
+                    await asyncio.sleep(0)  # Let other connections run between batches
+                chunk = others[start : start + BROADCAST_BATCH_SIZE]
+                results = await asyncio.gather(
+                    *(_push_update(other_session) for other_session in chunk),
+                    return_exceptions=True,
+                )
+                for other_session, result in zip(chunk, results, strict=True):
+                    if isinstance(result, BaseException):
+                        logger.debug(f"Failed to broadcast to session {other_session.session_id}")
+
+        async def _handle_event(data: dict[str, Any]) -> None:
+            dispatch = _EVENT_DISPATCH.get(data.get("type", ""))
+            if dispatch is None:
+                return
+
+            # The stable key survives re-renders; DOM ids of unchanged
+            # nodes belong to elements from earlier renders.
+            target_key = data.get("target_key")
+            element_id = None
+            if isinstance(target_key, str):
+                element_id = session.element_ids.get(target_key)
+            if element_id is None:
+                element_id = parse_target_id(data.get("target_id"))
+            if element_id is None:
+                return
+
+            # Set session context for handler execution
+            set_current_session(session)
+            try:
+                needs_render, needs_broadcast = await dispatch(session, element_id, data)
+                if needs_render:
+                    await _push_update(session)
+                if needs_broadcast:
+                    # Broadcast to other clients for real-time updates
+                    await _broadcast_to_others()
+            finally:
+                set_current_session(None)
+
+        async def _read_frames(inbox: asyncio.Queue[dict[str, Any] | None]) -> None:
+            # Disconnects and undecodable frames both just end the connection.
+            with contextlib.suppress(Exception):
+                while True:
+                    inbox.put_nowait(await session.codec.receive(websocket))
+            inbox.put_nowait(None)
+
+        # A reader task buffers frames so each wakeup handles everything that
+        # arrived meanwhile; a burst of keystrokes is rendered once.
+        inbox: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        reader = None
         try:
             # Initial render for this session
-            root = await _session_render()
-            html = state.renderer.render(root)
-            await websocket.send_json({"op": "update_root", "html": html})
+            await _push_update(session)
 
+            reader = asyncio.create_task(_read_frames(inbox))
             while True:
-                data = await websocket.receive_json()
-                event_type = data.get("type", "")
-                target_id_str = data.get("target_id", "")
-
-                if not target_id_str.startswith("wtfui-"):
-                    continue
-
-                try:
-                    element_id = int(target_id_str[6:])
-                except ValueError:
-                    continue
-
-                # Set session context for handler execution
-                set_current_session(session)
-                try:
-                    match event_type:
-                        case "click":
-                            handler = session.registry.get_handler(element_id, "click")
-                            if handler:
-                                if inspect.iscoroutinefunction(handler):
-                                    await handler()
-                                else:
-                                    handler()
-
-                                root = await _session_render()
-                                html = state.renderer.render(root)
-                                await websocket.send_json({"op": "update_root", "html": html})
-
-                                # Broadcast to other clients for real-time updates
-                                await _broadcast_to_others()
-
-                        case "input":
-                            # Live updates on every keystroke
-                            element = session.registry.get(element_id)
-                            value = data.get("value", "")
-
-                            if element:
-                                bind = getattr(element, "bind", None)
-                                if bind is not None:
-                                    bind.value = value
-
-                            handler = session.registry.get_handler(element_id, "change")
-                            if handler:
-                                if inspect.iscoroutinefunction(handler):
-                                    await handler(value)
-                                else:
-                                    handler(value)
-
-                                root = await _session_render()
-                                html = state.renderer.render(root)
-                                await websocket.send_json({"op": "update_root", "html": html})
-
-                        case "change":
-                            element = session.registry.get(element_id)
-                            value = data.get("value", "")
-
-                            if element and hasattr(element, "_text_value"):
-                                if getattr(element, "bind", None) is not None:
-                                    element.bind.value = value
-                                else:
-                                    element._text_value = value
-
-                            handler = session.registry.get_handler(element_id, "change")
-                            if handler:
-                                if inspect.iscoroutinefunction(handler):
-                                    await handler(value)
-                                else:
-                                    handler(value)
-
-                                root = await _session_render()
-                                html = state.renderer.render(root)
-                                await websocket.send_json({"op": "update_root", "html": html})
-
-                        case "enter":
-                            # Handle Enter key in input fields
-                            handler = session.registry.get_handler(element_id, "enter")
-                            if handler:
-                                if inspect.iscoroutinefunction(handler):
-                                    await handler()
-                                else:
-                                    handler()
-
-                                root = await _session_render()
-                                html = state.renderer.render(root)
-                                await websocket.send_json({"op": "update_root", "html": html})
-
-                                # Broadcast to other clients for real-time updates
-                                await _broadcast_to_others()
-                finally:
-                    set_current_session(None)
+                events = [await inbox.get()]
+                while not inbox.empty():
+                    events.append(inbox.get_nowait())
+
+                closed = None in events
+                if closed:
+                    events = events[: events.index(None)]
+
+                for data in coalesce_events(events):
+                    await _handle_event(data)
 
+                if closed:
+                    break
         except Exception:
             logger.debug("WebSocket connection closed", exc_info=True)
         finally:
+            if reader is not None:
+                reader.cancel()
             # Cleanup session on disconnect
             state.session_manager.remove_session(session.session_id)
             logger.debug(f"Removed session {session.session_id}")
 
     @app.post("/api/rpc/{func_name}")
-    async def rpc_handler(func_name: str, request: Request) -> JSONResponse:
+    async def rpc_handler(func_name: str, request: Request) -> Response:
         target_func = RpcRegistry.get(func_name)
 
         if target_func is None:
             raise HTTPException(status_code=404, detail=f"RPC function '{func_name}' not found")
 
         try:
-            data = await request.json()
+            data = wtfui_json_loads(await request.body())
         except Exception:
             data = {}
 
         result = await target_func(**data)
 
-        json_content = wtfui_json_dumps(result)
-
-        return JSONResponse(
-            content=json.loads(json_content),
-            media_type="application/json",
-        )
+        return Response(content=wtfui_json_dumpb(result), media_type="application/json")
 
     @app.get("/app.mfbc")
     async def get_wtfuibyte() -> Response:
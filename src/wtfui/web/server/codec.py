@@ -0,0 +1,157 @@
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+from starlette.websockets import WebSocketDisconnect
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional (install the "fast" extra)
+    msgpack = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # orjson is optional (install the "fast" extra)
+    orjson = None  # type: ignore[assignment]
+
+# Loaded ahead of CLIENT_JS only when the server can decode MessagePack frames;
+# the client switches to binary frames when this global is present.
+MSGPACK_SCRIPT = (
+    '<script src="https://unpkg.com/@msgpack/msgpack"></script>' if msgpack is not None else ""
+)
+
+
+def _loads(payload: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _dumps(patch: dict[str, Any]) -> str:
+    # JSON patches stay text frames: clients decode binary frames as MessagePack.
+    if orjson is not None:
+        return orjson.dumps(patch).decode()
+    return json.dumps(patch, separators=(",", ":"), ensure_ascii=False)
+
+
+def parse_target_id(target_id: Any) -> int | None:
+    # Clients send the numeric element id directly; the "wtfui-<id>" string
+    # form is still accepted for older clients.
+    if type(target_id) is int:
+        return target_id
+    if isinstance(target_id, str) and target_id.startswith("wtfui-"):
+        try:
+            return int(target_id[6:])
+        except ValueError:
+            return None
+    return None
+
+
+# Only the latest value of a run of these events on one element matters.
+_COALESCED_EVENTS = frozenset({"input", "change"})
+
+
+def coalesce_events(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Consecutive input/change events for one element collapse into the last,
+    # so a burst of keystrokes triggers one handler call and one render.
+    compacted: list[dict[str, Any]] = []
+    for data in events:
+        event_type = data.get("type")
+        if (
+            compacted
+            and event_type in _COALESCED_EVENTS
+            and compacted[-1].get("type") == event_type
+            and compacted[-1].get("target_id") == data.get("target_id")
+        ):
+            compacted[-1] = data
+        else:
+            compacted.append(data)
+    return compacted
+
+
+class WireCodec:
+    """Per-connection WebSocket frame codec.
+
+    Clients that load the MessagePack script send binary frames; the codec
+    answers each connection in the format it last received, so plain JSON
+    clients (and tools such as TestClient) keep working unchanged.
+    """
+
+    __slots__ = ("_packer", "binary")
+
+    def __init__(self) -> None:
+        self.binary = False
+        # msgpack.packb builds a fresh Packer (and its buffer) per call; one
+        # per connection is reused instead. Only the event loop touches it.
+        self._packer = msgpack.Packer(use_bin_type=True) if msgpack is not None else None
+
+    async def receive(self, websocket: Any) -> dict[str, Any]:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+
+        data = message.get("bytes")
+        if data is not None and msgpack is not None:
+            self.binary = True
+            return msgpack.unpackb(data, raw=False)
+
+        self.binary = False
+        payload = message.get("text")
+        if payload is None:
+            payload = data if data is not None else "{}"
+        return _loads(payload)
+
+    async def send(self, websocket: Any, patch: dict[str, Any]) -> None:
+        if self.binary:
+            await websocket.send_bytes(self._packer.pack(patch))
+        else:
+            await websocket.send_text(_dumps(patch))
+
+    # Hot-path patches have a fixed schema, so the JSON envelope is assembled
+    # around the C string escaper instead of going through the generic encoder.
+
+    async def send_root(self, websocket: Any, html: str) -> None:
+        if self.binary:
+            await self.send(websocket, {"op": "update_root", "html": html})
+        else:
+            await websocket.send_text(
+                '{"op":"update_root","html":' + encode_basestring_ascii(html) + "}"
+            )
+
+    async def send_replace(
+        self, websocket: Any, target_id: str, html: str, target_key: str | None = None
+    ) -> None:
+        if self.binary:
+            patch = {"op": "replace", "target_id": target_id, "html": html}
+            if target_key is not None:
+                patch["target_key"] = target_key
+            await self.send(websocket, patch)
+        else:
+            key_part = (
+                "" if target_key is None else ',"target_key":' + encode_basestring_ascii(target_key)
+            )
+            await websocket.send_text(
+                '{"op":"replace","target_id":'
+                + encode_basestring_ascii(target_id)
+                + key_part
+                + ',"html":'
+                + encode_basestring_ascii(html)
+                + "}"
+            )
+
+    async def send_replace_batch(self, websocket: Any, patches: list[tuple[str, str]]) -> None:
+        if self.binary:
+            await self.send(websocket, {"op": "replace_batch", "patches": patches})
+        else:
+            await websocket.send_text(
+                '{"op":"replace_batch","patches":['
+                + ",".join(
+                    "["
+                    + encode_basestring_ascii(target_id)
+                    + ","
+                    + encode_basestring_ascii(html)
+                    + "]"
+                    for target_id, html in patches
+                )
+                + "]}"
+            )
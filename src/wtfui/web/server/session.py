@@ -1,10 +1,17 @@
 import asyncio
-import inspect
+import contextlib
+import os
+import sys
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
-from wtfui.core.registry import ElementRegistry
+from wtfui.core.computed import Computed
+from wtfui.core.registry import ElementRegistry, is_async_handler
+from wtfui.core.scheduler import batch
 from wtfui.web.renderer import HTMLRenderer
+from wtfui.web.server.codec import MSGPACK_SCRIPT, WireCodec, coalesce_events, parse_target_id
 
 if TYPE_CHECKING:
     from wtfui.core.element import Element
@@ -14,9 +21,46 @@ if TYPE_CHECKING:
 CLIENT_JS = """
 const socket = new WebSocket(`ws://${location.host}/ws`);
 
+// Binary MessagePack frames when the server shipped the decoder, JSON otherwise
+const useMsgpack = typeof MessagePack !== 'undefined';
+if (useMsgpack) {
+    socket.binaryType = 'arraybuffer';
+}
+// MessagePack.encode/decode build a fresh codec per call; reuse one of each
+const msgpackEncoder = useMsgpack ? new MessagePack.Encoder() : null;
+const msgpackDecoder = useMsgpack ? new MessagePack.Decoder() : null;
+
+function sendEvent(payload) {
+    socket.send(useMsgpack ? msgpackEncoder.encode(payload) : JSON.stringify(payload));
+}
+
+function decodeFrame(data) {
+    return typeof data === 'string' ? JSON.parse(data) : msgpackDecoder.decode(new Uint8Array(data));
+}
+
+// Spinners arrive with their frame list and cycle locally; the server never
+// sends a patch per animation frame.
+function animateSpinners() {
+    document.querySelectorAll('[data-frames]:not([data-animating])').forEach((el) => {
+        const frames = JSON.parse(el.dataset.frames);
+        if (frames.length < 2) return;
+        el.dataset.animating = '';
+        let index = Math.max(0, frames.indexOf(el.textContent));
+        const timer = setInterval(() => {
+            if (!el.isConnected) {
+                clearInterval(timer);
+                return;
+            }
+            index = (index + 1) % frames.length;
+            el.textContent = frames[index];
+        }, +el.dataset.interval || 80);
+    });
+}
+animateSpinners();
+
 // Handle incoming patches
 socket.onmessage = (event) => {
-    const patch = JSON.parse(event.data);
+    const patch = decodeFrame(event.data);
     console.log('[wtfui] Received patch:', patch);
 
     // Preserve focus and selection state for inputs BEFORE any DOM changes
@@ -32,10 +76,16 @@ socket.onmessage = (event) => {
     if (patch.op === 'replace') {
         const el = document.getElementById(patch.target_id);
         if (el) el.outerHTML = patch.html;
+    } else if (patch.op === 'replace_batch') {
+        for (const [targetId, html] of patch.patches) {
+            const el = document.getElementById(targetId);
+            if (el) el.outerHTML = html;
+        }
     } else if (patch.op === 'update_root') {
         const root = document.getElementById('wtfui-root');
         if (root) root.innerHTML = patch.html;
     }
+    animateSpinners();
 
     // Restore focus using stable selector (element IDs change on re-render)
     if (inputSelector) {
@@ -58,10 +108,10 @@ socket.onmessage = (event) => {
 document.addEventListener('click', (e) => {
     const target = e.target.closest('[id^="wtfui-"]');
     if (target && socket.readyState === WebSocket.OPEN) {
-        socket.send(JSON.stringify({
+        sendEvent({
             type: 'click',
-            target_id: target.id
-        }));
+            target_id: +target.id.slice(6)
+        });
     }
 });
 
@@ -69,11 +119,11 @@ document.addEventListener('click', (e) => {
 document.addEventListener('change', (e) => {
     const target = e.target.closest('[id^="wtfui-"]');
     if (target && socket.readyState === WebSocket.OPEN) {
-        socket.send(JSON.stringify({
+        sendEvent({
             type: 'change',
-            target_id: target.id,
+            target_id: +target.id.slice(6),
             value: target.value
-        }));
+        });
     }
 });
 
@@ -81,15 +131,51 @@ document.addEventListener('change', (e) => {
 document.addEventListener('input', (e) => {
     const target = e.target.closest('[id^="wtfui-"]');
     if (target && socket.readyState === WebSocket.OPEN) {
-        socket.send(JSON.stringify({
+        sendEvent({
             type: 'input',
-            target_id: target.id,
+            target_id: +target.id.slice(6),
             value: target.value
-        }));
+        });
     }
 });
 """
 
+_HTML_PREFIX = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <script src="https://cdn.tailwindcss.com"></script>{MSGPACK_SCRIPT}
+</head>
+<body>
+    <div id="wtfui-root">"""
+
+_HTML_SUFFIX = f"""</div>
+    <script>{CLIENT_JS}</script>
+</body>
+</html>
+"""
+
+
+# Batched renders only run in parallel on free-threaded builds; with the GIL
+# the thread hop is pure overhead, so batches render inline. The pool is
+# shared by all sessions and sized to the machine (threads start lazily).
+_PARALLEL_RENDER = not getattr(sys, "_is_gil_enabled", lambda: True)()
+_render_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="wtfui-render"
+)
+
+# Bound on memoized subtree renders per session; the oldest entry is evicted.
+_RENDER_CACHE_SIZE = 4096
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
 
 class LiveSession:
     def __init__(
@@ -100,8 +186,21 @@ class LiveSession:
     ) -> None:
         self.root_component = root_component
         self.socket = websocket
+        self.codec = WireCodec()
         self.renderer = renderer or HTMLRenderer()
-        self.queue: asyncio.Queue[Element] = asyncio.Queue()
+        # Updates may be queued from any thread: deque appends are atomic, and
+        # the event only wakes the outgoing loop, so producers never touch the
+        # waiter bookkeeping an asyncio.Queue keeps.
+        self._dirty: deque[Element] = deque()
+        # ids of the nodes waiting in _dirty. Kept per session: the same
+        # element tree may be watched by several sessions at once. A queued
+        # node is held by the deque, so its id cannot be reused meanwhile.
+        self._queued: set[int] = set()
+        self._wake = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # id(node) -> (node, node._version, memoized render), as in the app's
+        # page cache. Holding the node keeps its id from being reused.
+        self._render_cache: dict[int, tuple[Element, int, Computed[str]]] = {}
         self._running = False
         self._lock = threading.Lock()
 
@@ -109,26 +208,57 @@ class LiveSession:
         self._registry.register_tree(root_component)
 
     def queue_update(self, node: Element) -> None:
-        self.queue.put_nowait(node)
+        # Repeated writes before the next drain enqueue the node only once.
+        # The membership check may race across threads; the drain dedupes anyway.
+        key = id(node)
+        if key in self._queued:
+            return
+        self._queued.add(key)
+        self._dirty.append(node)
+        if self._wake.is_set():
+            return
+        loop = self._loop
+        if loop is None or _running_loop() is loop:
+            self._wake.set()
+        else:
+            loop.call_soon_threadsafe(self._wake.set)
+
+    def _render(self, node: Element) -> str:
+        return self._memo(node)()
+
+    def _memo(self, node: Element) -> Computed[str]:
+        # The Computed re-renders when a Signal read during rendering changes;
+        # every other render-visible edit (props, children, keys, and element
+        # attributes such as Button.label) bumps node._version. A node queued
+        # without a visible change reuses its last HTML.
+        # Only the loop thread touches the cache; render workers just call
+        # the returned memo.
+        cache = self._render_cache
+        key = id(node)
+        version = node._version
+        hit = cache.get(key)
+        if hit is not None and hit[0] is node and hit[1] == version:
+            return hit[2]
+
+        if hit is not None:
+            hit[2].dispose()
+        elif len(cache) >= _RENDER_CACHE_SIZE:
+            oldest = next(iter(cache))
+            cache.pop(oldest)[2].dispose()
+        memo = Computed(lambda: self.renderer.render(node))
+        cache[key] = (node, version, memo)
+        return memo
+
+    def _clear_render_cache(self) -> None:
+        for _, _, memo in self._render_cache.values():
+            memo.dispose()
+        self._render_cache.clear()
 
     async def send_initial_render(self) -> None:
         full_html = self.renderer.render(self.root_component)
 
-        html_doc = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <script src="https://cdn.tailwindcss.com"></script>
-</head>
-<body>
-    <div id="wtfui-root">{full_html}</div>
-    <script>{CLIENT_JS}</script>
-</body>
-</html>
-"""
-        await self.socket.send_text(html_doc)
+        # One join copies the (possibly large) body once; chained + copies it twice.
+        await self.socket.send_text("".join((_HTML_PREFIX, full_html, _HTML_SUFFIX)))
 
     async def start(self) -> None:
         await self.socket.accept()
@@ -136,32 +266,89 @@ class LiveSession:
 
         self._running = True
 
-        async with asyncio.TaskGroup() as tg:
-            tg.create_task(self._incoming_loop())
-            tg.create_task(self._outgoing_loop())
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._incoming_loop())
+                tg.create_task(self._outgoing_loop())
+        finally:
+            self._clear_render_cache()
 
     async def _incoming_loop(self) -> None:
-        while self._running:
-            try:
-                data = await self.socket.receive_json()
-                await self._handle_event(data)
-            except Exception:
-                self._running = False
-                break
+        # A reader task buffers frames so each wakeup handles everything that
+        # arrived meanwhile; None marks the end of the connection.
+        inbox: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        reader = asyncio.create_task(self._read_frames(inbox))
+        try:
+            while self._running:
+                events = [await inbox.get()]
+                while not inbox.empty():
+                    events.append(inbox.get_nowait())
+
+                closed = None in events
+                if closed:
+                    events = events[: events.index(None)]
+
+                for data in coalesce_events(events):
+                    await self._handle_event(data)
+
+                if closed:
+                    self._running = False
+        except Exception:
+            self._running = False
+        finally:
+            reader.cancel()
+
+    async def _read_frames(self, inbox: asyncio.Queue[dict[str, Any] | None]) -> None:
+        # Disconnects and undecodable frames both just end the connection.
+        with contextlib.suppress(Exception):
+            while self._running:
+                inbox.put_nowait(await self.codec.receive(self.socket))
+        inbox.put_nowait(None)
 
     async def _outgoing_loop(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        dirty = self._dirty
+        queued_ids = self._queued
         while self._running:
             try:
-                node = await asyncio.wait_for(self.queue.get(), timeout=1.0)
-
-                html = await asyncio.to_thread(self.renderer.render, node)
-
-                patch = {
-                    "op": "replace",
-                    "target_id": f"wtfui-{id(node)}",
-                    "html": html,
-                }
-                await self.socket.send_json(patch)
+                if not dirty:
+                    await asyncio.wait_for(self._wake.wait(), timeout=1.0)
+                # Cleared before draining, so a later append sets it again.
+                self._wake.clear()
+
+                # A node queued several times in one burst is rendered once.
+                pending: dict[int, Element] = {}
+                while dirty:
+                    queued = dirty.popleft()
+                    # Cleared before rendering: a write during the render
+                    # queues the node again.
+                    key = id(queued)
+                    queued_ids.discard(key)
+                    pending[key] = queued
+                if not pending:
+                    continue
+
+                # A lone update renders inline: a thread hop buys no parallelism
+                # and only adds latency. Batches go out as a single frame.
+                if len(pending) == 1:
+                    (node,) = pending.values()
+                    html = self._render(node)
+                    await self.codec.send_replace(self.socket, node.dom_id, html)
+                    continue
+
+                nodes = list(pending.values())
+                memos = [self._memo(queued) for queued in nodes]
+                if _PARALLEL_RENDER:
+                    loop = asyncio.get_running_loop()
+                    htmls = await asyncio.gather(
+                        *(loop.run_in_executor(_render_executor, memo) for memo in memos)
+                    )
+                else:
+                    htmls = [memo() for memo in memos]
+                await self.codec.send_replace_batch(
+                    self.socket,
+                    [(queued.dom_id, html) for queued, html in zip(nodes, htmls, strict=True)],
+                )
 
             except TimeoutError:
                 continue
@@ -171,14 +358,8 @@ class LiveSession:
 
     async def _handle_event(self, data: dict[str, Any]) -> None:
         event_type = data.get("type", "")
-        target_id_str = data.get("target_id", "")
-
-        if not target_id_str.startswith("wtfui-"):
-            return
-
-        try:
-            element_id = int(target_id_str[6:])
-        except ValueError:
+        element_id = parse_target_id(data.get("target_id"))
+        if element_id is None:
             return
 
         handler = self._registry.get_handler(element_id, event_type)
@@ -190,10 +371,11 @@ class LiveSession:
         if event_type in ("input", "change") and "value" in data:
             args = (data["value"],)
 
-        if inspect.iscoroutinefunction(handler):
-            await handler(*args)
-        else:
-            handler(*args)
+        with batch():
+            if is_async_handler(handler):
+                await handler(*args)
+            else:
+                handler(*args)
 
     def stop(self) -> None:
         with self._lock:
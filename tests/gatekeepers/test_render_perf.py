@@ -0,0 +1,30 @@
+"""HTML render performance gatekeepers.
+
+HTMLRenderer walks the render tree recursively, appending to one shared
+list; this budget guards that walk on the same 10k-element tree the
+snapshot gatekeepers use.
+Run with: ./dev test:gate -k "render_perf"
+"""
+
+import time
+
+import pytest
+
+from tests.gatekeepers.test_snapshot_perf import ROWS, build_rows
+from wtfui.tui.builder import RenderTreeBuilder
+from wtfui.web.renderer.html import HTMLRenderer
+
+
+@pytest.mark.gatekeeper
+def test_html_render_latency():
+    """Gatekeeper: Rendering a built 10k-element tree to HTML takes <40ms."""
+    node = RenderTreeBuilder().build(build_rows())
+    renderer = HTMLRenderer()
+
+    start = time.perf_counter()
+    html = renderer.render_node(node)
+    elapsed = time.perf_counter() - start
+
+    assert html.count("<button") == ROWS
+    assert html.endswith("</div>")
+    assert elapsed < 0.040, f"HTML render took {elapsed * 1000:.1f}ms, expected <40ms"
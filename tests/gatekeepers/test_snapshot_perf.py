@@ -0,0 +1,72 @@
+"""VNode snapshot performance gatekeepers.
+
+VNode.from_element is one generic loop for every Element class; these
+budgets guard it so per-class specialization never becomes necessary.
+Run with: ./dev test:gate -k "snapshot_perf"
+"""
+
+import time
+
+import pytest
+
+from wtfui.core.vnode import VNode
+from wtfui.ui import Button, Div, Text, VStack
+
+ROWS = 2_500  # Four elements per row: 10,001 elements in total
+
+
+def build_rows(rows: int = ROWS) -> VStack:
+    with VStack() as root:
+        for i in range(rows):
+            with Div():
+                Text(f"row {i}")
+                Button("Edit")
+                Div()
+    return root
+
+
+def test_build_rows_element_count():
+    """The generated tree has the documented size."""
+    root = build_rows(rows=3)
+    assert len(root.children) == 3
+    assert [child.tag for child in root.children[0].children] == ["Text", "Button", "Div"]
+
+
+@pytest.mark.gatekeeper
+def test_cold_snapshot_latency():
+    """Gatekeeper: First snapshot of a 10k-element tree takes <50ms."""
+    root = build_rows()
+
+    start = time.perf_counter()
+    vnode = VNode.from_element(root)
+    elapsed = time.perf_counter() - start
+
+    assert len(vnode.children) == ROWS
+    assert vnode.children[0].children[0].props["content"] == "row 0"
+    assert elapsed < 0.050, f"Cold snapshot took {elapsed * 1000:.1f}ms, expected <50ms"
+
+
+@pytest.mark.gatekeeper
+def test_incremental_snapshot_and_reconcile_latency():
+    """Gatekeeper: One changed leaf re-snapshots and diffs a 10k tree in <5ms.
+
+    Unchanged subtrees return their cached VNode, and reconcile() skips
+    them by identity, so the cost follows the changed path rather than
+    the tree size.
+    """
+    from wtfui.core.patch import UpdatePropPatch
+    from wtfui.core.reconciler import reconcile
+
+    root = build_rows()
+    before = VNode.from_element(root)
+    row = root.children[ROWS // 2]
+
+    start = time.perf_counter()
+    row.children[2].set_style(width=10)
+    after = VNode.from_element(root)
+    patches = reconcile(before, after)
+    elapsed = time.perf_counter() - start
+
+    assert [type(p) for p in patches] == [UpdatePropPatch]
+    assert after.children[0] is before.children[0]
+    assert elapsed < 0.005, f"Incremental update took {elapsed * 1000:.2f}ms, expected <5ms"
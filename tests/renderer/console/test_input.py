@@ -66,6 +66,30 @@ def test_parse_enter():
     assert event.key == "enter"
 
 
+def test_common_keys_share_instances():
+    """Known sequences return the same immutable KeyEvent each time."""
+    assert parse_key_sequence("a") is parse_key_sequence("a")
+    assert parse_key_sequence("\x1b[A") is parse_key_sequence("\x1b[A")
+    assert parse_key_sequence(CTRL_C) is parse_key_sequence(CTRL_C)
+
+
+def test_key_event_is_immutable():
+    """Shared KeyEvents cannot be mutated by one consumer."""
+    import dataclasses
+
+    import pytest
+
+    event = parse_key_sequence("a")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        event.key = "b"  # type: ignore[misc]
+
+
+def test_unknown_sequence_still_parsed():
+    """Sequences outside the shared table fall back to a fresh KeyEvent."""
+    event = parse_key_sequence("é")
+    assert event == KeyEvent(key="é")
+
+
 # --- Mouse Input Tests (SGR 1006) ---
 
 
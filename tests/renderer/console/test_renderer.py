@@ -385,3 +385,53 @@ class TestLayoutResultDirectAccess:
         # Check that content was rendered at correct position
         cell = renderer.back_buffer.get(5, 3)
         assert cell.char == "H", f"Expected 'H' at (5,3), got '{cell.char}'"
+
+
+class TestIterativeTraversal:
+    """Tests for the stack-based render walk."""
+
+    def test_deep_tree_does_not_hit_recursion_limit(self):
+        """Deeply nested trees render without recursing per node."""
+        import sys
+
+        from wtfui.tui.layout.node import LayoutResult
+
+        renderer = ConsoleRenderer(width=20, height=5)
+        depth = sys.getrecursionlimit() + 100
+
+        root = RenderNode(tag="div", element_id=0, layout=LayoutResult(0, 0, 20, 5))
+        current = root
+        for i in range(1, depth):
+            child = RenderNode(tag="div", element_id=i, layout=LayoutResult(0, 0, 20, 5))
+            current.children.append(child)
+            current = child
+        current.text_content = "Deep"
+
+        renderer.render_node_with_layout(root)
+
+        assert renderer.back_buffer.get(0, 0).char == "D"
+
+    def test_later_siblings_paint_over_earlier(self):
+        """Children are drawn in document order so later siblings win."""
+        from wtfui.tui.layout.node import LayoutResult
+
+        renderer = ConsoleRenderer(width=20, height=5)
+        root = RenderNode(
+            tag="div",
+            element_id=0,
+            layout=LayoutResult(2, 1, 10, 2),
+            children=[
+                RenderNode(
+                    tag="Text", element_id=1, text_content="AAA", layout=LayoutResult(0, 0, 3, 1)
+                ),
+                RenderNode(
+                    tag="Text", element_id=2, text_content="B", layout=LayoutResult(1, 0, 1, 1)
+                ),
+            ],
+        )
+
+        renderer.render_node_with_layout(root)
+
+        assert renderer.back_buffer.get(2, 1).char == "A"
+        assert renderer.back_buffer.get(3, 1).char == "B"
+        assert renderer.back_buffer.get(4, 1).char == "A"
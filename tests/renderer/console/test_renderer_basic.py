@@ -42,6 +42,17 @@ def test_console_renderer_render_text():
     assert renderer.back_buffer.get(4, 0).char == "o"
 
 
+def test_console_renderer_render_text_applies_cls_to_every_cell():
+    """Class styles resolved once still apply to each character."""
+    renderer = ConsoleRenderer(width=80, height=24)
+    renderer.render_text_at(0, 0, "Hey", cls="text-red-500 bold")
+
+    cells = [renderer.back_buffer.get(x, 0) for x in range(3)]
+    assert [cell.char for cell in cells] == ["H", "e", "y"]
+    assert all(cell.fg == (239, 68, 68) and cell.bold for cell in cells)
+    assert cells[0] is not cells[1]
+
+
 def test_console_renderer_flush_produces_diff():
     """flush() generates ANSI output from buffer diff."""
     renderer = ConsoleRenderer(width=80, height=24)
@@ -21,3 +21,13 @@ def test_render_node_accepts_layout_result():
     assert node.layout.y == 20.0
     assert node.layout.width == 100.0
     assert node.layout.height == 50.0
+
+
+def test_render_node_uses_slots():
+    """RenderNode instances carry no per-instance __dict__."""
+    node = RenderNode(tag="div", element_id=1)
+
+    assert not hasattr(node, "__dict__")
+    assert node.props == {}
+    assert node.children == []
+    assert node.props is not RenderNode(tag="div", element_id=2).props
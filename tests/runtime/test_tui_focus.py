@@ -58,8 +58,8 @@ def test_tui_runtime_routes_key_to_focused_element():
         (),
         {"props": {"on_keydown": lambda key: received_keys.append(key)}},
     )()
-    runtime._registry._elements[12345] = mock_element
-    runtime.focused_element_id = 12345
+    runtime._registry.register(mock_element)
+    runtime.focused_element_id = id(mock_element)
 
     # Simulate key event
     event = KeyEvent(key="a", ctrl=False, alt=False, shift=False)
@@ -93,7 +93,7 @@ def test_tui_runtime_focus_on_click():
 
     runtime.layout_root = mock_layout
     runtime._layout_to_element[id(mock_layout)] = mock_element
-    runtime._registry._elements[id(mock_element)] = mock_element
+    runtime._registry.register(mock_element)
 
     # Simulate click (button=0 is left click)
     event = MouseEvent(x=5, y=0, button=0, pressed=True)
@@ -0,0 +1,259 @@
+"""Tests for WireCodec - WebSocket frame encoding negotiation."""
+
+import json
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from wtfui.core.component import component
+from wtfui.core.signal import Signal
+from wtfui.ui import Button, Div, Text
+from wtfui.web.server import codec
+from wtfui.web.server.app import create_app
+from wtfui.web.server.codec import WireCodec
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a Starlette WebSocket."""
+
+    def __init__(self, *messages):
+        self.messages = list(messages)
+        self.sent_json = []
+        self.sent_bytes = []
+        self.sent_text = []
+
+    async def receive(self):
+        return self.messages.pop(0)
+
+    async def send_json(self, data):
+        self.sent_json.append(data)
+
+    async def send_bytes(self, data):
+        self.sent_bytes.append(data)
+
+    async def send_text(self, data):
+        self.sent_text.append(data)
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run the JSON paths against orjson (when installed) and the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(codec, "orjson", None)
+    return request.param
+
+
+async def test_json_frames_round_trip_as_json(json_backend):
+    """Text frames are decoded as JSON and answered with JSON text frames."""
+    ws = FakeWebSocket({"type": "websocket.receive", "text": '{"type": "click"}'})
+    wire = WireCodec()
+
+    assert await wire.receive(ws) == {"type": "click"}
+    await wire.send(ws, {"op": "update_root", "html": "<p>caf\u00e9</p>"})
+
+    assert [json.loads(text) for text in ws.sent_text] == [
+        {"op": "update_root", "html": "<p>caf\u00e9</p>"}
+    ]
+    assert ws.sent_bytes == []
+
+
+async def test_event_frames_decode_with_orjson_when_available(monkeypatch):
+    """Text event frames go through orjson rather than the stdlib decoder."""
+    orjson_loads = pytest.importorskip("orjson").loads
+    decoded = []
+
+    def spy_loads(payload):
+        decoded.append(payload)
+        return orjson_loads(payload)
+
+    monkeypatch.setattr(codec.orjson, "loads", spy_loads)
+    frame = '{"type":"input","target_id":7,"target_key":"root:Input","value":"hi"}'
+    ws = FakeWebSocket({"type": "websocket.receive", "text": frame})
+
+    assert await WireCodec().receive(ws) == {
+        "type": "input",
+        "target_id": 7,
+        "target_key": "root:Input",
+        "value": "hi",
+    }
+    assert decoded == [frame]
+
+
+async def test_binary_json_frames_decode_without_msgpack(json_backend, monkeypatch):
+    """Without msgpack, binary frames are parsed as UTF-8 JSON."""
+    monkeypatch.setattr(codec, "msgpack", None)
+    frame = json.dumps({"type": "input", "value": "\u00e9"}).encode()
+    ws = FakeWebSocket({"type": "websocket.receive", "bytes": frame})
+    wire = WireCodec()
+
+    assert await wire.receive(ws) == {"type": "input", "value": "\u00e9"}
+    assert wire.binary is False
+
+
+async def test_disconnect_raises():
+    """A disconnect message surfaces as WebSocketDisconnect."""
+    ws = FakeWebSocket({"type": "websocket.disconnect", "code": 1001})
+
+    with pytest.raises(WebSocketDisconnect):
+        await WireCodec().receive(ws)
+
+
+async def test_binary_frames_switch_to_msgpack():
+    """Binary frames are decoded as MessagePack and answered in kind."""
+    msgpack = pytest.importorskip("msgpack")
+    frame = msgpack.packb({"type": "click", "target_id": "wtfui-1"}, use_bin_type=True)
+    ws = FakeWebSocket({"type": "websocket.receive", "bytes": frame})
+    wire = WireCodec()
+
+    assert await wire.receive(ws) == {"type": "click", "target_id": "wtfui-1"}
+    await wire.send(ws, {"op": "replace", "html": "<p>hi</p>"})
+
+    assert ws.sent_json == []
+    assert msgpack.unpackb(ws.sent_bytes[0], raw=False) == {"op": "replace", "html": "<p>hi</p>"}
+
+
+async def test_binary_sends_reuse_one_packer():
+    """Consecutive MessagePack frames come from the connection's own packer."""
+    msgpack = pytest.importorskip("msgpack")
+    ws = FakeWebSocket()
+    wire = WireCodec()
+    wire.binary = True
+    packer = wire._packer
+
+    await wire.send_replace(ws, "wtfui-1", "<b>1</b>", target_key="k")
+    await wire.send_replace(ws, "wtfui-2", "<b>2</b>")
+
+    assert wire._packer is packer
+    assert [msgpack.unpackb(frame, raw=False) for frame in ws.sent_bytes] == [
+        {"op": "replace", "target_id": "wtfui-1", "html": "<b>1</b>", "target_key": "k"},
+        {"op": "replace", "target_id": "wtfui-2", "html": "<b>2</b>"},
+    ]
+
+
+async def test_send_root_builds_valid_json():
+    """The prebuilt update_root envelope is valid JSON for any HTML."""
+    html = '<p class="x">Caf\u00e9 \\ "quoted"\n</p>'
+    ws = FakeWebSocket()
+
+    await WireCodec().send_root(ws, html)
+
+    assert json.loads(ws.sent_text[0]) == {"op": "update_root", "html": html}
+
+
+async def test_send_replace_builds_valid_json():
+    """The prebuilt replace envelope carries the target id and HTML."""
+    ws = FakeWebSocket()
+
+    await WireCodec().send_replace(ws, "wtfui-42", "<b>\t</b>")
+
+    assert json.loads(ws.sent_text[0]) == {
+        "op": "replace",
+        "target_id": "wtfui-42",
+        "html": "<b>\t</b>",
+    }
+
+
+async def test_send_replace_carries_target_key():
+    """Keyed replace patches include the stable element key."""
+    ws = FakeWebSocket()
+
+    await WireCodec().send_replace(ws, "wtfui-42", "<b></b>", target_key="root:Div:0:Text")
+
+    assert json.loads(ws.sent_text[0])["target_key"] == "root:Div:0:Text"
+
+
+async def test_send_replace_batch_builds_valid_json():
+    """A batch of replace patches is sent as a single JSON frame."""
+    ws = FakeWebSocket()
+
+    await WireCodec().send_replace_batch(ws, [("wtfui-1", "<i>\u00e9</i>"), ("wtfui-2", '"q"')])
+
+    assert json.loads(ws.sent_text[0]) == {
+        "op": "replace_batch",
+        "patches": [["wtfui-1", "<i>\u00e9</i>"], ["wtfui-2", '"q"']],
+    }
+
+
+async def test_send_root_uses_msgpack_for_binary_clients():
+    """Binary connections get the same patch as a MessagePack frame."""
+    msgpack = pytest.importorskip("msgpack")
+    ws = FakeWebSocket()
+    wire = WireCodec()
+    wire.binary = True
+
+    await wire.send_root(ws, "<p>hi</p>")
+
+    assert ws.sent_text == []
+    assert msgpack.unpackb(ws.sent_bytes[0], raw=False) == {
+        "op": "update_root",
+        "html": "<p>hi</p>",
+    }
+
+
+def test_msgpack_script_only_when_decoder_available():
+    """The page only loads the MessagePack client when the server can decode it."""
+    pytest.importorskip("msgpack")
+
+    @component
+    async def App():
+        with Div() as root:
+            Text("Hello")
+        return root
+
+    client = TestClient(create_app(App))
+    assert "@msgpack/msgpack" in client.get("/").text
+    assert codec.MSGPACK_SCRIPT
+
+
+def test_websocket_click_over_msgpack():
+    """A msgpack client receives binary update frames from the app."""
+    msgpack = pytest.importorskip("msgpack")
+    count = Signal(0)
+
+    @component
+    async def Counter():
+        with Div() as root:
+            Text(f"Count: {count.value}")
+            Button("Up", on_click=lambda: setattr(count, "value", count.value + 1))
+        return root
+
+    client = TestClient(create_app(Counter))
+    with client.websocket_connect("/ws") as websocket:
+        initial = websocket.receive_json()
+        button_id = re.findall(r'<button[^>]*id="(wtfui-\d+)"', initial["html"])[0]
+
+        websocket.send_bytes(
+            msgpack.packb({"type": "click", "target_id": button_id}, use_bin_type=True)
+        )
+        patch = msgpack.unpackb(websocket.receive_bytes(), raw=False)
+
+    assert patch["op"] == "update_prop"
+    assert patch["value"] == "Count: 1"
+
+
+def test_client_reuses_one_msgpack_codec():
+    """Both page scripts encode and decode frames with one long-lived codec each."""
+    from wtfui.web.server import app, session
+
+    for client_js in (app.CLIENT_JS, session.CLIENT_JS):
+        assert "new MessagePack.Encoder()" in client_js
+        assert "new MessagePack.Decoder()" in client_js
+        assert "MessagePack.decode(" not in client_js
+        assert "MessagePack.encode(" not in client_js
+
+
+def test_coalesce_events_keeps_latest_input_per_run():
+    """Runs of input events on one element collapse; other events are kept in order."""
+    events = [
+        {"type": "input", "target_id": 1, "value": "a"},
+        {"type": "input", "target_id": 1, "value": "ab"},
+        {"type": "click", "target_id": 2},
+        {"type": "click", "target_id": 2},
+        {"type": "input", "target_id": 1, "value": "abc"},
+    ]
+
+    assert codec.coalesce_events(events) == [events[1], events[2], events[3], events[4]]
@@ -63,3 +63,19 @@ def test_dom_renderer_no_warning_with_proxy_factory():
 
         # Should have no warnings
         assert len(w) == 0
+
+
+def test_dom_renderer_skips_spinner_animation_props():
+    """Spinner frames/interval are page-script data, not DOM attributes."""
+    from wtfui.ui.spinner import Spinner
+
+    mock_doc = MagicMock()
+    mock_el = MagicMock()
+    mock_doc.createElement.return_value = mock_el
+
+    renderer = DOMRenderer(document=mock_doc, proxy_factory=lambda x: x)
+    renderer.render(Spinner(frames=["A", "B"], interval_ms=120))
+
+    attrs = [call.args[0] for call in mock_el.setAttribute.call_args_list]
+    assert "frames" not in attrs
+    assert "interval_ms" not in attrs
@@ -64,6 +64,7 @@ def test_running_effect_context():
 
     effect = Effect(capture)
     assert captured[0] is effect
+    assert get_running_effect() is None
 
 
 def test_effect_thread_isolation():
@@ -154,6 +154,32 @@ def test_element_to_render_node_preserves_style():
     assert node.props["style"]["_wtfui_style"].color == "white"
 
 
+def test_render_features_are_recorded_per_class():
+    """Each element class records which optional render attributes it has."""
+    from wtfui.core.element import HAS_CONTENT, HAS_FRAME, HAS_LABEL, HAS_VALUE
+    from wtfui.ui import Button, Div, Input, Spinner, Text
+
+    assert Element._render_features == 0
+    assert Div._render_features == 0
+    assert Text._render_features == HAS_CONTENT
+    assert Button._render_features == HAS_LABEL
+    assert Input._render_features == HAS_VALUE
+    assert Spinner._render_features == HAS_FRAME
+
+
+def test_unslotted_subclass_keeps_render_attribute_probes():
+    """Subclasses with an instance __dict__ may gain render attributes at runtime."""
+    from wtfui.tui.builder import RenderTreeBuilder
+
+    class Badge(Element):
+        pass
+
+    badge = Badge()
+    badge.label = "new"
+
+    assert RenderTreeBuilder().build(badge).label == "new"
+
+
 class TestElementReactiveLayout:
     def test_to_reactive_layout_node_basic(self):
         """Element converts to ReactiveLayoutNode tree."""
@@ -235,6 +261,26 @@ def test_invalidate_layout_notifies_runtime_when_present():
         reset_runtime(token)
 
 
+def test_tui_runtime_declares_runtime_flags():
+    """TUIRuntime carries the protocol.Runtime flags that elements set."""
+    from wtfui.core.context import reset_runtime, set_current_runtime
+    from wtfui.tui.runtime import TUIRuntime
+
+    assert TUIRuntime.needs_rebuild is False
+    assert TUIRuntime.is_dirty is True
+
+    runtime = TUIRuntime(lambda: None)
+    runtime.is_dirty = False
+    token = set_current_runtime(runtime)
+    try:
+        Element().invalidate_layout()
+    finally:
+        reset_runtime(token)
+
+    assert runtime.needs_rebuild is True
+    assert runtime.is_dirty is True
+
+
 def test_invalidate_layout_works_without_runtime():
     """Element.invalidate_layout should not crash when no runtime is active."""
     from wtfui.core.context import reset_runtime, set_current_runtime
@@ -250,6 +296,165 @@ def test_invalidate_layout_works_without_runtime():
         reset_runtime(token)
 
 
+def test_invalidate_layout_bumps_version_up_the_tree():
+    """Invalidating an element bumps its version and every ancestor's."""
+    with Element() as root:
+        with Element() as branch:
+            leaf = Element()
+        sibling = Element()
+
+    before = (root._version, branch._version, leaf._version, sibling._version)
+    leaf.set_style(width=10)
+
+    assert root._version > before[0]
+    assert branch._version > before[1]
+    assert leaf._version > before[2]
+    assert sibling._version == before[3]
+
+
+def test_invalidate_layout_handles_deep_trees():
+    """Invalidation walks ancestors iteratively, so depth is not bounded by recursion."""
+    import sys
+    from contextlib import ExitStack
+
+    depth = sys.getrecursionlimit() + 100
+    with ExitStack() as stack:
+        root = stack.enter_context(Element())
+        for _ in range(depth):
+            leaf = stack.enter_context(Element())
+
+    before = root._version
+    leaf.invalidate_layout()
+    assert root._version == before + 1
+
+
+def test_invalidate_layout_reaches_duck_typed_root_container():
+    """A non-Element parent (like the TUI capture parent) is still notified."""
+    from wtfui.core.context import reset_parent, set_current_parent
+
+    class Capture:
+        def __init__(self):
+            self.children = []
+            self.invalidations = 0
+
+        def invalidate_layout(self):
+            self.invalidations += 1
+
+    capture = Capture()
+    token = set_current_parent(capture)
+    try:
+        with Element() as root:
+            child = Element()
+    finally:
+        reset_parent(token)
+
+    notified = capture.invalidations
+    child.set_style(width=1)
+    assert capture.invalidations == notified + 1
+    assert root.children == [child]
+
+
+def test_invalidate_layout_skips_flag_writes_on_flagged_runtime():
+    """An already-flagged runtime is left alone, but versions still bump."""
+    from wtfui.core.context import reset_runtime, set_current_runtime
+
+    class Runtime:
+        def __init__(self):
+            self.writes = []
+            self.needs_rebuild = False
+            self.is_dirty = False
+
+        def __setattr__(self, name, value):
+            if name != "writes":
+                self.writes.append(name)
+            object.__setattr__(self, name, value)
+
+    runtime = Runtime()
+    with Element() as root:
+        child = Element()
+
+    token = set_current_runtime(runtime)
+    try:
+        runtime.writes.clear()
+        child.set_style(width=1)
+        assert runtime.needs_rebuild is True
+        assert runtime.is_dirty is True
+        assert runtime.writes == ["needs_rebuild", "is_dirty"]
+
+        runtime.writes.clear()
+        before = root._version
+        child.set_style(width=2)
+        assert runtime.writes == []
+        assert root._version == before + 1
+    finally:
+        reset_runtime(token)
+
+
+def test_runtime_is_captured_once_per_tree():
+    """Children share the root's runtime reference and flag it from any thread."""
+    import threading
+
+    from wtfui.core.context import reset_runtime, set_current_runtime
+
+    class Runtime:
+        needs_rebuild = False
+        is_dirty = False
+
+    runtime = Runtime()
+    token = set_current_runtime(runtime)
+    try:
+        with Element() as root:
+            child = Element()
+    finally:
+        reset_runtime(token)
+
+    assert child._runtime_ref is root._runtime_ref
+    assert root._runtime_ref() is runtime
+
+    # Effects re-run on the scheduler thread, outside the runtime's context
+    worker = threading.Thread(target=child.set_style, kwargs={"width": 1})
+    worker.start()
+    worker.join()
+
+    assert runtime.needs_rebuild is True
+    assert runtime.is_dirty is True
+
+
+def test_children_built_in_with_block_invalidate_once_on_exit():
+    """Appends inside an open with-block defer invalidation to the block exit."""
+    with Element() as root:
+        with Element() as row:
+            for _ in range(5):
+                Element()
+            assert row._version == 0
+        assert row._version == 1
+        assert root._version == 1
+    assert root._version == 2
+
+
+def test_reopened_element_is_invalidated_on_exit():
+    """Adding children to an existing element through a with-block bumps its ancestors."""
+    with Element() as root:
+        container = Element()
+    before = root._version
+
+    with container:
+        Element()
+
+    assert container.children
+    assert root._version == before + 1
+
+
+def test_dom_id_is_cached_per_element():
+    """The wire DOM id is built once and reused for the element's lifetime."""
+    el = Element()
+    other = Element()
+
+    assert el.dom_id == f"wtfui-{id(el)}"
+    assert el.dom_id is el.dom_id
+    assert other.dom_id != el.dom_id
+
+
 def test_to_render_node_with_layout_passes_layout_directly():
     """Verify layout coordinates are passed as LayoutResult, not strings."""
     from wtfui.tui.builder import RenderTreeBuilder
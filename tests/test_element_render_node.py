@@ -98,3 +98,62 @@ class TestRenderNodeInputBinding:
 
         # Should reflect current signal value
         assert node.props["value"] == "updated"
+
+
+class TestOptionalAttributes:
+    """Optional element attributes are read once per build."""
+
+    def test_property_backed_attributes_evaluated_once(self):
+        """content and text_value properties are not evaluated twice."""
+        reads: list[str] = []
+
+        class Probe(Element):
+            __slots__ = ()
+
+            @property
+            def content(self):
+                reads.append("content")
+                return "hello"
+
+            @property
+            def text_value(self):
+                reads.append("text_value")
+                return ""
+
+        node = RenderTreeBuilder().build(Probe())
+
+        assert node.text_content == "hello"
+        assert node.props["value"] == ""
+        assert reads == ["content", "text_value"]
+
+    def test_falsy_content_and_label_are_skipped(self):
+        """Empty content or label leave the node fields unset."""
+
+        class Blank(Element):
+            __slots__ = ("content", "label")
+
+        blank = Blank()
+        blank.content = ""
+        blank.label = None
+
+        node = RenderTreeBuilder().build(blank)
+
+        assert node.text_content is None
+        assert node.label is None
+        assert "value" not in node.props
+
+
+class TestRenderNodeProps:
+    """The builder hands every renderer the element's props unclassified."""
+
+    def test_props_stay_raw_for_each_renderer(self):
+        """Layout values, handlers and attributes are copied as-is, not pre-rendered."""
+
+        def handler():
+            return None
+
+        el = Element(width=100, gap=2, on_click=handler, title='say "hi"')
+        node = RenderTreeBuilder().build(el)
+
+        assert node.props == {"width": 100, "gap": 2, "on_click": handler, "title": 'say "hi"'}
+        assert node.props is not el.props
@@ -58,6 +58,26 @@ class TestStableKeys:
 
         assert child1._internal_key == child2._internal_key
 
+    def test_internal_key_survives_the_data_key_round_trip(self):
+        """Keys are plain strings: rendered as data-key and sent back verbatim."""
+        import re
+
+        from wtfui.tui.builder import RenderTreeBuilder
+        from wtfui.web.renderer.html import HTMLRenderer
+        from wtfui.web.server.app import _index_keys
+
+        with Element(key="root") as root:
+            with Element():
+                leaf = Element()
+
+        tree = RenderTreeBuilder().build(root)
+        html = HTMLRenderer().render_node(tree)
+        keys = re.findall(r'data-key="([^"]+)"', html)
+
+        assert isinstance(leaf._internal_key, str)
+        assert leaf._internal_key in keys
+        assert _index_keys(tree)[leaf._internal_key] == id(leaf)
+
     def test_key_not_in_props(self):
         """Key is extracted from props, not stored in them."""
         el = Element(key="my-key", other="value")
@@ -121,6 +141,25 @@ class TestVNode:
         assert len(vnode.children[0].children) == 1
         assert vnode.children[0].children[0].key == "level2"
 
+    def test_vnode_snapshots_trees_deeper_than_recursion_limit(self):
+        """Snapshotting walks the tree iteratively, so depth is not bounded."""
+        import sys
+        from contextlib import ExitStack
+
+        from wtfui.core.vnode import VNode
+
+        depth = sys.getrecursionlimit() + 100
+        with ExitStack() as stack:
+            root = stack.enter_context(Element(key="root"))
+            for i in range(depth):
+                stack.enter_context(Element(key=f"n{i}"))
+
+        vnode = VNode.from_element(root)
+        for i in range(depth):
+            (vnode,) = vnode.children
+            assert vnode.key == f"n{i}"
+        assert vnode.children == []
+
     def test_vnode_uses_internal_key_when_no_explicit_key(self):
         """VNode uses _internal_key when element has no explicit key."""
         from wtfui.core.vnode import VNode
@@ -141,6 +180,149 @@ class TestVNode:
         # Text content should be in props or accessible
         assert "content" in vnode.props or vnode.props.get("_content") == "Hello"
 
+    def test_vnode_snapshot_is_reused_until_element_changes(self):
+        """Unchanged elements return their previous VNode; changes rebuild the path."""
+        from wtfui.core.scheduler import wait_for_scheduler
+        from wtfui.core.signal import Signal
+        from wtfui.core.vnode import VNode
+
+        label = Signal("a")
+        with Element(key="root") as root:
+            static = Element()
+            text = Text(label)
+
+        first = VNode.from_element(root)
+        assert VNode.from_element(root) is first
+
+        label.value = "b"
+        wait_for_scheduler()
+        second = VNode.from_element(root)
+        assert second is not first
+        assert second.children[0] is first.children[0]
+        assert second.children[1].props["content"] == "b"
+        assert static._vnode[1] is second.children[0]
+        assert text._vnode[1] is second.children[1]
+
+    def test_vnode_reuses_children_list_when_only_parent_changed(self):
+        """A parent whose children are all unchanged shares its previous children list."""
+        from wtfui.core.patch import UpdatePropPatch
+        from wtfui.core.reconciler import reconcile
+        from wtfui.core.vnode import VNode
+
+        with Element(key="box") as box:
+            first = Element(key="a")
+            Element(key="b")
+
+        before = VNode.from_element(box)
+        box.set_style(width=10)
+        after = VNode.from_element(box)
+
+        assert after is not before
+        assert after.children is before.children
+        assert [type(p) for p in reconcile(before, after)] == [UpdatePropPatch]
+
+        first.set_style(width=5)
+        changed = VNode.from_element(box)
+        assert changed.children is not after.children
+        assert changed.children[1] is after.children[1]
+
+    def test_vnode_snapshot_refreshes_after_in_place_props_edit(self):
+        """Editing element.props in place invalidates the cached snapshot."""
+        from wtfui.core.vnode import VNode
+
+        with Element(key="root") as root:
+            child = Element(key="child", width=1)
+
+        before = VNode.from_element(root)
+        child.props["width"] = 2
+        after = VNode.from_element(root)
+        assert after.children[0].props["width"] == 2
+
+        child.props.update(height=3)
+        assert VNode.from_element(root).children[0].props["height"] == 3
+
+        del child.props["height"]
+        assert "height" not in VNode.from_element(root).children[0].props
+        assert before.children[0].props == {"width": 1}
+
+    def test_vnode_snapshot_refreshes_after_key_change(self):
+        """Setting key or _internal_key after construction invalidates the snapshot."""
+        from wtfui.core.vnode import VNode
+
+        with Element(key="root") as root:
+            keyed = Element()
+            unkeyed = Element()
+
+        VNode.from_element(root)
+        keyed.key = "renamed"
+        assert VNode.from_element(root).children[0].key == "renamed"
+
+        unkeyed._internal_key = "generated"
+        assert VNode.from_element(root).children[1].key == "generated"
+
+    def test_vnode_snapshot_refreshes_after_children_edit(self):
+        """Direct edits to element.children invalidate the cached snapshot."""
+        from wtfui.core.vnode import VNode
+
+        with Element(key="root") as root:
+            with Element(key="box") as box:
+                first = Element(key="a")
+        extra = Element(key="b")
+
+        VNode.from_element(root)
+        box.children.append(extra)
+        assert [v.key for v in VNode.from_element(root).children[0].children] == ["a", "b"]
+
+        box.children.remove(first)
+        assert [v.key for v in VNode.from_element(root).children[0].children] == ["b"]
+
+        box.children = [first, extra]
+        assert [v.key for v in VNode.from_element(root).children[0].children] == ["a", "b"]
+
+        box.children.reverse()
+        assert [v.key for v in VNode.from_element(root).children[0].children] == ["b", "a"]
+
+    def test_vnode_snapshot_right_after_signal_write_sees_new_content(self):
+        """A snapshot taken before the Text's effect re-runs still reads the write."""
+        from wtfui.core.patch import UpdatePropPatch
+        from wtfui.core.reconciler import reconcile
+        from wtfui.core.signal import Signal
+        from wtfui.core.vnode import VNode
+
+        label = Signal("a")
+        with Element(key="root") as root:
+            Text(label)
+
+        before = VNode.from_element(root)
+        label.value = "b"
+        after = VNode.from_element(root)
+
+        assert after.children[0].props["content"] == "b"
+        patches = reconcile(before, after)
+        assert [(p.prop_name, p.value) for p in patches if isinstance(p, UpdatePropPatch)] == [
+            ("content", "b")
+        ]
+
+    def test_vnode_snapshot_copies_props(self):
+        """In-place edits of element.props never rewrite an earlier snapshot."""
+        from wtfui.core.patch import UpdatePropPatch
+        from wtfui.core.reconciler import reconcile
+        from wtfui.core.vnode import VNode
+
+        el = Element(key="box", width=10)
+        before = VNode.from_element(el)
+        assert before.props is not el.props
+
+        el.set_style(width=20)
+        after = VNode.from_element(el)
+
+        assert before.props == {"width": 10}
+        assert after.props == {"width": 20}
+        patches = reconcile(before, after)
+        assert [(p.prop_name, p.value) for p in patches if isinstance(p, UpdatePropPatch)] == [
+            ("width", 20)
+        ]
+
 
 class TestPatches:
     """Phase 4: Patch types for granular DOM updates."""
@@ -298,6 +480,48 @@ class TestReconciler:
         assert patches[0].prop_name == "class"
         assert patches[0].value is None
 
+    def test_reconcile_swapped_prop_reports_add_and_remove(self):
+        """A prop replaced by another (same prop count) patches both names."""
+        from wtfui.core.reconciler import reconcile
+        from wtfui.core.vnode import VNode
+
+        old = VNode(key="el", tag="Div", props={"id": "x", "title": "a"}, children=[])
+        new = VNode(key="el", tag="Div", props={"id": "x", "role": "b"}, children=[])
+
+        patches = reconcile(old, new)
+        assert [(p.prop_name, p.value) for p in patches] == [("role", "b"), ("title", None)]
+
+    def test_update_prop_patch_reuses_prop_name_objects(self):
+        """Patches carry the snapshot's own key strings, not copies."""
+        from wtfui.core.reconciler import reconcile
+        from wtfui.core.vnode import VNode
+
+        name = "".join(["data-", "count"])  # built at runtime, so not interned
+        old = VNode(key="el", tag="Div", props={name: 1}, children=[])
+        new = VNode(key="el", tag="Div", props={name: 2}, children=[])
+
+        (patch,) = reconcile(old, new)
+        assert patch.prop_name is name
+
+    def test_old_children_key_index_is_reused(self):
+        """The old snapshot keeps its child key index across diffs."""
+        from wtfui.core.patch import CreatePatch, MovePatch
+        from wtfui.core.reconciler import reconcile
+        from wtfui.core.vnode import VNode
+
+        a, b = VNode(key="a", tag="Li", props={}), VNode(key="b", tag="Li", props={})
+        old = VNode(key="ul", tag="Ul", props={}, children=[a, b])
+        assert old._children_key_index is None
+
+        reconcile(old, VNode(key="ul", tag="Ul", props={}, children=[b, a]))
+        index = old._children_key_index
+        assert index == {"a": 0, "b": 1}
+
+        c = VNode(key="c", tag="Li", props={})
+        patches = reconcile(old, VNode(key="ul", tag="Ul", props={}, children=[a, c, b]))
+        assert old._children_key_index is index
+        assert [type(p) for p in patches] == [CreatePatch, MovePatch]
+
     def test_reconcile_added_child_creates(self):
         """Added children produce CreatePatch."""
         from wtfui.core.patch import CreatePatch
@@ -339,6 +563,72 @@ class TestReconciler:
         # Should update prop, not replace
         assert any(isinstance(p, UpdatePropPatch) and p.prop_name == "text" for p in patches)
 
+    def test_reconcile_identical_vnode_is_empty(self):
+        """Reconciling a snapshot against itself produces no patches."""
+        from wtfui.core.reconciler import reconcile
+        from wtfui.core.vnode import VNode
+
+        child = VNode(key="c1", tag="Span", props={"text": "same"}, children=[])
+        node = VNode(key="parent", tag="Div", props={"nan": float("nan")}, children=[child])
+
+        assert reconcile(node, node) == []
+
+    def test_reconcile_skips_shared_subtrees(self, monkeypatch):
+        """Children shared between old and new trees are not descended into."""
+        from wtfui.core import reconciler
+        from wtfui.core.vnode import VNode
+
+        shared = VNode(key="shared", tag="Span", props={}, children=[])
+        old = VNode(key="p", tag="Div", props={"v": 1}, children=[shared])
+        new = VNode(key="p", tag="Div", props={"v": 2}, children=[shared])
+
+        visited = []
+        original = reconciler._diff_props
+
+        def spy(old_node, new_node, patches):
+            visited.append(old_node.key)
+            original(old_node, new_node, patches)
+
+        monkeypatch.setattr(reconciler, "_diff_props", spy)
+        patches = reconciler.reconcile(old, new)
+
+        assert visited == ["p"]
+        assert len(patches) == 1
+
+    def test_reconcile_same_key_order_only_diffs_props(self):
+        """Children keyed in the same order are paired without moves."""
+        from wtfui.core.patch import MovePatch, UpdatePropPatch
+        from wtfui.core.reconciler import reconcile
+        from wtfui.core.vnode import VNode
+
+        def tree(value):
+            children = [
+                VNode(key=f"c{i}", tag="Span", props={"v": value if i == 1 else 0})
+                for i in range(3)
+            ]
+            return VNode(key="parent", tag="Div", props={}, children=children)
+
+        patches = reconcile(tree(1), tree(2))
+
+        assert [(p.target_key, p.value) for p in patches] == [("c1", 2)]
+        assert all(isinstance(p, UpdatePropPatch) for p in patches)
+        assert not any(isinstance(p, MovePatch) for p in patches)
+
+    def test_reconcile_reordered_children_move(self):
+        """Reordered keyed children produce moves rather than replacements."""
+        from wtfui.core.patch import MovePatch
+        from wtfui.core.reconciler import reconcile
+        from wtfui.core.vnode import VNode
+
+        a = VNode(key="a", tag="Span", props={})
+        b = VNode(key="b", tag="Span", props={})
+        old = VNode(key="parent", tag="Div", props={}, children=[a, b])
+        new = VNode(key="parent", tag="Div", props={}, children=[b, a])
+
+        moves = [(p.target_key, p.new_index) for p in reconcile(old, new)]
+        assert moves == [("b", 0), ("a", 1)]
+        assert all(isinstance(p, MovePatch) for p in reconcile(old, new))
+
 
 class TestPatchSerialization:
     """Patches can be serialized to JSON for WebSocket transport."""
@@ -184,6 +184,56 @@ def test_style_shadow_converts_to_box_shadow():
     assert "box-shadow:" in html, f"Box-shadow not found: {html}"
 
 
+def test_style_tokens_fall_back_to_raw_css_values():
+    """Unknown color, size, radius and shadow tokens pass through unchanged."""
+    from wtfui.core.style import Style
+
+    style = Style(
+        bg="#123456",
+        color="slate-500",
+        font_size="13px",
+        border=True,
+        border_color="rebeccapurple",
+        rounded="3px",
+        shadow="none",
+    )
+
+    assert "; ".join(HTMLRenderer()._style_to_css(style)) == (
+        "background-color: #123456; color: #64748b; font-size: 13px; "
+        "border: 1px solid rebeccapurple; border-radius: 3px; box-shadow: none"
+    )
+
+
+def test_style_declarations_keep_cascade_order():
+    """Style fields emit in a fixed order so later shorthands override earlier ones."""
+    from wtfui.core.style import Style
+
+    style = Style(
+        bg="white",
+        font_size="lg",
+        w=100,
+        w_full=True,
+        p=0,
+        px=2,
+        pt=1,
+        mr=3,
+        gap=4,
+        opacity=0.5,
+        border_top=True,
+        border_left=True,
+        rounded="full",
+        text_align="",
+    )
+
+    assert "; ".join(HTMLRenderer()._style_to_css(style)) == (
+        "background-color: #ffffff; font-size: 1.125rem; opacity: 0.5; width: 100px; "
+        "width: 100%; padding: 0px; padding-left: 2px; padding-right: 2px; "
+        "padding-top: 1px; margin-right: 3px; gap: 4px; border-top: 1px solid #e2e8f0; "
+        "border-left: 1px solid #e2e8f0; border-radius: 9999px"
+    )
+    assert HTMLRenderer()._style_to_css(Style()) == ()
+
+
 def test_layout_props_convert_to_css_not_html_attrs():
     """Layout props like flex_direction must become CSS, not HTML attributes.
 
@@ -260,6 +310,15 @@ def test_box_defaults_to_flex_column():
     assert "flex-direction: column" in html, f"flex-direction: column not found: {html}"
 
 
+def test_hstack_defaults_to_flex_row_once():
+    """HStack gets the row defaults, and explicit flex props do not repeat display: flex."""
+    html = HTMLRenderer().render_node(
+        RenderNode(tag="HStack", element_id=1, props={"gap": 4}, children=[])
+    )
+
+    assert 'style="display: flex; flex-direction: row; gap: 4px"' in html
+
+
 def test_text_renders_as_inline_span():
     """Text elements should render as span (inline).
 
@@ -278,3 +337,214 @@ def test_text_renders_as_inline_span():
 
     # Should be a span for inline semantics
     assert html.startswith("<span"), f"Expected span tag: {html}"
+
+
+def test_spinner_ships_frames_for_client_animation():
+    """Spinners render their frame list and interval as data attributes."""
+    from wtfui.ui.spinner import Spinner
+
+    html = HTMLRenderer().render(Spinner(frames=["-", '"'], interval_ms=120))
+
+    assert 'data-frames="[&quot;-&quot;, &quot;\\&quot;&quot;]"' in html
+    assert 'data-interval="120"' in html
+    assert html.endswith(">-</div>")
+
+
+def test_nested_nodes_render_in_document_order():
+    """Siblings and nested children are emitted in order with matching close tags."""
+    leaf = RenderNode(tag="Text", element_id=3, props={}, children=[], text_content="a<b")
+    button = RenderNode(tag="Button", element_id=4, props={}, children=[], label="Go")
+    inner = RenderNode(tag="Div", element_id=2, props={}, children=[leaf, button])
+    field = RenderNode(tag="Input", element_id=5, props={}, children=[])
+    outer = RenderNode(tag="Div", element_id=1, props={}, children=[inner, field])
+
+    assert HTMLRenderer().render_node(outer) == (
+        '<div id="wtfui-1"><div id="wtfui-2">'
+        '<span id="wtfui-3">a&lt;b</span><button id="wtfui-4">Go</button>'
+        '</div><input id="wtfui-5" /></div>'
+    )
+
+
+def test_plain_style_dict_keys_become_kebab_case():
+    """camelCase inline style keys are emitted as CSS property names."""
+    node = RenderNode(
+        tag="Div",
+        element_id=1,
+        props={"style": {"backgroundColor": "red", "borderTopLeftRadius": "4px", "color": "blue"}},
+        children=[],
+    )
+
+    html = HTMLRenderer().render_node(node)
+
+    assert 'style="background-color: red; border-top-left-radius: 4px; color: blue"' in html
+
+
+def test_inline_display_flex_is_not_repeated():
+    """A style dict that already sets display: flex is not given a second one."""
+    node = RenderNode(
+        tag="Div",
+        element_id=1,
+        props={"gap": 2, "style": {"display": "flex", "color": "red"}},
+        children=[],
+    )
+
+    html = HTMLRenderer().render_node(node)
+
+    assert 'style="gap: 2px; display: flex; color: red"' in html
+
+
+def test_render_text_escapes_each_special_character():
+    """Every HTML-special character is escaped, and plain text passes through."""
+    renderer = HTMLRenderer()
+
+    assert renderer.render_text("plain text 42") == "plain text 42"
+    for char, entity in [("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;")]:
+        assert renderer.render_text(f"a{char}b") == f"a{entity}b"
+    assert renderer.render_text("it's") == "it&#x27;s"
+
+
+def test_render_node_reflects_in_place_edits():
+    """render_node keeps no per-node cache, so edits to a node show on the next call."""
+    renderer = HTMLRenderer()
+    text = RenderNode(tag="Text", element_id=2, props={}, children=[], text_content="old")
+    node = RenderNode(tag="Div", element_id=1, props={"title": "a"}, children=[text])
+    assert renderer.render_node(node) == (
+        '<div id="wtfui-1" title="a"><span id="wtfui-2">old</span></div>'
+    )
+
+    node.props["title"] = "b"
+    text.text_content = "new"
+
+    assert renderer.render_node(node) == (
+        '<div id="wtfui-1" title="b"><span id="wtfui-2">new</span></div>'
+    )
+
+
+def test_layout_positions_truncate_to_whole_pixels():
+    """Computed layout becomes one absolute-position block in whole pixels."""
+    from wtfui.tui.layout.node import LayoutResult
+
+    node = RenderNode(
+        tag="Div",
+        element_id=1,
+        props={},
+        children=[],
+        layout=LayoutResult(x=3.5, y=10.0, width=200.75, height=1.0),
+    )
+
+    html = HTMLRenderer().render_node(node)
+
+    assert 'style="position: absolute; top: 10px; left: 3px; width: 200px; height: 1px"' in html
+
+
+def test_void_tags_can_be_extended_by_subclasses():
+    """Subclasses can add void elements, which then render self-closing."""
+    from typing import ClassVar
+
+    class BreakRenderer(HTMLRenderer):
+        TAG_MAP: ClassVar[dict[str, str]] = {**HTMLRenderer.TAG_MAP, "Break": "wbr"}
+        VOID_TAGS: ClassVar[frozenset[str]] = HTMLRenderer.VOID_TAGS | {"wbr"}
+
+    renderer = BreakRenderer()
+
+    assert renderer.render_node(RenderNode(tag="Break", element_id=1)) == '<wbr id="wtfui-1" />'
+    assert renderer.render_node(RenderNode(tag="Div", element_id=2)) == '<div id="wtfui-2"></div>'
+
+
+def test_props_classify_into_attributes_and_css():
+    """Handlers are dropped, booleans toggle bare attributes, layout props become CSS."""
+    node = RenderNode(
+        tag="Button",
+        element_id=1,
+        props={
+            "on_click": lambda: None,
+            "disabled": True,
+            "hidden": False,
+            "title": None,
+            "width": 2.5,
+            "height": "50%",
+            "flex_grow": 1,
+        },
+        children=[],
+    )
+
+    html = HTMLRenderer().render_node(node)
+
+    assert html == (
+        '<button id="wtfui-1" disabled style="width: 2.5px; height: 50%; flex-grow: 1"></button>'
+    )
+
+
+def test_kebab_cache_reuses_results_and_stays_bounded(monkeypatch):
+    """Converted style keys are memoized, and the memo is cleared once it fills."""
+    from wtfui.web.renderer import html as html_module
+
+    monkeypatch.setattr(html_module, "_kebab_cache", {})
+    monkeypatch.setattr(html_module, "_KEBAB_CACHE_SIZE", 2)
+
+    first = html_module._to_kebab("marginTop")
+    assert html_module._to_kebab("marginTop") is first
+    html_module._to_kebab("paddingLeft")
+    assert html_module._to_kebab("zIndex") == "z-index"
+    assert html_module._kebab_cache == {"zIndex": "z-index"}
+
+
+def test_flex_props_prepend_display_flex_before_inline_overrides():
+    """display: flex leads the style, so an inline display value still wins."""
+    node = RenderNode(
+        tag="Div",
+        element_id=1,
+        props={"style": {"display": "grid"}, "gap": 2},
+        children=[],
+    )
+
+    html = HTMLRenderer().render_node(node)
+
+    assert 'style="display: flex; display: grid; gap: 2px"' in html
+
+
+def test_executor_renders_wide_children_in_order():
+    """With an executor, wide fan-outs render on it and match the serial output."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    rows = [
+        RenderNode(
+            tag="Div",
+            element_id=10 + i,
+            children=[RenderNode(tag="Text", element_id=100 + i, text_content=f"row {i}")],
+        )
+        for i in range(HTMLRenderer.PARALLEL_BATCHES)
+    ]
+    root = RenderNode(
+        tag="VStack", element_id=1, children=[RenderNode(tag="Div", element_id=2, children=rows)]
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        submitted = []
+        original_map = pool.map
+
+        def spy_map(fn, *iterables):
+            submitted.append(len(iterables[0]))
+            return original_map(fn, *iterables)
+
+        pool.map = spy_map
+        parallel = HTMLRenderer(executor=pool).render_node(root)
+
+    assert submitted == [HTMLRenderer.PARALLEL_BATCHES]
+    assert parallel == HTMLRenderer().render_node(root)
+
+
+def test_style_css_is_computed_once_per_style_object():
+    """A Style's declarations are memoized on it without affecting equality or merging."""
+    from wtfui.core.style import Style
+
+    renderer = HTMLRenderer()
+    style = Style(bg="white", p=4)
+
+    first = renderer._style_to_css(style)
+
+    assert renderer._style_to_css(style) is first
+    assert style == Style(bg="white", p=4)
+    assert hash(style) == hash(Style(bg="white", p=4))
+    merged = style | Style(p=8)
+    assert renderer._style_to_css(merged) == ("background-color: #ffffff", "padding: 8px")
@@ -1,6 +1,7 @@
 # tests/test_rpc_endpoint.py
 """Tests for RPC endpoint in FastAPI server."""
 
+import pytest
 from fastapi.testclient import TestClient
 
 from wtfui.core.component import component
@@ -59,3 +60,41 @@ def test_rpc_endpoint_with_string_result():
 
     assert response.status_code == 200
     assert response.json() == "Hello, World!"
+
+
+def test_rpc_endpoint_decodes_body_with_orjson(monkeypatch):
+    """RPC request bodies are parsed by orjson rather than the stdlib decoder."""
+    from wtfui.web.rpc import encoder
+
+    orjson_loads = pytest.importorskip("orjson").loads
+    decoded = []
+
+    def spy_loads(payload):
+        decoded.append(payload)
+        return orjson_loads(payload)
+
+    monkeypatch.setattr(encoder.orjson, "loads", spy_loads)
+    RpcRegistry.clear()
+
+    @rpc
+    async def add(a: int, b: int) -> int:
+        return a + b
+
+    client = TestClient(create_app(DummyApp))
+    response = client.post("/api/rpc/add", content=b'{"a":2,"b":3}')
+
+    assert response.json() == 5
+    assert decoded == [b'{"a":2,"b":3}']
+
+
+def test_rpc_endpoint_empty_body_calls_without_arguments():
+    """A bodyless POST still calls the function with no arguments."""
+    RpcRegistry.clear()
+
+    @rpc
+    async def ping() -> str:
+        return "pong"
+
+    client = TestClient(create_app(DummyApp))
+
+    assert client.post("/api/rpc/ping").json() == "pong"
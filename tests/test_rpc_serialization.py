@@ -8,7 +8,10 @@ from decimal import Decimal
 from enum import Enum
 from uuid import UUID, uuid4
 
-from wtfui.web.rpc.encoder import WtfUIJSONEncoder
+import pytest
+
+from wtfui.web.rpc import encoder
+from wtfui.web.rpc.encoder import WtfUIJSONEncoder, wtfui_json_dumpb, wtfui_json_dumps
 
 
 class Status(Enum):
@@ -91,3 +94,177 @@ def test_encoder_handles_nested_dataclass():
 
     assert parsed["user"]["name"] == "Bob"
     assert "99.99" in parsed["total"]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run wtfui_json_dumpb against orjson (when installed) and the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(encoder, "orjson", None)
+    return request.param
+
+
+def test_dumpb_returns_bytes(json_backend):
+    """wtfui_json_dumpb produces UTF-8 JSON bytes."""
+    result = wtfui_json_dumpb({"a": 1})
+    assert isinstance(result, bytes)
+    assert json.loads(result) == {"a": 1}
+
+
+def test_dumpb_matches_encoder_semantics(json_backend):
+    """Both backends serialize rich types the same way as WtfUIJSONEncoder."""
+
+    @dataclass
+    class Invoice:
+        id: UUID
+        status: Status
+        total: Decimal
+        issued: date
+        blob: bytes
+        tags: frozenset[str]
+
+    invoice = Invoice(
+        id=UUID("12345678-1234-5678-1234-567812345678"),
+        status=Status.ACTIVE,
+        total=Decimal("19.99"),
+        issued=date(2025, 12, 2),
+        blob=b"hi",
+        tags=frozenset({"x"}),
+    )
+    payload = {"invoice": invoice, 1: "int key", "when": datetime(2025, 12, 2, 14, 30)}
+
+    expected = json.loads(json.dumps(payload, cls=WtfUIJSONEncoder))
+    assert json.loads(wtfui_json_dumpb(payload)) == expected
+
+
+def test_dumpb_rejects_unknown_types(json_backend):
+    """Unsupported objects raise TypeError on both backends."""
+    with pytest.raises(TypeError):
+        wtfui_json_dumpb({"obj": object()})
+
+
+def test_dumpb_handles_integers_beyond_64_bits(json_backend):
+    """Big integers serialize on both backends, as json.dumps does."""
+    payload = {"big": 2**70, "small": -(2**70)}
+
+    assert json.loads(wtfui_json_dumpb(payload)) == payload
+
+
+def test_dumpb_ignores_style_render_memo(json_backend):
+    """A rendered Style serializes exactly like a fresh one on both backends."""
+    from wtfui.core.style import Style
+    from wtfui.web.renderer.html import HTMLRenderer
+
+    style = Style(bg="white", p=4)
+    before = json.loads(wtfui_json_dumpb(style))
+
+    HTMLRenderer()._style_to_css(style)
+
+    assert json.loads(wtfui_json_dumpb(style)) == before
+    assert json.loads(wtfui_json_dumps(style)) == before
+    assert "_css_cache" not in before
+
+
+def test_encoder_caches_dataclass_field_names():
+    """Field names are resolved once per dataclass type."""
+    user = User(id=uuid4(), name="Cara", created_at=datetime(2025, 1, 1))
+
+    json.dumps([user, user], cls=WtfUIJSONEncoder)
+
+    assert encoder._FIELD_CACHE[User] == ("id", "name", "created_at")
+
+
+def test_encoder_handles_subclassed_field_values():
+    """Values whose type is a subclass still serialize via isinstance fallback."""
+
+    class Stamp(datetime):
+        pass
+
+    @dataclass
+    class Event:
+        at: Stamp
+        status: Status
+
+    result = json.loads(
+        json.dumps(Event(at=Stamp(2025, 1, 2), status=Status.INACTIVE), cls=WtfUIJSONEncoder)
+    )
+
+    assert result == {"at": "2025-01-02T00:00:00", "status": "inactive"}
+
+
+def test_encoder_handles_dataclasses_inside_containers():
+    """Dataclasses nested in lists, tuples and dicts are encoded recursively."""
+
+    @dataclass
+    class Team:
+        members: list[User]
+        by_role: dict[str, tuple[User, ...]]
+
+    alice = User(id=UUID(int=1), name="Alice", created_at=datetime(2025, 1, 1))
+    team = Team(members=[alice], by_role={"lead": (alice,)})
+
+    parsed = json.loads(json.dumps(team, cls=WtfUIJSONEncoder))
+
+    assert parsed["members"][0]["name"] == "Alice"
+    assert parsed["by_role"]["lead"][0]["id"] == str(UUID(int=1))
+    assert parsed["by_role"]["lead"][0]["created_at"] == "2025-01-01T00:00:00"
+
+
+def test_encoder_exact_type_dispatch_matches_fallback():
+    """Exact-type fast path and isinstance fallback agree for every rich type."""
+    enc = WtfUIJSONEncoder()
+
+    class MyBytes(bytes):
+        pass
+
+    class MySet(set):
+        pass
+
+    assert enc.default(b"\x00\x01") == enc.default(MyBytes(b"\x00\x01")) == "AAE="
+    assert sorted(enc.default({1, 2})) == sorted(enc.default(MySet({1, 2}))) == [1, 2]
+    assert enc.default(Decimal("1.50")) == "1.50"
+    assert enc.default(frozenset({"a"})) == ["a"]
+
+
+def test_encoder_passes_primitive_fields_through(json_backend):
+    """Primitive dataclass fields are emitted as-is, without conversion."""
+
+    @dataclass
+    class Row:
+        count: int
+        ratio: float
+        label: str
+        active: bool
+        note: None
+
+    row = Row(count=3, ratio=0.5, label="x", active=True, note=None)
+
+    assert WtfUIJSONEncoder()._encode_dataclass(row) == {
+        "count": 3,
+        "ratio": 0.5,
+        "label": "x",
+        "active": True,
+        "note": None,
+    }
+    assert json.loads(wtfui_json_dumpb({1: row})) == {
+        "1": {"count": 3, "ratio": 0.5, "label": "x", "active": True, "note": None}
+    }
+
+
+def test_dumps_reuses_shared_encoder(monkeypatch):
+    """Default dumps calls go through the module encoder; options build a new one."""
+    calls = []
+
+    class SpyEncoder(WtfUIJSONEncoder):
+        def encode(self, o):
+            calls.append(o)
+            return super().encode(o)
+
+    monkeypatch.setattr(encoder, "_ENCODER", SpyEncoder())
+
+    assert wtfui_json_dumps({"a": 1}) == '{"a": 1}'
+    assert calls == [{"a": 1}]
+    assert wtfui_json_dumps({"b": 2, "a": 1}, sort_keys=True) == '{"a": 1, "b": 2}'
+    assert calls == [{"a": 1}]
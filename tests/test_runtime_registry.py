@@ -1,6 +1,6 @@
 """Tests for element registry and event routing."""
 
-from wtfui.core.registry import ElementRegistry
+from wtfui.core.registry import ElementRegistry, is_async_handler
 from wtfui.ui import Button, Div
 
 
@@ -63,3 +63,72 @@ def test_registry_builds_from_tree():
     assert registry.get(id(root)) is root
     assert registry.get(id(btn1)) is btn1
     assert registry.get(id(btn2)) is btn2
+
+
+def test_registry_spreads_elements_across_shards():
+    """Aligned object ids still land in more than one shard."""
+    registry = ElementRegistry()
+
+    with Div() as root:
+        for i in range(64):
+            Button(f"B{i}")
+
+    registry.register_tree(root)
+
+    assert len(registry) == 65
+    assert sum(1 for shard in registry._shards if shard) > 1
+
+
+def test_registry_concurrent_register_and_get():
+    """Concurrent writers and readers see every registered element."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    registry = ElementRegistry()
+    buttons = [Button(f"B{i}") for i in range(400)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(registry.register, buttons))
+        found = list(pool.map(lambda b: registry.get(id(b)), buttons))
+
+    assert found == buttons
+    assert len(registry) == 400
+
+
+def test_registry_registers_deep_tree():
+    """Trees deeper than the recursion limit register without recursion."""
+    import sys
+
+    registry = ElementRegistry()
+    root = Div()
+    current = root
+    depth = sys.getrecursionlimit() + 50
+    for _ in range(depth):
+        child = Div()
+        current.children.append(child)
+        current = child
+
+    registry.register_tree(root)
+
+    assert len(registry) == depth + 1
+    assert registry.get(id(current)) is current
+
+
+def test_is_async_handler_classifies_once():
+    """Handler kind is cached per function, shared by its bound methods."""
+    from wtfui.core import registry as registry_module
+
+    async def on_async():
+        pass
+
+    def on_sync():
+        pass
+
+    class Widget:
+        async def handle(self):
+            pass
+
+    assert is_async_handler(on_async) is True
+    assert is_async_handler(on_sync) is False
+    assert is_async_handler(Widget().handle) is True
+    assert registry_module._ASYNC_HANDLERS[Widget.handle] is True
+    assert is_async_handler(print) is False
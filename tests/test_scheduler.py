@@ -1,8 +1,11 @@
 import threading
 import time
 
+import pytest
+
+from wtfui.core.computed import Computed
 from wtfui.core.effect import Effect
-from wtfui.core.scheduler import schedule_effect, wait_for_scheduler
+from wtfui.core.scheduler import batch, schedule_effect, wait_for_scheduler
 from wtfui.core.signal import Signal
 
 
@@ -52,3 +55,126 @@ def test_scheduler_waits_for_execution():
     # If scheduler signals idle too early (e.g. on pop), this will fail
     wait_for_scheduler(timeout=1.0)
     assert flag is True
+
+
+def test_batch_notifies_subscribers_once_on_exit():
+    """Writes inside a batch notify each subscriber once, after the batch."""
+    a = Signal(0)
+    b = Signal(0)
+    calls: list[tuple[int, int]] = []
+
+    def on_change():
+        calls.append((a.value, b.value))
+
+    a.subscribe(on_change)
+    b.subscribe(on_change)
+
+    with batch():
+        a.value = 1
+        b.value = 2
+        a.value = 3
+        assert calls == []
+
+    assert calls == [(3, 2)]
+
+
+def test_batch_runs_effects_once():
+    """An effect read by several written signals is scheduled once per batch."""
+    a = Signal(0)
+    b = Signal(0)
+    runs: list[tuple[int, int]] = []
+
+    effect = Effect(lambda: runs.append((a.value, b.value)))
+    runs.clear()
+
+    with batch():
+        a.value = 1
+        b.value = 1
+        a.value = 2
+    wait_for_scheduler()
+
+    assert runs == [(2, 1)]
+    assert effect
+
+
+def test_batch_reads_are_current():
+    """Values and computeds reflect writes made earlier in the same batch."""
+    count = Signal(1)
+    doubled = Computed(lambda: count.value * 2)
+    assert doubled() == 2
+
+    with batch():
+        count.value = 5
+        assert count.value == 5
+        assert doubled() == 10
+
+
+def test_nested_batches_flush_at_outermost_exit():
+    """An inner batch joins the outer one instead of flushing on its own."""
+    sig = Signal(0)
+    calls: list[int] = []
+    sig.subscribe(lambda: calls.append(sig.value))
+
+    with batch():
+        with batch():
+            sig.value = 1
+        assert calls == []
+        sig.value = 2
+
+    assert calls == [2]
+
+
+def test_batch_flushes_when_body_raises():
+    """Writes made before an exception still notify their subscribers."""
+    sig = Signal(0)
+    calls: list[int] = []
+    sig.subscribe(lambda: calls.append(sig.value))
+
+    with pytest.raises(RuntimeError), batch():
+        sig.value = 1
+        raise RuntimeError("boom")
+
+    assert calls == [1]
+
+
+def test_batch_raising_subscriber_does_not_wedge_effects():
+    """A failing subscriber neither skips the others nor the batched effects."""
+    sig = Signal(0)
+    runs: list[int] = []
+    calls: list[int] = []
+
+    def explode():
+        raise ValueError("subscriber")
+
+    unsubscribe = sig.subscribe(explode)
+    sig.subscribe(lambda: calls.append(sig.value))
+    effect = Effect(lambda: runs.append(sig.value))
+    runs.clear()
+
+    with pytest.raises(ValueError), batch():
+        sig.value = 1
+    wait_for_scheduler()
+
+    assert calls == [1]
+    assert runs == [1]
+
+    unsubscribe()
+    sig.value = 2
+    wait_for_scheduler()
+
+    assert runs == [1, 2]
+    assert effect
+
+
+def test_batch_subscriber_error_does_not_mask_body_error():
+    """The body's exception wins over one raised by a flushed subscriber."""
+    sig = Signal(0)
+
+    def explode():
+        raise ValueError("subscriber")
+
+    sig.subscribe(explode)
+
+    with pytest.raises(RuntimeError), batch():
+        sig.value = 1
+        raise RuntimeError("body")
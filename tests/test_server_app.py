@@ -41,6 +41,208 @@ def test_app_serves_html_on_root():
     assert "Hello from Flow!" in response.text
 
 
+def test_app_wraps_rendered_html_in_page_envelope():
+    """Rendered HTML sits inside the root div, followed by the client script."""
+    app = create_app(SimpleApp)
+    client = TestClient(app)
+
+    text = client.get("/").text
+
+    assert text.startswith("<!DOCTYPE html>")
+    root_start = text.index('<div id="wtfui-root"><div')
+    assert text.index("Hello from Flow!") > root_start
+    assert text.rstrip().endswith("</html>")
+    assert re.search(r'<script src="/_wtfui/client\.js\?v=[0-9a-f]{16}" defer></script>', text)
+    assert "new WebSocket" not in text
+
+
+def test_client_script_served_as_cacheable_asset():
+    """The client script is served once with immutable caching and an ETag."""
+    client = TestClient(create_app(SimpleApp))
+
+    response = client.get("/_wtfui/client.js", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert "javascript" in response.headers["content-type"]
+    assert "immutable" in response.headers["cache-control"]
+    assert "content-encoding" not in response.headers
+    assert "new WebSocket" in response.text
+
+    revalidated = client.get(
+        "/_wtfui/client.js", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+
+
+def test_client_script_gzipped_when_accepted():
+    """Gzip-capable clients get the precompressed script."""
+    client = TestClient(create_app(SimpleApp))
+
+    response = client.get("/_wtfui/client.js", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "new WebSocket" in response.text
+
+
+def test_index_revalidates_with_etag():
+    """The page carries an ETag; a matching If-None-Match gets an empty 304."""
+    client = TestClient(create_app(SimpleApp))
+
+    response = client.get("/")
+    etag = response.headers["etag"]
+
+    assert response.headers["cache-control"] == "no-cache"
+    assert re.fullmatch(r'"[0-9a-f]{16}"', etag)
+
+    cached = client.get("/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+
+def test_index_etag_changes_with_the_page():
+    """A re-render yields a new ETag, so a stale copy is not revalidated."""
+    label = Signal("first")
+
+    @component
+    async def App():
+        with Div() as root:
+            Text(lambda: label.value)
+        return root
+
+    client = TestClient(create_app(App))
+    etag = client.get("/").headers["etag"]
+
+    label.value = "second"
+    response = client.get("/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert "second" in response.text
+    assert response.headers["etag"] != etag
+
+
+def test_index_reuses_render_until_root_changes():
+    """Repeated page loads reuse the memoized render of the cached root."""
+    from wtfui.web.renderer import HTMLRenderer
+
+    class CountingRenderer(HTMLRenderer):
+        calls = 0
+
+        def render(self, element):
+            CountingRenderer.calls += 1
+            return super().render(element)
+
+    app = create_app(SimpleApp, renderer=CountingRenderer())
+    client = TestClient(app)
+
+    first = client.get("/").text
+    second = client.get("/").text
+
+    assert first == second
+    assert CountingRenderer.calls == 1
+
+
+def test_websocket_root_frames_use_the_custom_render():
+    """A renderer overriding render() produces the page and every root frame."""
+    from wtfui.web.renderer import HTMLRenderer
+
+    class MarkedRenderer(HTMLRenderer):
+        def render(self, element):
+            return "<!-- marked -->" + super().render(element)
+
+    client = TestClient(create_app(SimpleApp, renderer=MarkedRenderer()))
+
+    assert "<!-- marked -->" in client.get("/").text
+    with client.websocket_connect("/ws") as websocket:
+        frame = websocket.receive_json()
+    assert frame["op"] == "update_root"
+    assert frame["html"].startswith("<!-- marked -->")
+
+
+def test_index_rerenders_after_plain_attribute_write():
+    """Attribute writes on the cached root's elements invalidate the page and ETag."""
+    buttons = []
+
+    @component
+    async def ButtonApp():
+        with Div() as root:
+            buttons.append(Button("Old"))
+        return root
+
+    client = TestClient(create_app(ButtonApp))
+
+    first = client.get("/")
+    assert ">Old</button>" in first.text
+
+    buttons[0].label = "New"
+    second = client.get("/", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 200
+    assert ">New</button>" in second.text
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_index_rerenders_when_signal_read_during_render_changes():
+    """Signal reads made while rendering invalidate the memoized page."""
+    label = Signal("before")
+
+    @component
+    async def LabelApp():
+        with Div() as root:
+            Text(lambda: f"Label: {label.value}")
+        return root
+
+    app = create_app(LabelApp)
+    client = TestClient(app)
+
+    assert "Label: before" in client.get("/").text
+    label.value = "after"
+    assert "Label: after" in client.get("/").text
+
+
+def test_index_rerenders_when_bound_input_changes():
+    """Bound inputs have no effect of their own; the render memo tracks the signal."""
+    query = Signal("old")
+
+    @component
+    async def SearchApp():
+        with Div() as root:
+            Input(bind=query)
+        return root
+
+    app = create_app(SearchApp)
+    client = TestClient(app)
+
+    assert 'value="old"' in client.get("/").text
+    query.value = "new"
+    assert 'value="new"' in client.get("/").text
+
+
+async def test_concurrent_first_loads_wait_for_one_root_render():
+    """Page loads racing the first render wait on the event loop and share its root."""
+    import asyncio
+
+    import httpx
+
+    builds = []
+
+    @component
+    async def SlowApp():
+        builds.append(None)
+        await asyncio.sleep(0.01)  # Yields while the render lock is held
+        with Div() as root:
+            Text("ready")
+        return root
+
+    transport = httpx.ASGITransport(app=create_app(SlowApp))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first, second = await asyncio.gather(client.get("/"), client.get("/"))
+
+    assert first.status_code == second.status_code == 200
+    assert "ready" in first.text and "ready" in second.text
+    assert len(builds) == 1
+
+
 def test_app_has_websocket_endpoint():
     """App exposes /ws WebSocket endpoint."""
     app = create_app(SimpleApp)
@@ -596,6 +798,219 @@ def test_websocket_input_updates_signal():
         # The signal is updated but no response is sent
 
 
+def _button_target(html):
+    """The (id, data-key) pair of the first button in rendered HTML."""
+    match = re.search(r'<button id="wtfui-(\d+)" data-key="([^"]+)"', html)
+    assert match, "Expected a keyed button in HTML"
+    return int(match.group(1)), match.group(2)
+
+
+def test_websocket_click_sends_only_changed_subtree():
+    """After a click only the subtree whose output changed is re-sent."""
+    count = Signal(0)
+
+    @component
+    async def Counter():
+        with Div(cls="container") as root:
+            Text(f"Count: {count.value}")
+            Button("Up", on_click=lambda: setattr(count, "value", count.value + 1))
+        return root
+
+    client = TestClient(create_app(Counter))
+    with client.websocket_connect("/ws") as websocket:
+        initial = websocket.receive_json()
+        assert initial["op"] == "update_root"
+        button_id, button_key = _button_target(initial["html"])
+
+        websocket.send_json({"type": "click", "target_id": button_id, "target_key": button_key})
+        patch = websocket.receive_json()
+
+        assert patch == {
+            "op": "update_prop",
+            "target_key": "root:Div:0:Text",
+            "prop_name": "content",
+            "value": "Count: 1",
+        }
+
+        # The button was not re-sent, so its DOM id is from the first render;
+        # the stable key still routes the click to the current handler.
+        websocket.send_json({"type": "click", "target_id": button_id, "target_key": button_key})
+        assert websocket.receive_json()["value"] == "Count: 2"
+
+
+def test_websocket_click_replaces_subtree_whose_markup_changed():
+    """A subtree that changed more than its text is re-rendered and replaced."""
+    count = Signal(0)
+
+    @component
+    async def Counter():
+        with Div() as root:
+            Text(f"Count: {count.value}", cls="odd" if count.value % 2 else "even")
+            Button("Up", on_click=lambda: setattr(count, "value", count.value + 1))
+        return root
+
+    client = TestClient(create_app(Counter))
+    with client.websocket_connect("/ws") as websocket:
+        button_id, button_key = _button_target(websocket.receive_json()["html"])
+
+        websocket.send_json({"type": "click", "target_id": button_id, "target_key": button_key})
+        patch = websocket.receive_json()
+
+    assert patch["op"] == "replace"
+    assert patch["target_key"] == "root:Div:0:Text"
+    assert patch["html"].startswith("<span") and "Count: 1" in patch["html"]
+    assert 'class="odd"' in patch["html"]
+    assert "<button" not in patch["html"]
+
+
+def test_websocket_click_batches_several_changes_into_one_frame():
+    """Every subtree changed by one click arrives in a single batch frame."""
+    count = Signal(0)
+
+    @component
+    async def Counter():
+        with Div() as root:
+            Text(f"Count: {count.value}")
+            Div(cls="odd" if count.value % 2 else "even")
+            Button("Up", on_click=lambda: setattr(count, "value", count.value + 1))
+        return root
+
+    client = TestClient(create_app(Counter))
+    with client.websocket_connect("/ws") as websocket:
+        button_id, button_key = _button_target(websocket.receive_json()["html"])
+
+        websocket.send_json({"type": "click", "target_id": button_id, "target_key": button_key})
+        patch = websocket.receive_json()
+
+    assert patch["op"] == "batch"
+    assert sorted(inner["op"] for inner in patch["patches"]) == ["replace", "update_prop"]
+    replaced = next(inner for inner in patch["patches"] if inner["op"] == "replace")
+    assert 'class="odd"' in replaced["html"]
+
+
+def test_websocket_root_change_falls_back_to_update_root():
+    """When the root element itself changes the whole tree is re-sent."""
+    dark = Signal(False)
+
+    @component
+    async def Themed():
+        with Div(cls="dark" if dark.value else "light") as root:
+            Button("Toggle", on_click=lambda: setattr(dark, "value", not dark.value))
+        return root
+
+    client = TestClient(create_app(Themed))
+    with client.websocket_connect("/ws") as websocket:
+        button_id, button_key = _button_target(websocket.receive_json()["html"])
+
+        websocket.send_json({"type": "click", "target_id": button_id, "target_key": button_key})
+        patch = websocket.receive_json()
+
+    assert patch["op"] == "update_root"
+    assert 'class="dark"' in patch["html"]
+
+
+def test_changed_subtrees_keeps_dom_ids_of_unchanged_nodes():
+    """Unchanged nodes inherit the DOM id they were first sent with."""
+    from wtfui.core.protocol import RenderNode
+    from wtfui.web.server.app import _changed_subtrees
+
+    def tree(text, ids):
+        return RenderNode(
+            tag="Div",
+            element_id=ids[0],
+            element_key="root",
+            children=[
+                RenderNode(tag="Text", element_id=ids[1], element_key="a", text_content=text),
+                RenderNode(
+                    tag="Button", element_id=ids[2], element_key="b", props={"on_click": ids}
+                ),
+            ],
+        )
+
+    old = tree("one", (1, 2, 3))
+    new = tree("two", (4, 5, 6))
+
+    changed = _changed_subtrees(old, new)
+
+    assert [(o.element_id, n.element_id) for o, n in changed] == [(2, 5)]
+    assert new.element_id == 1
+    assert new.children[1].element_id == 3
+    assert _changed_subtrees(old, RenderNode(tag="Span", element_id=7)) is None
+
+
+def test_websocket_update_renders_only_the_changed_subtree():
+    """Unchanged rows are never re-rendered after the first push, however many there are."""
+    from wtfui.web.renderer import HTMLRenderer
+
+    class RecordingRenderer(HTMLRenderer):
+        def __init__(self):
+            super().__init__()
+            self.rendered = []
+
+        def render_node(self, node):
+            self.rendered.append(node.element_key)
+            return super().render_node(node)
+
+    count = Signal(0)
+
+    @component
+    async def Table():
+        with Div() as root:
+            Text(f"Count: {count.value}", cls="odd" if count.value % 2 else "even")
+            Button("Up", on_click=lambda: setattr(count, "value", count.value + 1))
+            for i in range(200):
+                with Div():
+                    Text(f"row {i}")
+                    Button("Edit")
+        return root
+
+    renderer = RecordingRenderer()
+    client = TestClient(create_app(Table, renderer=renderer))
+    with client.websocket_connect("/ws") as websocket:
+        button_id, button_key = _button_target(websocket.receive_json()["html"])
+        renderer.rendered.clear()
+
+        websocket.send_json({"type": "click", "target_id": button_id, "target_key": button_key})
+        assert websocket.receive_json()["op"] == "replace"
+
+    assert renderer.rendered == ["root:Div:0:Text"]
+
+
+def test_text_only_change_requires_a_keyed_leaf_with_nothing_else_changed():
+    """Only keyed text leaves that changed nothing but their text patch in place."""
+    from wtfui.core.protocol import RenderNode
+    from wtfui.web.server.app import _text_only_change
+
+    def leaf(text, key="a", **props):
+        return RenderNode(tag="Text", element_id=1, element_key=key, text_content=text, props=props)
+
+    assert _text_only_change(leaf("one"), leaf("two"))
+    assert not _text_only_change(leaf("one", key=None), leaf("two", key=None))
+    assert not _text_only_change(leaf("one"), leaf("two", cls="x"))
+    assert not _text_only_change(leaf("one"), leaf(""))
+
+
+def test_changed_subtrees_ignores_spinner_frames():
+    """A spinner that only advanced its frame is animated client-side, not patched."""
+    from wtfui.tui.builder import RenderTreeBuilder
+    from wtfui.ui import Div
+    from wtfui.ui.spinner import Spinner
+    from wtfui.web.server.app import _changed_subtrees
+
+    with Div() as root:
+        spinner = Spinner(frames=["A", "B"])
+    old = RenderTreeBuilder().build(root)
+    spinner.advance()
+    new = RenderTreeBuilder().build(root)
+
+    assert new.children[0].text_content == "B"
+    assert _changed_subtrees(old, new) == []
+
+    spinner.frames = ["X", "Y"]
+    spinner.props["frames"] = spinner.frames
+    assert len(_changed_subtrees(old, RenderTreeBuilder().build(root))) == 1
+
+
 # RPC Endpoint Tests
 
 
@@ -691,6 +1106,28 @@ def test_rpc_endpoint_with_complex_return():
     assert data["null"] is None
 
 
+def test_rpc_endpoint_returns_encoder_bytes_verbatim():
+    """RPC responses are the encoder's bytes, not re-serialized by JSONResponse."""
+    from decimal import Decimal
+
+    from wtfui.web.rpc.encoder import wtfui_json_dumpb
+
+    result = {"z": Decimal("1.10"), "a": [1, {"b": None}]}
+
+    @rpc
+    async def raw_function() -> dict[str, Any]:
+        return result
+
+    app = create_app(SimpleApp)
+    client = TestClient(app)
+
+    response = client.post("/api/rpc/raw_function", json={})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == wtfui_json_dumpb(result)
+
+
 def test_rpc_endpoint_empty_body():
     """RPC endpoint handles requests with no JSON body."""
 
@@ -707,3 +1144,184 @@ def test_rpc_endpoint_empty_body():
 
     assert response.status_code == 200
     assert response.json() == {"status": "success"}
+
+
+@pytest.mark.parametrize("batch_size", [50, 1])
+def test_click_broadcasts_to_every_other_session(monkeypatch, batch_size):
+    """A click re-renders every other connected session, across broadcast batches."""
+    from wtfui.web.server import app as server_app
+
+    monkeypatch.setattr(server_app, "BROADCAST_BATCH_SIZE", batch_size)
+    count = Signal(0)
+
+    @component
+    async def Counter():
+        with Div() as root:
+            Text(f"Count: {count.value}")
+            Button("Up", on_click=lambda: setattr(count, "value", count.value + 1))
+        return root
+
+    # One shared portal puts every connection on the same event loop, as in production.
+    with (
+        TestClient(create_app(Counter)) as client,
+        client.websocket_connect("/ws") as clicker,
+        client.websocket_connect("/ws") as watcher_a,
+        client.websocket_connect("/ws") as watcher_b,
+    ):
+        initial = clicker.receive_json()
+        watcher_a.receive_json()
+        watcher_b.receive_json()
+        button_id = re.findall(r'<button[^>]*id="(wtfui-\d+)"', initial["html"])[0]
+
+        clicker.send_json({"type": "click", "target_id": button_id})
+
+        assert clicker.receive_json()["value"] == "Count: 1"
+        assert watcher_a.receive_json()["value"] == "Count: 1"
+        assert watcher_b.receive_json()["value"] == "Count: 1"
+
+
+async def test_websocket_coalesces_buffered_input_bursts():
+    """Keystrokes that arrive together run the handler and re-render once."""
+    import json
+
+    from wtfui.web.server.app import RenderTreeBuilder
+
+    calls = []
+    text = Signal("")
+
+    def on_change(value):
+        calls.append(value)
+        text.value = value
+
+    @component
+    async def Form():
+        with Div() as root:
+            Input(on_change=on_change)
+            Text(text.value or "empty")
+        return root
+
+    app = create_app(Form)
+    # Every frame is already buffered, so the reader drains them in one go.
+    tree = RenderTreeBuilder().build(await Form())
+    key = tree.children[0].element_key
+    keystrokes = [
+        {
+            "type": "websocket.receive",
+            "text": json.dumps(
+                {"type": "input", "target_id": 1, "target_key": key, "value": value}
+            ),
+        }
+        for value in ("h", "he", "hel")
+    ]
+    messages = [
+        {"type": "websocket.connect"},
+        *keystrokes,
+        {"type": "websocket.disconnect", "code": 1000},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "websocket", "path": "/ws", "headers": [], "query_string": b""}
+    await app(scope, receive, send)
+
+    assert calls == ["hel"]
+    frames = [message for message in sent if message["type"] == "websocket.send"]
+    assert len(frames) == 2  # The initial render and one update
+    assert json.loads(frames[1]["text"])["value"] == "hel"
+
+
+async def test_broadcast_push_waits_for_the_sessions_own_frame():
+    """A broadcast never diffs against a tree whose frame has not been sent yet."""
+    import asyncio
+    import json
+
+    from wtfui.web.server.app import RenderTreeBuilder
+
+    count = Signal(0)
+
+    @component
+    async def Counter():
+        with Div() as root:
+            Text(f"Count: {count.value}")
+            Button("Up", on_click=lambda: setattr(count, "value", count.value + 1))
+        return root
+
+    app = create_app(Counter)
+    key = RenderTreeBuilder().build(await Counter()).children[1].element_key
+    scope = {"type": "websocket", "path": "/ws", "headers": [], "query_string": b""}
+
+    # The watcher's first frame stalls on the wire until the gate opens.
+    stalled = asyncio.Event()
+    gate = asyncio.Event()
+    closed = asyncio.Event()
+    watcher_inbox = [{"type": "websocket.connect"}]
+    watcher_frames = []
+    watcher_sends = 0
+
+    async def watcher_receive():
+        if watcher_inbox:
+            return watcher_inbox.pop(0)
+        await closed.wait()
+        return {"type": "websocket.disconnect", "code": 1000}
+
+    async def watcher_send(message):
+        nonlocal watcher_sends
+        if message["type"] != "websocket.send":
+            return
+        watcher_sends += 1
+        if watcher_sends == 1:
+            stalled.set()
+            await gate.wait()
+        watcher_frames.append(json.loads(message["text"]))
+
+    clicker_inbox = [
+        {"type": "websocket.connect"},
+        {
+            "type": "websocket.receive",
+            "text": json.dumps({"type": "click", "target_id": 1, "target_key": key}),
+        },
+        {"type": "websocket.disconnect", "code": 1000},
+    ]
+
+    async def clicker_receive():
+        return clicker_inbox.pop(0)
+
+    async def clicker_send(message):
+        pass
+
+    watcher = asyncio.create_task(app(scope, watcher_receive, watcher_send))
+    await stalled.wait()
+
+    clicker = asyncio.create_task(app(scope, clicker_receive, clicker_send))
+    for _ in range(50):
+        await asyncio.sleep(0)
+    gate.set()
+    await clicker
+    closed.set()
+    await watcher
+
+    assert [frame["op"] for frame in watcher_frames] == ["update_root", "update_prop"]
+    assert watcher_frames[1]["value"] == "Count: 1"
+
+
+async def test_event_dispatch_reports_render_and_broadcast():
+    """Clicks re-render and broadcast; input re-renders only; no handler means no work."""
+    from wtfui.web.server.app import _EVENT_DISPATCH, SessionState
+
+    values = []
+    with Div() as root:
+        field = Input(on_change=values.append)
+        button = Button("Go", on_click=lambda: values.append("clicked"))
+        label = Text("idle")
+    session = SessionState()
+    session.registry.register_tree(root)
+
+    assert await _EVENT_DISPATCH["input"](session, id(field), {"value": "x"}) == (True, False)
+    assert await _EVENT_DISPATCH["click"](session, id(button), {}) == (True, True)
+    assert await _EVENT_DISPATCH["click"](session, id(label), {}) == (False, False)
+    assert values == ["x", "clicked"]
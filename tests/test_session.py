@@ -2,8 +2,13 @@
 """Tests for LiveSession - WebSocket-based live rendering manager."""
 
 import asyncio
+import contextlib
+import threading
+from collections import deque
 from unittest.mock import AsyncMock
 
+import pytest
+
 from wtfui.ui import Div, Text
 from wtfui.web.renderer import HTMLRenderer
 from wtfui.web.server.session import LiveSession
@@ -18,13 +23,13 @@ def test_session_stores_root_component():
     assert session.root_component is root
 
 
-def test_session_has_update_queue():
-    """LiveSession has an asyncio queue for updates."""
+def test_session_has_update_buffer():
+    """LiveSession buffers updates in a deque drained by the outgoing loop."""
     mock_ws = AsyncMock()
     session = LiveSession(Div(), mock_ws)
 
-    assert session.queue is not None
-    assert isinstance(session.queue, asyncio.Queue)
+    assert isinstance(session._dirty, deque)
+    assert not session._wake.is_set()
 
 
 def test_session_can_queue_updates():
@@ -35,7 +40,8 @@ def test_session_can_queue_updates():
     node = Text("Updated")
     session.queue_update(node)
 
-    assert not session.queue.empty()
+    assert list(session._dirty) == [node]
+    assert session._wake.is_set()
 
 
 async def test_session_initial_render():
@@ -52,6 +58,8 @@ async def test_session_initial_render():
     sent_html = mock_ws.send_text.call_args[0][0]
     assert "Hello" in sent_html
     assert "root" in sent_html
+    assert sent_html.lstrip().startswith("<!DOCTYPE html>")
+    assert sent_html.rstrip().endswith("</html>")
 
 
 def test_session_uses_renderer_protocol():
@@ -64,3 +72,210 @@ def test_session_uses_renderer_protocol():
     # Session should use HTMLRenderer internally
     assert session.renderer is not None
     assert isinstance(session.renderer, HTMLRenderer)
+
+
+async def _drain_outgoing(session, mock_ws, expected_sends):
+    """Run the outgoing loop until it has sent the expected number of frames."""
+    session._running = True
+    task = asyncio.create_task(session._outgoing_loop())
+    for _ in range(200):
+        if mock_ws.send_text.await_count >= expected_sends:
+            break
+        await asyncio.sleep(0.005)
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+async def test_outgoing_loop_renders_single_update_inline():
+    """A single queued update is rendered and sent as a replace patch."""
+    import json
+
+    mock_ws = AsyncMock()
+    session = LiveSession(Div(), mock_ws)
+    node = Text("Solo")
+    session.queue_update(node)
+
+    await _drain_outgoing(session, mock_ws, expected_sends=1)
+
+    patch = json.loads(mock_ws.send_text.await_args_list[0].args[0])
+    assert patch["op"] == "replace"
+    assert patch["target_id"] == f"wtfui-{id(node)}"
+    assert "Solo" in patch["html"]
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+async def test_outgoing_loop_batches_pending_updates_in_order(parallel, monkeypatch):
+    """Updates queued together go out as one replace_batch frame in queue order."""
+    import json
+
+    from wtfui.web.server import session as session_module
+
+    monkeypatch.setattr(session_module, "_PARALLEL_RENDER", parallel)
+    mock_ws = AsyncMock()
+    session = LiveSession(Div(), mock_ws)
+    nodes = [Text(f"Item {i}") for i in range(5)]
+    for node in nodes:
+        session.queue_update(node)
+
+    await _drain_outgoing(session, mock_ws, expected_sends=1)
+
+    assert mock_ws.send_text.await_count == 1
+    frame = json.loads(mock_ws.send_text.await_args.args[0])
+    assert frame["op"] == "replace_batch"
+    assert [target_id for target_id, _ in frame["patches"]] == [f"wtfui-{id(n)}" for n in nodes]
+    assert all(f"Item {i}" in html for i, (_, html) in enumerate(frame["patches"]))
+
+
+async def test_outgoing_loop_dedupes_repeated_updates():
+    """A node queued several times in one burst is rendered once."""
+    import json
+
+    mock_ws = AsyncMock()
+    session = LiveSession(Div(), mock_ws)
+    first, second = Text("A"), Text("B")
+    for node in (first, second, first, first):
+        session.queue_update(node)
+
+    await _drain_outgoing(session, mock_ws, expected_sends=1)
+
+    frame = json.loads(mock_ws.send_text.await_args.args[0])
+    assert [target_id for target_id, _ in frame["patches"]] == [
+        f"wtfui-{id(first)}",
+        f"wtfui-{id(second)}",
+    ]
+
+
+async def test_queue_update_from_another_thread_wakes_outgoing_loop():
+    """Updates queued off the event loop thread are still delivered."""
+    import json
+
+    mock_ws = AsyncMock()
+    session = LiveSession(Div(), mock_ws)
+    session._running = True
+    task = asyncio.create_task(session._outgoing_loop())
+    await asyncio.sleep(0)
+
+    node = Text("Threaded")
+    worker = threading.Thread(target=session.queue_update, args=(node,))
+    worker.start()
+    worker.join()
+
+    for _ in range(200):
+        if mock_ws.send_text.await_count:
+            break
+        await asyncio.sleep(0.005)
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+    patch = json.loads(mock_ws.send_text.await_args.args[0])
+    assert patch["target_id"] == f"wtfui-{id(node)}"
+
+
+async def test_queue_update_enqueues_a_dirty_node_once():
+    """A node queued repeatedly before the drain is only buffered once."""
+    mock_ws = AsyncMock()
+    session = LiveSession(Div(), mock_ws)
+    node = Text("Busy")
+
+    for _ in range(100):
+        session.queue_update(node)
+    assert list(session._dirty) == [node]
+
+    await _drain_outgoing(session, mock_ws, expected_sends=1)
+    assert mock_ws.send_text.await_count == 1
+    assert session._queued == set()
+
+    session.queue_update(node)
+    assert list(session._dirty) == [node]
+
+
+def test_queue_update_dedupes_per_session():
+    """A node queued in one session is still queued by another session."""
+    node = Text("Shared")
+    first = LiveSession(Div(), AsyncMock())
+    second = LiveSession(Div(), AsyncMock())
+
+    first.queue_update(node)
+    second.queue_update(node)
+
+    assert list(first._dirty) == [node]
+    assert list(second._dirty) == [node]
+
+
+class CountingRenderer(HTMLRenderer):
+    """HTMLRenderer that records how many subtrees it rendered."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def render(self, element):
+        self.calls += 1
+        return super().render(element)
+
+
+def test_render_reuses_html_until_the_node_changes():
+    """Unchanged nodes reuse their HTML; signal writes and style edits re-render."""
+    from wtfui.core.signal import Signal
+
+    renderer = CountingRenderer()
+    session = LiveSession(Div(), AsyncMock(), renderer=renderer)
+    label = Signal("one")
+    node = Text(label)
+
+    first = session._render(node)
+    assert session._render(node) is first
+    assert renderer.calls == 1
+
+    label.value = "two"
+    assert "two" in session._render(node)
+    assert renderer.calls == 2
+
+    node.set_style(width=10)
+    session._render(node)
+    assert renderer.calls == 3
+
+    session._clear_render_cache()
+    assert session._render_cache == {}
+
+
+async def test_queue_update_resends_plain_attribute_changes():
+    """Label and input value writes reach the client on the next queued update."""
+    import json
+
+    from wtfui.ui import Button, Input
+
+    mock_ws = AsyncMock()
+    session = LiveSession(Div(), mock_ws)
+    with Div():
+        button = Button("Old")
+        field = Input()
+
+    session.queue_update(button)
+    session.queue_update(field)
+    await _drain_outgoing(session, mock_ws, expected_sends=1)
+
+    button.label = "New"
+    field._text_value = "typed"
+    session.queue_update(button)
+    session.queue_update(field)
+    await _drain_outgoing(session, mock_ws, expected_sends=2)
+
+    frame = json.loads(mock_ws.send_text.await_args.args[0])
+    htmls = dict(frame["patches"])
+    assert ">New</button>" in htmls[button.dom_id]
+    assert 'value="typed"' in htmls[field.dom_id]
+
+
+def test_render_cache_evicts_oldest_entry(monkeypatch):
+    """The per-session render cache stays within its bound."""
+    from wtfui.web.server import session as session_module
+
+    monkeypatch.setattr(session_module, "_RENDER_CACHE_SIZE", 2)
+    session = LiveSession(Div(), AsyncMock())
+    nodes = [Text(str(i)) for i in range(3)]
+    for node in nodes:
+        session._render(node)
+
+    assert [entry[0] for entry in session._render_cache.values()] == nodes[1:]
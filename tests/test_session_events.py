@@ -1,11 +1,12 @@
 """Tests for LiveSession event handling."""
 
+import json
 from unittest.mock import AsyncMock
 
 import pytest
 
 from wtfui.core.signal import Signal
-from wtfui.ui import Button, Div
+from wtfui.ui import Button, Div, Input
 from wtfui.web.server.session import LiveSession
 
 
@@ -34,6 +35,30 @@ async def test_session_routes_click_events():
     assert handler_called == ["clicked"]
 
 
+@pytest.mark.asyncio
+async def test_session_routes_numeric_target_ids():
+    """Clients may send the element id as a bare integer."""
+    handler_called = []
+
+    with Div() as root:
+        btn = Button("Click me", on_click=lambda: handler_called.append("clicked"))
+
+    session = LiveSession(root, AsyncMock())
+
+    await session._handle_event({"type": "click", "target_id": id(btn)})
+
+    assert handler_called == ["clicked"]
+
+
+@pytest.mark.asyncio
+async def test_session_ignores_malformed_target_ids():
+    """Unparseable or wrongly typed target ids are dropped."""
+    session = LiveSession(Div(), AsyncMock())
+
+    for target_id in ("wtfui-abc", "other-1", None, 1.5, ["wtfui-1"]):
+        await session._handle_event({"type": "click", "target_id": target_id})
+
+
 @pytest.mark.asyncio
 async def test_session_handles_unknown_element():
     """LiveSession handles events for unknown elements gracefully."""
@@ -170,3 +195,66 @@ async def test_session_input_updates_bound_signal():
     await session._handle_event(event_data)
 
     assert bound_value.value == "updated"
+
+
+def _frames(*events):
+    """ASGI receive messages for the given events, followed by a disconnect."""
+    messages = [{"type": "websocket.receive", "text": json.dumps(e)} for e in events]
+    return [*messages, {"type": "websocket.disconnect", "code": 1000}]
+
+
+@pytest.mark.asyncio
+async def test_incoming_loop_coalesces_buffered_input_bursts():
+    """Buffered input events on one element collapse to the latest value."""
+    calls = []
+
+    with Div() as root:
+        first = Input(on_input=lambda value: calls.append(("first", value)))
+        second = Input(on_input=lambda value: calls.append(("second", value)))
+        btn = Button("Go", on_click=lambda: calls.append(("click", None)))
+
+    mock_ws = AsyncMock()
+    mock_ws.receive.side_effect = _frames(
+        {"type": "input", "target_id": id(first), "value": "h"},
+        {"type": "input", "target_id": id(first), "value": "he"},
+        {"type": "input", "target_id": id(second), "value": "x"},
+        {"type": "input", "target_id": id(first), "value": "hel"},
+        {"type": "input", "target_id": id(first), "value": "hell"},
+        {"type": "click", "target_id": id(btn)},
+        {"type": "click", "target_id": id(btn)},
+        {"type": "input", "target_id": id(first), "value": "hello"},
+    )
+    session = LiveSession(root, mock_ws)
+    session._running = True
+
+    await session._incoming_loop()
+
+    assert calls == [
+        ("first", "he"),
+        ("second", "x"),
+        ("first", "hell"),
+        ("click", None),
+        ("click", None),
+        ("first", "hello"),
+    ]
+    assert session._running is False
+
+
+@pytest.mark.asyncio
+async def test_incoming_loop_stops_when_handler_raises():
+    """A failing handler ends the session like a disconnect does."""
+
+    def boom():
+        raise RuntimeError("boom")
+
+    with Div() as root:
+        btn = Button("Go", on_click=boom)
+
+    mock_ws = AsyncMock()
+    mock_ws.receive.side_effect = _frames({"type": "click", "target_id": id(btn)})
+    session = LiveSession(root, mock_ws)
+    session._running = True
+
+    await session._incoming_loop()
+
+    assert session._running is False
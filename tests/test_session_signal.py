@@ -86,3 +86,23 @@ class TestSessionSignal:
         assert "SessionSignal" in repr(sig)
         assert "hello" in repr(sig)
         assert "myname" in repr(sig)
+
+    def test_session_signal_repr_does_not_take_the_lock(self) -> None:
+        """repr works while the signal's lock is held (e.g. from a subscriber)."""
+        sig = SessionSignal("hello", name="locked")
+        with sig._lock:
+            assert repr(sig) == "SessionSignal('hello', name='locked')"
+
+    def test_session_signal_read_does_not_take_the_lock(self) -> None:
+        """Reads (including dependency tracking) work while a writer holds the lock."""
+        from wtfui.core.computed import Computed
+
+        sig = SessionSignal(3, name="lockfree-read")
+        doubled = Computed(lambda: sig.value * 2)
+
+        with sig._lock:
+            assert sig.value == 3
+            assert doubled() == 6
+
+        sig.value = 4
+        assert doubled() == 8
@@ -30,6 +30,24 @@ def test_signal_no_notify_on_same_value():
     assert notifications == []
 
 
+def test_signal_same_object_write_skips_equality():
+    """Re-setting the identical object is a no-op that never calls __eq__."""
+
+    class NoCompare:
+        def __eq__(self, other):
+            raise AssertionError("__eq__ should not be called")
+
+        __hash__ = object.__hash__
+
+    notifications: list[str] = []
+    value = NoCompare()
+    sig = Signal(value)
+    sig.subscribe(lambda: notifications.append("called"))
+
+    sig.value = value
+    assert notifications == []
+
+
 def test_signal_notifies_on_change():
     """Signal notifies subscribers when value changes."""
     notifications: list[str] = []
@@ -190,3 +208,57 @@ def test_signal_no_nested_lock_deadlock():
 
     assert not deadlock_detected.is_set(), "Potential deadlock from nested locking"
     assert len(results) == 400
+
+
+def test_signal_concurrent_tracking_never_misses_final_write():
+    """Computeds read while a writer runs always end up with the final value."""
+    from wtfui.core.computed import Computed
+
+    sig = Signal(0)
+    computeds = [Computed(lambda: sig.value) for _ in range(50)]
+
+    def reader(chunk):
+        for computed in chunk:
+            computed()
+
+    def writer():
+        for i in range(1, 501):
+            sig.value = i
+
+    threads = [threading.Thread(target=reader, args=(computeds[i::4],)) for i in range(4)]
+    threads.append(threading.Thread(target=writer))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(computed() == 500 for computed in computeds)
+
+
+def test_signal_concurrent_subscribe_and_unsubscribe():
+    """Concurrent subscribe/unsubscribe leaves exactly the surviving callbacks."""
+    sig = Signal(0)
+    keep: list[list[int]] = [[] for _ in range(8)]
+
+    def churn(n):
+        for i in range(200):
+            unsubscribe = sig.subscribe(lambda: None)
+            unsubscribe()
+            sig.subscribe(lambda n=n, i=i: keep[n].append(i))
+
+    threads = [threading.Thread(target=churn, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    sig.value = 1
+
+    assert all(sorted(hits) == list(range(200)) for hits in keep)
+
+
+def test_signal_repr_does_not_take_the_lock():
+    """repr works while the signal's lock is held (e.g. from a subscriber)."""
+    sig = Signal([1, 2])
+    with sig._lock:
+        assert repr(sig) == "Signal([1, 2])"
@@ -109,6 +109,14 @@ class TestStyle:
             raised = True
         assert raised, "Style should be frozen/immutable"
 
+    def test_style_is_slotted(self) -> None:
+        """Style stores fields in slots, so renderers read them without a __dict__."""
+        from wtfui.core.style import Style
+
+        s = Style(bg="white")
+        assert not hasattr(s, "__dict__")
+        assert "bg" in Style.__slots__
+
 
 class TestColors:
     """Test Colors namespace."""
@@ -64,3 +64,36 @@ class TestGeometryClassStripping:
         assert "height" in GEOMETRY_CLASS_PATTERNS
         assert "flex_direction" in GEOMETRY_CLASS_PATTERNS
         assert "gap" in GEOMETRY_CLASS_PATTERNS
+
+    def test_strip_results_are_memoized_per_flags(self, monkeypatch):
+        """Repeated class/flag combinations reuse the first result."""
+        from wtfui.tui.layout import style_resolver
+
+        calls = []
+        original = style_resolver._strip
+
+        def spy(cls, flags):
+            calls.append((cls, flags))
+            return original(cls, flags)
+
+        monkeypatch.setattr(style_resolver, "_strip", spy)
+        monkeypatch.setattr(style_resolver, "_strip_cache", {})
+
+        cls = "w-10 h-10 p-2"
+        assert strip_geometry_classes(cls, has_width=True) == "h-10 p-2"
+        assert strip_geometry_classes(cls, has_width=True) == "h-10 p-2"
+        assert strip_geometry_classes(cls, has_height=True) == "w-10 p-2"
+
+        assert len(calls) == 2
+
+    def test_strip_cache_is_bounded(self, monkeypatch):
+        """The memo is dropped once it reaches its size bound."""
+        from wtfui.tui.layout import style_resolver
+
+        monkeypatch.setattr(style_resolver, "_STRIP_CACHE_SIZE", 2)
+        monkeypatch.setattr(style_resolver, "_strip_cache", {})
+
+        for i in range(5):
+            strip_geometry_classes(f"w-{i}", has_width=True)
+
+        assert len(style_resolver._strip_cache) <= 2
@@ -73,3 +73,26 @@ def test_props_support_future_style_architecture():
     div3 = Div(cls="container", padding=4)
     assert "cls" in div3.props
     assert "padding" in div3.props
+
+
+def test_builtin_elements_have_no_instance_dict():
+    """Every built-in element is fully slotted, so instances carry no __dict__."""
+    from wtfui.core.signal import Signal
+    from wtfui.ui import Box, Card, Flex, For, Spinner, Window
+
+    elements = [
+        Div(),
+        VStack(),
+        HStack(),
+        Card(title="T"),
+        Text("t"),
+        Button("b"),
+        Input(bind=Signal("")),
+        Window(),
+        Spinner(),
+        Flex(),
+        Box(),
+        For(each=Signal([]), render=lambda item, index: None),
+    ]
+
+    assert [type(e).__name__ for e in elements if hasattr(e, "__dict__")] == []
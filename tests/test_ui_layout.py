@@ -86,3 +86,17 @@ class TestBoxElement:
 
         assert style.width.resolve(200) == 100
         assert style.height.resolve(100) == 100
+
+
+class TestLayoutElementStorage:
+    def test_flex_and_box_keep_layout_values_only_in_props(self):
+        """Layout kwargs live in props; the elements carry no per-instance __dict__."""
+        flex = Flex(direction="column", wrap="wrap", gap=4)
+        box = Box(width=10, flex_basis="50%")
+
+        assert not hasattr(flex, "__dict__")
+        assert not hasattr(box, "__dict__")
+        assert flex.props["flex_direction"] == "column"
+        assert flex.props["flex_wrap"] == "wrap"
+        assert flex.props["gap"] == 4
+        assert box.props["flex_basis"] == "50%"
@@ -2,7 +2,7 @@
 """Tests for Spinner UI component."""
 
 from wtfui.tui import RenderTreeBuilder
-from wtfui.ui.spinner import BRAILLE_FRAMES, DOT_FRAMES, Spinner
+from wtfui.ui.spinner import BRAILLE_FRAMES, DOT_FRAMES, LINE_FRAMES, Spinner
 
 
 def test_spinner_has_default_frames():
@@ -23,6 +23,15 @@ def test_spinner_dot_frames():
     assert len(DOT_FRAMES) > 0
 
 
+def test_builtin_frame_sets_are_shared_tuples():
+    """Built-in frame sets are immutable and shared by default spinners."""
+    for frames in (BRAILLE_FRAMES, DOT_FRAMES, LINE_FRAMES):
+        assert isinstance(frames, tuple)
+
+    assert Spinner().frames is BRAILLE_FRAMES
+    assert Spinner().current_frame is BRAILLE_FRAMES[0]
+
+
 def test_spinner_current_frame():
     """Spinner tracks current frame index."""
     spinner = Spinner()
@@ -45,6 +54,21 @@ def test_spinner_advance_wraps():
     assert 0 <= spinner._frame_idx < 3
 
 
+def test_spinner_advance_bumps_parent_version():
+    """Advancing a spinner marks its ancestors as changed for render caches."""
+    from wtfui.ui import Div
+
+    with Div() as root:
+        spinner = Spinner()
+
+    before = root._version
+    spinner.advance()
+    assert root._version == before + 1
+
+    spinner.reset()
+    assert root._version == before + 2
+
+
 def test_spinner_to_render_node():
     """Spinner produces RenderNode via RenderTreeBuilder."""
     spinner = Spinner()
@@ -70,3 +94,47 @@ def test_spinner_cls_prop():
     node = builder.build(spinner)
 
     assert node.props.get("cls") == "text-blue-500"
+
+
+def test_spinner_render_node_tracks_current_frame():
+    """Built nodes carry the frame selected by advance() and reset()."""
+    spinner = Spinner(frames=["A", "B", "C"])
+    builder = RenderTreeBuilder()
+
+    spinner.advance()
+    spinner.advance()
+    assert builder.build(spinner).text_content == "C"
+
+    spinner.advance()
+    assert builder.build(spinner).text_content == "A"
+
+    spinner.advance()
+    spinner.reset()
+    assert spinner.current_frame == "A"
+    assert builder.build(spinner).text_content == "A"
+
+
+def test_spinner_accepts_empty_frames():
+    """An empty frame list renders nothing instead of failing."""
+    spinner = Spinner(frames=[])
+
+    assert spinner.current_frame == ""
+    spinner.advance()
+    spinner.reset()
+    assert spinner.current_frame == ""
+
+
+def test_spinner_reassigning_frames_resyncs_state():
+    """Setting frames restarts the animation and updates the shipped props."""
+    spinner = Spinner(frames=["A", "B", "C"])
+    spinner.advance()
+    before = spinner._version
+
+    spinner.frames = ["X", "Y"]
+
+    assert spinner.current_frame == "X"
+    assert spinner.props["frames"] == ["X", "Y"]
+    assert spinner._version == before + 1
+
+    spinner.interval_ms = 200
+    assert spinner.props["interval_ms"] == 200